@@ -0,0 +1,43 @@
+"""Scaling benchmark for vtkplotter.parallel.map().
+
+Applies the same chain of filters to many meshes with an increasing number
+of workers, for both the thread and the process backends.
+
+Usage: python bench_parallel.py [nmeshes [resolution]]
+"""
+from __future__ import print_function
+import os, sys, time
+from vtkplotter import Sphere
+import vtkplotter.parallel as parallel
+
+nmeshes = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+res = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+
+
+def process(m):
+    return m.clean().triangulate().decimate(0.5).smoothWSinc()
+
+
+def meshes():
+    return [Sphere(res=res).pos(i, 0, 0) for i in range(nmeshes)]
+
+
+ncores = os.cpu_count()
+nworkers = sorted(set([1, 2, 4, 8, 16, ncores]))
+nworkers = [n for n in nworkers if n <= max(2*ncores, 2)]
+
+print("cores=%d  meshes=%d  points per mesh=%d  vtk releases the GIL: %s"
+      % (ncores, nmeshes, Sphere(res=res).N(), parallel._vtkReleasesGIL()))
+
+t0 = time.time()
+[process(m) for m in meshes()]
+tserial = time.time() - t0
+print("serial loop: %8.3fs" % tserial)
+
+for backend in ["thread", "process"]:
+    for n in nworkers:
+        ms = meshes()
+        t0 = time.time()
+        parallel.map(process, ms, workers=n, backend=backend)
+        dt = time.time() - t0
+        print("%8s  workers=%3d  %8.3fs  speedup: %5.2fx" % (backend, n, dt, tserial / dt))
@@ -0,0 +1,40 @@
+"""Microbenchmark for Plotter.show() with many actors.
+
+Measures the time of the first show(), of repeated show() calls
+on an unchanged scene, and of show() calls after modifying a single actor.
+
+Usage: python bench_show.py [nactors ...]
+"""
+from __future__ import print_function
+import sys, time
+import numpy as np
+from vtkplotter import Plotter, Cube, settings
+
+settings.useDepthPeeling = False
+
+sizes = [int(a) for a in sys.argv[1:]] or [1000, 10000]
+nrep = 20
+
+for n in sizes:
+    vp = Plotter(offscreen=True, size=(300, 300), axes=0, interactive=False)
+    pos = np.random.rand(n, 3) * 100
+    acts = [Cube(p, side=0.5) for p in pos]
+
+    t0 = time.time()
+    vp.show(acts)
+    tfirst = time.time() - t0
+
+    t0 = time.time()
+    for i in range(nrep):
+        vp.show(acts)
+    tsame = (time.time() - t0) / nrep
+
+    t0 = time.time()
+    for i in range(nrep):
+        acts[i].pos(pos[i] + 0.1)
+        vp.show(acts)
+    tmod = (time.time() - t0) / nrep
+
+    print("nactors=%6d  first show: %8.4fs  unchanged: %8.4fs  one modified: %8.4fs"
+          % (n, tfirst, tsame, tmod))
+    vp.close()
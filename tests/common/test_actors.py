@@ -194,6 +194,8 @@ assert np.allclose(sphere.closestPoint(pt),
 print('Test findCellsWithin')
 ics = sphere.findCellsWithin(xbounds=(-0.5, 0.5))
 assert len(ics) == 1404
+ics = sphere.findCellsWithin([[-0.5,0.5, -2,2, -2,2], [5,6, 5,6, 5,6]])
+assert [len(ic) for ic in ics] == [1404, 0]
 
 
 ######################################transformMesh
@@ -248,6 +250,15 @@ assert np.allclose(sphere.normalAt(12), [9.97668684e-01, 1.01513637e-04, 6.82437
 print('Test isInside')
 assert sphere.isInside([0.1,0.2,0.3])
 
+###################################### intersectWithLines
+print('Test intersectWithLines')
+origins = np.random.RandomState(0).randn(50, 3) * 3
+pts1, cids1, dists1 = sphere.intersectWithLines(origins, directions=-origins)
+pts2, cids2, dists2 = sphere.intersectWithLines(origins, directions=-origins, workers=2)
+assert np.all(cids1 >= 0)
+assert np.array_equal(cids1, cids2)
+assert np.allclose(pts1, pts2)
+
 ###################################### intersectWithLine
 print('Test intersectWithLine')
 pts = sphere.intersectWithLine([-2,-2,-2], [2,3,4])
@@ -0,0 +1,12 @@
+from vtkplotter import Sphere
+from vtkplotter.analysis import recoSurface
+
+
+###################################### recoSurface
+print('Test recoSurface tiled without normals')
+pts = Sphere(res=40).points()
+m = recoSurface(pts, dims=40).clean()
+for tiles in [2, 3]:
+    mt = recoSurface(pts, dims=40, tiles=tiles).clean()
+    assert mt.boundaries().N() == 0
+    assert mt.N() == m.N()
@@ -0,0 +1,28 @@
+from vtkplotter import Sphere, settings, clearCache
+from vtkplotter.analysis import volumeFromMesh, recoSurface
+import numpy as np
+import tempfile, os
+
+
+settings.cacheDir = tempfile.mkdtemp()
+s = Sphere(res=12).rotateZ(17).scale(0.9)
+
+###################################### cached volume
+print('Test cached volume')
+v1 = volumeFromMesh(s, dims=(12, 13, 14))
+assert len(os.listdir(settings.cacheDir)) == 1
+v2 = volumeFromMesh(s, dims=(12, 13, 14))
+assert v1 is not v2
+assert np.array_equal(v1.imagedata().GetOrigin(), v2.imagedata().GetOrigin())
+assert np.array_equal(v1.imagedata().GetSpacing(), v2.imagedata().GetSpacing())
+assert np.array_equal(v1.getPointArray(), v2.getPointArray())
+
+###################################### cached mesh
+print('Test cached mesh')
+m1 = recoSurface(s, dims=20)
+m2 = recoSurface(s, dims=20)
+assert np.array_equal(m1.points(), m2.points())
+assert np.array_equal(m1.faces(), m2.faces())
+
+clearCache()
+settings.cacheDir = None
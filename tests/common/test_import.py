@@ -0,0 +1,28 @@
+import subprocess, sys
+
+# Regression guard on the import time of vtkplotter:
+# a bare "import vtkplotter" must not load vtk, matplotlib, scipy or the dolfin glue.
+out = subprocess.run([sys.executable, "-X", "importtime", "-c", "import vtkplotter"],
+                     stderr=subprocess.PIPE, universal_newlines=True).stderr
+
+modules = dict()
+for line in out.splitlines():
+    if not line.startswith("import time:") or "cumulative" in line:
+        continue
+    self_us, cumul_us, name = line[len("import time:"):].split("|")
+    modules[name.strip()] = int(cumul_us)
+
+print('---------------------------------')
+print('import vtkplotter: %.3fs' % (modules["vtkplotter"] / 1e6))
+print('---------------------------------')
+
+for m in ["vtk", "matplotlib", "scipy", "vtkplotter.dolfin",
+          "vtkplotter.plotter", "vtkplotter.shapes"]:
+    assert m not in modules, m + " imported by 'import vtkplotter'"
+
+#####################################
+import vtkplotter
+assert "vtkplotter.shapes" not in sys.modules
+assert vtkplotter.Sphere.__module__ == "vtkplotter.shapes"
+assert "vtkplotter.shapes" in sys.modules
+assert "matplotlib" not in sys.modules
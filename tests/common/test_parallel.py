@@ -0,0 +1,30 @@
+from vtkplotter import Sphere
+import vtkplotter.parallel as parallel
+import numpy as np
+
+
+def shrink(m):
+    return m.clone().scale(0.5)
+
+def fail(m):
+    if m.GetPosition()[0] > 10:
+        raise ValueError("cannot process mesh")
+    return m
+
+
+meshes = [Sphere(res=12).pos(i, 0, 0) for i in range(40)]
+
+###################################### map
+print('Test parallel.map')
+for shared in [True, False]:
+    outs = parallel.map(shrink, meshes, workers=2, backend='process', shared=shared)
+    assert len(outs) == 40
+    assert np.allclose(outs[7].points(), shrink(meshes[7]).points())
+
+###################################### map error
+print('Test parallel.map with an error')
+try:
+    parallel.map(fail, meshes, workers=2, backend='process')
+    assert False
+except ValueError:
+    pass
@@ -0,0 +1,21 @@
+from vtkplotter import Plotter, Sphere
+
+
+vp = Plotter(offscreen=True, size=(300, 300), axes=0, interactive=False)
+s = Sphere()
+
+###################################### show after remove
+print('Test show after remove')
+vp.show(s)
+assert vp.renderer.HasViewProp(s)
+vp.remove(s)
+assert not vp.renderer.HasViewProp(s)
+vp.show(s)
+assert vp.renderer.HasViewProp(s)
+
+###################################### show after clear
+print('Test show after clear')
+vp.clear()
+assert not vp.renderer.HasViewProp(s)
+vp.show(s)
+assert vp.renderer.HasViewProp(s)
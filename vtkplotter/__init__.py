@@ -26,29 +26,12 @@ __email__ = "marco.musy@embl.es"
 __status__ = "dev"
 __website__ = "https://github.com/marcomusy/vtkplotter"
 
+import sys
+import importlib
 from vtkplotter.version import _version as __version__
-from vtkplotter.animation import Animation
-from vtkplotter.plotter import *
-from vtkplotter.analysis import *
-from vtkplotter.pyplot import *
-from vtkplotter.shapes import *
-from vtkplotter.vtkio import *
-
-from vtkplotter.base import ActorBase
-from vtkplotter.assembly import Assembly
-from vtkplotter.mesh import Mesh, merge, Actor # Actor is obsolete
-from vtkplotter.picture import Picture
-from vtkplotter.volume import Volume
-
-from vtkplotter.utils import *
-from vtkplotter.colors import *
 import vtkplotter.settings as settings
-import vtkplotter.addons as addons
 from vtkplotter.settings import datadir, embedWindow
 
-# hack: need to uncomment this to generate documentation html
-from vtkplotter.dolfin import _inputsort
-
 from numpy import sin, cos, sqrt, exp, log, dot, cross, array, arange
 
 # imports hierarchy
@@ -60,11 +43,85 @@ from numpy import sin, cos, sqrt, exp, log, dot, cross, array, arange
 # utils   :        colors
 # colors  : -
 
+# Submodules are imported only on first access to one of their names
+# (PEP 562), so that "import vtkplotter" does not pay for vtk, matplotlib
+# and the rest of the library until they are actually needed.
+# Lookup order matters: the first module exporting a name wins,
+# (None means all the names listed in the module __all__).
+_lazyNames = (
+    ("vtkplotter.colors", None),
+    ("vtkplotter.utils", None),
+    ("vtkplotter.volume", ("Volume",)),
+    ("vtkplotter.bricked", ("BrickedVolume",)),
+    ("vtkplotter.picture", ("Picture",)),
+    ("vtkplotter.mesh", ("Mesh", "merge", "Actor")), # Actor is obsolete
+    ("vtkplotter.assembly", ("Assembly",)),
+    ("vtkplotter.base", ("ActorBase",)),
+    ("vtkplotter.vtkio", None),
+    ("vtkplotter.shapes", None),
+    ("vtkplotter.pyplot", None),
+    ("vtkplotter.analysis", None),
+    ("vtkplotter.plotter", None),
+    ("vtkplotter.animation", ("Animation",)),
+    # hack: needed to generate documentation html
+    ("vtkplotter.dolfin", ("_inputsort",)),
+)
+
+_submodules = ("addons", "analysis", "animation", "assembly", "backends",
+               "base", "bricked", "colors", "docs", "dolfin", "mesh", "parallel",
+               "picture", "plotter", "pyplot", "shapes", "utils", "volume", "vtkio")
+
+
+def _loadAll():
+    """Import all submodules and populate the namespace, as in
+    ``from vtkplotter import *``."""
+    g = globals()
+    for modname, names in reversed(_lazyNames):
+        mod = importlib.import_module(modname)
+        for n in names or mod.__all__:
+            if n not in _eagerNames and not n.startswith("_"):
+                g[n] = getattr(mod, n)
+    import vtkplotter.addons
+    # all the public names, submodules included, as when everything was
+    # imported eagerly; the submodules added since are only reached explicitly
+    g["__all__"] = sorted(n for n in g if not n.startswith("_")
+                          and n not in ("sys", "importlib", "bricked", "parallel"))
+
+
+def __getattr__(name):
+    if name == "__all__":
+        _loadAll()
+        return globals()["__all__"]
+    if name.startswith("__"):
+        raise AttributeError(name)
+    if name in _submodules:
+        return importlib.import_module("vtkplotter." + name)
+    for modname, names in _lazyNames:
+        if names is not None and name not in names:
+            continue
+        mod = importlib.import_module(modname)
+        if names is None and name not in mod.__all__:
+            continue
+        obj = getattr(mod, name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError("module 'vtkplotter' has no attribute '" + name + "'")
+
+
+def __dir__():
+    _loadAll()
+    return sorted(globals())
+
 
 ###########################################################################
 settings._init()
 ###########################################################################
 
+_eagerNames = set(globals())
+
+if sys.version_info < (3, 7):  # no module __getattr__ before python 3.7
+    _loadAll()
+
 ## deprecations ############################################################
 #def isolines(*args, **kargs):
 #    printc("Obsolete. Use mesh.isolines() instead of isolines(mesh).", c=1)
@@ -4,8 +4,9 @@ Additional objects like axes, legends etc..
 from __future__ import division, print_function
 from vtkplotter.colors import printc, getColor
 from vtkplotter.assembly import Assembly
-from vtkplotter.mesh import Mesh, merge
+from vtkplotter.mesh import Mesh
 from vtkplotter.utils import mag, isSequence, make_ticks
+import vtkplotter.utils as utils
 import vtkplotter.shapes as shapes
 import vtkplotter.settings as settings
 import vtkplotter.docs as docs
@@ -693,6 +694,57 @@ def computeVisibleBounds():
     return [vbb, sizes, min_bns, max_bns]
 
 
+def _ticksMesh(x0, x1, y0, y1):
+    # merge the quads [x0,x1]x[y0,y1] of all ticks in a single Mesh
+    x0, x1, y0, y1 = np.broadcast_arrays(x0, x1, y0, y1)
+    n = len(x0)
+    pts = np.zeros((4*n, 3))
+    pts[0::4, 0], pts[0::4, 1] = x0, y0
+    pts[1::4, 0], pts[1::4, 1] = x1, y0
+    pts[2::4, 0], pts[2::4, 1] = x1, y1
+    pts[3::4, 0], pts[3::4, 1] = x0, y1
+    return Mesh([pts, np.arange(4*n).reshape(n, 4)])
+
+
+def _minorTicks(corners, n):
+    # positions of n-1 minor ticks between consecutive major ticks
+    t = np.arange(1, n) / n
+    corners = np.asarray(corners)
+    return (corners[:-1, None] + np.outer(np.diff(corners), t)).ravel()
+
+
+def _labelsMesh(texts, positions, s, justify, scale=None, rotations=()):
+    # build all the numeric labels of one axis in a single Mesh,
+    # (same geometry as one shapes.Text per label but from cached glyphs)
+    pts, tris, plab = utils._vectorTextLayout(texts)
+    if not len(pts):
+        return None
+    bmin, bmax, _ = utils._vectorTextBounds(pts, plab, len(texts))
+    dx, dy = (bmax[:, 0]-bmin[:, 0])/2*s, (bmax[:, 1]-bmin[:, 1])/2*s
+    shift = -(bmin + bmax)/2 * s
+    if "bottom" in justify: shift[:, 1] += dy
+    if "top"    in justify: shift[:, 1] -= dy
+    if "left"   in justify: shift[:, 0] += dx
+    if "right"  in justify: shift[:, 0] -= dx
+    pts = pts*s + shift[plab]
+
+    t = vtk.vtkTransform()  # same as actor Rotate* and SetScale
+    for axis, angle in rotations:
+        if axis == 'x': t.RotateX(angle)
+        elif axis == 'y': t.RotateY(angle)
+        else: t.RotateZ(angle)
+    if scale is not None:
+        t.Scale(scale if isSequence(scale) else (scale, scale, scale))
+    M = np.array([[t.GetMatrix().GetElement(i, j) for j in range(3)] for i in range(3)])
+    pts = pts.dot(M.T) + np.asarray(positions, dtype=float)[plab]
+
+    lab = Mesh([pts, tris])
+    lab.flat().lighting('ambient')
+    return lab
+
+
+_axesCache = dict()  # Assembly objects returned by buildAxes() keyed by their options
+
 #####################################################################
 def buildAxes(obj=None,
               xtitle=None, ytitle=None, ztitle=None,
@@ -790,8 +842,12 @@ def buildAxes(obj=None,
 
             show(b, bax)
 
+    .. note:: the axes are cached: a second call with same options and
+        bounds returns the same ``Assembly`` object.
+
     |customAxes| |customAxes.py|_
     """
+    options = dict(locals())
     ncolls = len(settings.collectable_actors)
     if c is None:  # automatic black or white
         c = (0.9, 0.9, 0.9)
@@ -842,6 +898,16 @@ def buildAxes(obj=None,
     if ytitle is None: ytitle = settings.ytitle
     if ztitle is None: ztitle = settings.ztitle
 
+    # reuse the axes built last time with same bounds and options
+    del options['obj']
+    options.update(c=c, xtitle=xtitle, ytitle=ytitle, ztitle=ztitle,
+                   useDepthPeeling=settings.useDepthPeeling)
+    cachekey = repr(sorted(options.items())) + repr([list(map(float, b))
+                                                     for b in (vbb, ss, min_bns, max_bns)])
+    cached = _axesCache.get(cachekey)
+    if cached and cached[0].GetMTime() == cached[1]:
+        return cached[0]
+
     ssmax = max(ss)
     if not ssmax:
         return
@@ -1129,84 +1195,50 @@ def buildAxes(obj=None,
 
     ################################################ MAJOR ticks
     majorticks, minorticks= [], []
-    xticks, yticks, zticks = [],[],[]
     if showTicks:
-        if xtitle:
-            for i in range(1, len(xticks_float)-1):
-                v1 = (xticks_float[i]-xTickThickness/2, -xTickLength/2, 0)
-                v2 = (xticks_float[i]+xTickThickness/2,  xTickLength/2, 0)
-                xticks.append(shapes.Rectangle(v1, v2))
-            if len(xticks)>1:
-                xmajticks = merge(xticks).c(xTickColor)
-                xmajticks.name = "xMajorTicks"
-                majorticks.append(xmajticks)
-        if ytitle:
-            for i in range(1, len(yticks_float)-1):
-                v1 = (-yTickLength/2, yticks_float[i]-yTickThickness/2, 0)
-                v2 = ( yTickLength/2, yticks_float[i]+yTickThickness/2, 0)
-                yticks.append(shapes.Rectangle(v1, v2))
-            if len(yticks)>1:
-                ymajticks = merge(yticks).c(yTickColor)
-                ymajticks.name = "yMajorTicks"
-                majorticks.append(ymajticks)
-        if ztitle:
-            for i in range(1, len(zticks_float)-1):
-                v1 = (zticks_float[i]-zTickThickness/2, -zTickLength/2.84, 0)
-                v2 = (zticks_float[i]+zTickThickness/2,  zTickLength/2.84, 0)
-                zticks.append(shapes.Rectangle(v1, v2))
-            if len(zticks)>1:
-                zmajticks = merge(zticks).c(zTickColor)
-                zmajticks.RotateZ(-45)
-                zmajticks.RotateY(-90)
-                zmajticks.name = "zMajorTicks"
-                majorticks.append(zmajticks)
+        if xtitle and len(xticks_float) > 3:
+            xt = np.array(xticks_float[1:-1])
+            xmajticks = _ticksMesh(xt-xTickThickness/2, xt+xTickThickness/2,
+                                   -xTickLength/2, xTickLength/2).c(xTickColor)
+            xmajticks.name = "xMajorTicks"
+            majorticks.append(xmajticks)
+        if ytitle and len(yticks_float) > 3:
+            yt = np.array(yticks_float[1:-1])
+            ymajticks = _ticksMesh(-yTickLength/2, yTickLength/2,
+                                   yt-yTickThickness/2, yt+yTickThickness/2).c(yTickColor)
+            ymajticks.name = "yMajorTicks"
+            majorticks.append(ymajticks)
+        if ztitle and len(zticks_float) > 3:
+            zt = np.array(zticks_float[1:-1])
+            zmajticks = _ticksMesh(zt-zTickThickness/2, zt+zTickThickness/2,
+                                   -zTickLength/2.84, zTickLength/2.84).c(zTickColor)
+            zmajticks.RotateZ(-45)
+            zmajticks.RotateY(-90)
+            zmajticks.name = "zMajorTicks"
+            majorticks.append(zmajticks)
 
         ################################################ MINOR ticks
-        if xMinorTicks and xtitle and len(xticks)>1:
-            xMinorTicks += 1
-            ticks = []
-            for i in range(1,len(xticks)):
-                t0, t1 = xticks[i-1].pos(), xticks[i].pos()
-                dt = t1 - t0
-                for j in range(1, xMinorTicks):
-                    mt = dt*(j/xMinorTicks) + t0
-                    v1 = (mt[0]-xTickThickness/4, -xTickLength/4, 0)
-                    v2 = (mt[0]+xTickThickness/4,  xTickLength/4, 0)
-                    ticks.append(shapes.Rectangle(v1, v2))
-            if len(ticks):
-                xminticks = merge(ticks).c(xTickColor)
+        if xMinorTicks and xtitle and len(xticks_float) > 3:
+            mt = _minorTicks(xt-xTickThickness/2, xMinorTicks+1)
+            if len(mt):
+                xminticks = _ticksMesh(mt-xTickThickness/4, mt+xTickThickness/4,
+                                       -xTickLength/4, xTickLength/4).c(xTickColor)
                 xminticks.name = "xMinorTicks"
                 minorticks.append(xminticks)
 
-        if yMinorTicks and ytitle and len(yticks)>1:
-            yMinorTicks += 1
-            ticks = []
-            for i in range(1,len(yticks)):
-                t0, t1 = yticks[i-1].pos(), yticks[i].pos()
-                dt = t1 - t0
-                for j in range(1, yMinorTicks):
-                    mt = dt*(j/yMinorTicks) + t0
-                    v1 = (-yTickLength/4, mt[1]-yTickThickness/4, 0)
-                    v2 = ( yTickLength/4, mt[1]+yTickThickness/4, 0)
-                    ticks.append(shapes.Rectangle(v1, v2))
-            if len(ticks):
-                yminticks = merge(ticks).c(yTickColor)
+        if yMinorTicks and ytitle and len(yticks_float) > 3:
+            mt = _minorTicks(yt-yTickThickness/2, yMinorTicks+1)
+            if len(mt):
+                yminticks = _ticksMesh(-yTickLength/4, yTickLength/4,
+                                       mt-yTickThickness/4, mt+yTickThickness/4).c(yTickColor)
                 yminticks.name = "yMinorTicks"
                 minorticks.append(yminticks)
 
-        if zMinorTicks and ztitle and len(zticks)>1:
-            zMinorTicks += 1
-            ticks = []
-            for i in range(1,len(zticks)):
-                t0, t1 = zticks[i-1].pos(), zticks[i].pos()
-                dt = t1 - t0
-                for j in range(1, zMinorTicks):
-                    mt = dt*(j/zMinorTicks) + t0
-                    v1 = (mt[0]-zTickThickness/4, -zTickLength/5., 0)
-                    v2 = (mt[0]+zTickThickness/4,  zTickLength/5., 0)
-                    ticks.append(shapes.Rectangle(v1, v2))
-            if len(ticks):
-                zminticks = merge(ticks).c(zTickColor)
+        if zMinorTicks and ztitle and len(zticks_float) > 3:
+            mt = _minorTicks(zt-zTickThickness/2, zMinorTicks+1)
+            if len(mt):
+                zminticks = _ticksMesh(mt-zTickThickness/4, mt+zTickThickness/4,
+                                       -zTickLength/5., zTickLength/5.).c(zTickColor)
                 zminticks.RotateZ(-45)
                 zminticks.RotateY(-90)
                 zminticks.name = "zMinorTicks"
@@ -1214,40 +1246,38 @@ def buildAxes(obj=None,
 
 
     ################################################ axes tick NUMERIC text labels
+    # all the labels of an axis are merged in a single mesh
     labels = []
     if xLabelSize and xtitle:
-        for i in range(1, len(xticks_str)):
-            t = xticks_str[i]
-            if not t: continue
-            v = (xticks_float[i], -xLabelOffset, 0)
-            xlab = shapes.Text(t, pos=v, s=xLabelSize, justify="center-top", depth=0)
-            if xKeepAspectRatio: xlab.SetScale(x_aspect_ratio_scale)
-            xlab.name = "xNumericLabel"+str(i)+" "+t
+        ids = [i for i in range(1, len(xticks_str)) if xticks_str[i]]
+        xlab = _labelsMesh([xticks_str[i] for i in ids],
+                           [(xticks_float[i], -xLabelOffset, 0) for i in ids],
+                           xLabelSize, "center-top",
+                           x_aspect_ratio_scale if xKeepAspectRatio else None)
+        if xlab:
+            xlab.name = "xNumericLabels"
             labels.append(xlab.c(xTickColor))
 
     if yLabelSize and ytitle:
-        for i in range(1,len(yticks_str)):
-            t = yticks_str[i]
-            if not t: continue
-            v = (-yLabelOffset, yticks_float[i], 0)
-            ylab = shapes.Text(t, pos=(0,0,0), s=yLabelSize, justify="center-bottom", depth=0)
-            if yKeepAspectRatio: ylab.SetScale(y_aspect_ratio_scale)
-            ylab.RotateZ(yTitleRotation)
-            ylab.pos(v)
-            ylab.name = "yNumericLabel"+str(i)+" "+t
+        ids = [i for i in range(1, len(yticks_str)) if yticks_str[i]]
+        ylab = _labelsMesh([yticks_str[i] for i in ids],
+                           [(-yLabelOffset, yticks_float[i], 0) for i in ids],
+                           yLabelSize, "center-bottom",
+                           y_aspect_ratio_scale if yKeepAspectRatio else None,
+                           rotations=[('z', yTitleRotation)])
+        if ylab:
+            ylab.name = "yNumericLabels"
             labels.append(ylab.c(yTickColor))
 
     if zLabelSize and ztitle:
-        for i in range(1, len(zticks_str)):
-            t = zticks_str[i]
-            if not t: continue
-            v = (-zLabelOffset, -zLabelOffset, zticks_float[i])
-            zlab = shapes.Text(t, pos=(0,0,0), s=zLabelSize, justify="center-bottom", depth=0)
-            if zKeepAspectRatio: zlab.SetScale(z_aspect_ratio_scale)
-            zlab.RotateY(-90)
-            zlab.RotateX(zTitleRotation)
-            zlab.pos(v)
-            zlab.name = "zNumericLabel"+str(i)+" "+t
+        ids = [i for i in range(1, len(zticks_str)) if zticks_str[i]]
+        zlab = _labelsMesh([zticks_str[i] for i in ids],
+                           [(-zLabelOffset, -zLabelOffset, zticks_float[i]) for i in ids],
+                           zLabelSize, "center-bottom",
+                           z_aspect_ratio_scale if zKeepAspectRatio else None,
+                           rotations=[('y', -90), ('x', zTitleRotation)])
+        if zlab:
+            zlab.name = "zNumericLabels"
             labels.append(zlab.c(zTickColor))
 
     acts = titles + lines + labels + grids + grids2 + highlights + framelines
@@ -1267,6 +1297,9 @@ def buildAxes(obj=None,
     asse.SetScale(ss)
     asse.PickableOff()
     settings.collectable_actors = settings.collectable_actors[:ncolls]
+    if len(_axesCache) > 32:
+        _axesCache.pop(next(iter(_axesCache)))
+    _axesCache[cachekey] = (asse, asse.GetMTime())
     return asse
 
 
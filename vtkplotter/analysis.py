@@ -2,13 +2,13 @@ from __future__ import division, print_function
 import vtkplotter.docs as docs
 import vtk
 import numpy as np
-from vtk.util.numpy_support import numpy_to_vtk, vtk_to_numpy
+from vtk.util.numpy_support import numpy_to_vtk, numpy_to_vtkIdTypeArray, vtk_to_numpy
 
 import vtkplotter.utils as utils
 import vtkplotter.colors as colors
 import vtkplotter.shapes as shapes
 from vtkplotter.assembly import Assembly
-from vtkplotter.mesh import Mesh
+from vtkplotter.mesh import Mesh, _cellArrayToCSR
 from vtkplotter.volume import Volume
 
 __doc__ = (
@@ -29,6 +29,9 @@ __all__ = [
     "fitLine",
     "fitPlane",
     "fitSphere",
+    "fitLines",
+    "fitPlanes",
+    "fitSpheres",
     "pcaEllipsoid",
     "smoothMLS3D",
     "booleanOperation",
@@ -360,6 +363,118 @@ def fitSphere(coords):
     return s
 
 
+def _neighborhoods(points, neighbors):
+    # coordinates of the points and (M,k) array of neighbor indices
+    if isinstance(points, vtk.vtkActor):
+        points = points.points()
+    points = np.asarray(points, dtype=float)
+    if isinstance(neighbors, (int, np.integer)):
+        from scipy.spatial import cKDTree
+        neighbors = cKDTree(points).query(points, k=neighbors)[1]
+    return points, np.asarray(neighbors)
+
+
+def _batchFit(fit, points, neighbors, chunk, workers):
+    # apply fit() to chunks of neighborhoods, numpy releases the GIL
+    # during the linear algebra so chunks can run on a pool of threads
+    points, neighbors = _neighborhoods(points, neighbors)
+    jobs = [points[neighbors[i:i+chunk]] for i in range(0, len(neighbors), chunk)]
+    if workers > 1 and len(jobs) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(workers) as pool:
+            results = list(pool.map(fit, jobs))
+    else:
+        results = [fit(job) for job in jobs]
+    if not results:
+        results = [fit(np.zeros((0, 1, 3)))]
+    return tuple(np.concatenate(r) for r in zip(*results))
+
+
+def _pcaFit(data):
+    # stacked principal components of (M,k,3) point sets
+    centers = data.mean(axis=1)
+    x = data - centers[:, np.newaxis]
+    evals, evecs = np.linalg.eigh(np.matmul(x.transpose(0, 2, 1), x))
+    svals = np.sqrt(np.clip(evals, 0, None))  # singular values, ascending
+    return centers, evecs, svals
+
+
+def fitLines(points, neighbors=12, chunk=100000, workers=1):
+    """
+    Fit a line to each neighborhood of a set of points.
+
+    :param points: a ``Mesh`` or an array of shape `(N,3)`.
+    :param neighbors: an array of shape `(M,k)` with the indices of the points
+        in each neighborhood, or an integer `k` to use the `k` closest points
+        to each point (needs `scipy`).
+    :param int chunk: number of neighborhoods processed at once.
+    :param int workers: number of threads.
+
+    Returns three arrays: the `(M,3)` centers, the `(M,3)` unit directions
+    and the `(M,3)` singular values in decreasing order, as ``Line.variances``
+    in ``fitLine()``.
+    """
+    def fit(data):
+        centers, evecs, svals = _pcaFit(data)
+        return centers, evecs[:, :, 2], svals[:, ::-1]
+    return _batchFit(fit, points, neighbors, chunk, workers)
+
+
+def fitPlanes(points, neighbors=12, chunk=100000, workers=1):
+    """
+    Fit a plane to each neighborhood of a set of points.
+    Parameters are the same as in ``fitLines()``.
+
+    Returns three arrays: the `(M,3)` centers, the `(M,3)` unit normals
+    and the `(M,)` smallest singular values, as ``Plane.variance`` in ``fitPlane()``.
+
+    :Example:
+        .. code-block:: python
+
+            from vtkplotter import *
+            s = load(datadir+"cow.vtk").subdivide().normalize()
+            centers, normals, variances = fitPlanes(s, 12)
+            s.addPointScalars(variances, "planarity").addScalarBar()
+            show(s)
+    """
+    def fit(data):
+        centers, evecs, svals = _pcaFit(data)
+        return centers, evecs[:, :, 0], svals[:, 0]
+    return _batchFit(fit, points, neighbors, chunk, workers)
+
+
+def fitSpheres(points, neighbors=16, chunk=100000, workers=1):
+    """
+    Fit a sphere to each neighborhood of a set of points.
+    Parameters are the same as in ``fitLines()``.
+
+    Returns three arrays: the `(M,3)` centers, the `(M,)` radii and
+    the `(M,)` residues, as ``Sphere.residue`` in ``fitSphere()``.
+    Neighborhoods where the fit is undetermined (e.g. all points on a plane)
+    get `nan` values.
+    """
+    def fit(data):
+        m, k = data.shape[:2]
+        mean = data.mean(axis=1)
+        x = data - mean[:, np.newaxis]  # better conditioned
+        A = np.empty((m, k, 4))
+        A[:, :, :3] = 2 * x
+        A[:, :, 3] = 1
+        f = np.einsum("mki,mki->mk", x, x)
+        AtA = np.matmul(A.transpose(0, 2, 1), A)
+        sv = np.linalg.svd(AtA, compute_uv=False)
+        bad = sv[:, 3] <= sv[:, 0] * k * 1e-12  # rank < 4
+        AtA[bad] = np.eye(4)
+        C = np.linalg.solve(AtA, np.einsum("mki,mk->mi", A, f)[:, :, np.newaxis])[:, :, 0]
+        radii = np.sqrt(np.einsum("mi,mi->m", C[:, :3], C[:, :3]) + C[:, 3])
+        res = np.einsum("mki,mi->mk", A, C) - f
+        residues = np.sqrt(np.einsum("mk,mk->m", res, res)) / k
+        centers = C[:, :3] + mean
+        centers[bad], radii[bad], residues[bad] = np.nan, np.nan, np.nan
+        return centers, radii, residues
+    return _batchFit(fit, points, neighbors, chunk, workers)
+
+
 def pcaEllipsoid(points, pvalue=0.95):
     """
     Show the oriented PCA ellipsoid that contains fraction `pvalue` of points.
@@ -620,8 +735,10 @@ def extractSurface(volume, radius=0.5):
     return Mesh(fe.GetOutput())
 
 
+@utils.cached
 def recoSurface(pts, dims=(250,250,250), radius=None,
-                sampleSize=None, holeFilling=True, bounds=(), pad=0.1):
+                sampleSize=None, holeFilling=True, bounds=(), pad=0.1,
+                tiles=None, maxMemory=None, workers=1):
     """
     Surface reconstruction from a scattered cloud of points.
 
@@ -638,6 +755,18 @@ def recoSurface(pts, dims=(250,250,250), radius=None,
     :param list bounds: region in space in which to perform the sampling
         in format (xmin,xmax, ymin,ymax, zim, zmax)
     :param float pad: increase by this fraction the bounding box
+    :param tiles: split the grid in this number of blocks along each axis
+        (an integer or a list of 3 integers). Each block is reconstructed
+        on its own, from the points within `radius` of it, and the pieces are
+        cropped and merged.
+    :param float maxMemory: memory budget in MB for a single block,
+        sets the number of `tiles` automatically. It accounts for the grid nodes
+        and the points of the block, not for the input cloud, its normals
+        and the output surface.
+    :param int workers: number of processes reconstructing the blocks.
+
+    .. note:: in tiled mode missing normals are estimated and oriented once
+        on the whole cloud before it is split, so that the blocks agree at the seams.
 
     |recosurface| |recosurface.py|_
     """
@@ -646,30 +775,16 @@ def recoSurface(pts, dims=(250,250,250), radius=None,
 
     if isinstance(pts, Mesh):
         polyData = pts.polydata()
+    elif tiles or maxMemory:
+        polyData = _pointCloud(pts)[0]
     else:
         polyData = shapes.Points(pts).polydata()
 
-    sdf = vtk.vtkSignedDistance()
-
-    if len(bounds)==6:
-        sdf.SetBounds(bounds)
-    else:
+    if len(bounds) != 6:
         x0, x1, y0, y1, z0, z1 = polyData.GetBounds()
-        sdf.SetBounds(x0-(x1-x0)*pad, x1+(x1-x0)*pad,
-                      y0-(y1-y0)*pad, y1+(y1-y0)*pad,
-                      z0-(z1-z0)*pad, z1+(z1-z0)*pad)
-
-    if polyData.GetPointData().GetNormals():
-        sdf.SetInputData(polyData)
-    else:
-        normals = vtk.vtkPCANormalEstimation()
-        normals.SetInputData(polyData)
-        if not sampleSize:
-            sampleSize = int(polyData.GetNumberOfPoints()/50)
-        normals.SetSampleSize(sampleSize)
-        normals.SetNormalOrientationToGraphTraversal()
-        sdf.SetInputConnection(normals.GetOutputPort())
-        #print("Recalculating normals with sample size =", sampleSize)
+        bounds = (x0-(x1-x0)*pad, x1+(x1-x0)*pad,
+                  y0-(y1-y0)*pad, y1+(y1-y0)*pad,
+                  z0-(z1-z0)*pad, z1+(z1-z0)*pad)
 
     if radius is None:
         b = polyData.GetBounds()
@@ -677,6 +792,174 @@ def recoSurface(pts, dims=(250,250,250), radius=None,
         radius = diagsize / (sum(dims)/3) * 5
         #print("Calculating mesh from points with radius =", radius)
 
+    if not tiles and not maxMemory:
+        return Mesh(_recoSDF(polyData, bounds, dims, radius, sampleSize, holeFilling))
+
+    ######################################## tiled mode
+    bounds = np.asarray(bounds, dtype=float)
+    dims = np.asarray(dims)
+    h = (bounds[1::2] - bounds[::2]) / (dims - 1)
+    overlap = np.ceil(radius / h).astype(int) + 2  # in voxels
+    points = vtk_to_numpy(polyData.GetPoints().GetData())
+    normals = polyData.GetPointData().GetNormals()
+    if normals is None:
+        normals = _recoNormals(polyData, sampleSize).GetPointData().GetNormals()
+    normals = vtk_to_numpy(normals)
+
+    if tiles:
+        tiles = np.array(tiles if utils.isSequence(tiles) else [tiles]*3)
+    else:
+        tiles = _recoTiling(points, bounds, dims, h, overlap, radius, maxMemory)
+    edges = [np.linspace(0, dims[i]-1, tiles[i]+1).astype(int) for i in range(3)]
+
+    def _jobs():
+        for i in range(tiles[0]):
+            for j in range(tiles[1]):
+                for k in range(tiles[2]):
+                    core = np.array([edges[0][i], edges[0][i+1], edges[1][j], edges[1][j+1],
+                                     edges[2][k], edges[2][k+1]])
+                    if np.any(core[1::2] == core[::2]):
+                        continue
+                    n0 = np.maximum(core[::2] - overlap, 0)
+                    n1 = np.minimum(core[1::2] + overlap, dims-1)
+                    tb = np.c_[bounds[::2] + n0*h, bounds[::2] + n1*h].ravel()
+                    sel = np.all((points >= tb[::2] - radius) & (points <= tb[1::2] + radius), axis=1)
+                    if not np.any(sel):
+                        continue
+                    cb = np.c_[bounds[::2] + core[::2]*h, bounds[::2] + core[1::2]*h].ravel()
+                    yield (points[sel], normals[sel], tb, n1 - n0 + 1, cb, h, radius, holeFilling)
+
+    if workers > 1:
+        import threading
+        import multiprocessing
+
+        # only a few blocks of points are queued at once, to stay within the budget
+        inflight = threading.Semaphore(2 * workers)
+        stop = []
+
+        def _boundedJobs():  # consumed by the pool feeder thread
+            for job in _jobs():
+                inflight.acquire()
+                if stop:
+                    return
+                yield job
+
+        pool = multiprocessing.Pool(workers)
+        pieces = []
+        try:
+            for piece in pool.imap_unordered(_recoTile, _boundedJobs()):
+                inflight.release()
+                pieces.append(piece)
+        except BaseException:
+            stop.append(True)
+            inflight.release()  # wake up the feeder thread
+            pool.terminate()
+            raise
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        pieces = [_recoTile(job) for job in _jobs()]
+
+    pieces = [pc for pc in pieces if len(pc[1])]
+    if not pieces:
+        return Mesh(vtk.vtkPolyData())
+    verts, faces = _recoMerge(pieces, bounds[::2], h)
+    return Mesh(utils.buildPolyData(verts, faces))
+
+
+def _recoTiling(points, bounds, dims, h, overlap, radius, maxMemory):
+    # smallest number of blocks such that one block needs less than maxMemory MB:
+    # ~32 bytes per grid node for the distance field and the surface extraction,
+    # ~128 bytes per point for its copy, the normals and the point locator.
+    # Points are counted on a coarse histogram, over-estimating the blocks content.
+    nb = 32
+    hist = np.histogramdd(points, bins=nb, range=list(zip(bounds[::2], bounds[1::2])))[0]
+    sat = np.zeros((nb+1, nb+1, nb+1))
+    sat[1:, 1:, 1:] = hist.cumsum(0).cumsum(1).cumsum(2)  # summed area table
+    binsize = (bounds[1::2] - bounds[::2]) / nb
+    margin = overlap * h + radius
+
+    def _cost(tiles):
+        edges = [np.linspace(bounds[2*i], bounds[2*i+1], tiles[i]+1) for i in range(3)]
+        maxpts = 0
+        for x0, x1 in zip(edges[0][:-1], edges[0][1:]):
+            for y0, y1 in zip(edges[1][:-1], edges[1][1:]):
+                for z0, z1 in zip(edges[2][:-1], edges[2][1:]):
+                    lo = np.clip(np.floor((np.array([x0, y0, z0]) - margin - bounds[::2]) / binsize), 0, nb)
+                    hi = np.clip(np.ceil((np.array([x1, y1, z1]) + margin - bounds[::2]) / binsize), 0, nb)
+                    (a, b, c), (d, e, f) = lo.astype(int), hi.astype(int)
+                    n = (sat[d, e, f] - sat[a, e, f] - sat[d, b, f] - sat[d, e, c]
+                         + sat[a, b, f] + sat[a, e, c] + sat[d, b, c] - sat[a, b, c])
+                    maxpts = max(maxpts, n)
+        nodes = np.prod(np.minimum(dims, (dims-1)//tiles + 1 + 2*overlap))
+        return nodes * 32 + maxpts * 128
+
+    tiles = np.ones(3, dtype=int)
+    while _cost(tiles) > maxMemory*1e6:
+        core = (dims-1) / tiles
+        split = core > overlap  # smaller blocks would be mostly made of overlap
+        if not np.any(split):
+            colors.printc("~bomb recoSurface(): blocks cannot fit in maxMemory =",
+                          maxMemory, "MB, using tiles =", tuple(tiles.tolist()), c=1)
+            break
+        tiles[np.argmax(np.where(split, core, 0))] += 1
+    return tiles
+
+
+def _recoMerge(pieces, origin, h):
+    # Merge the surface pieces of the blocks. Each vertex lies on an edge of the
+    # global grid and is identified by it: vertices computed by different blocks
+    # on the same edge differ by round-off, they are merged into one.
+    verts = np.concatenate([v for v, f in pieces]).astype(float)
+    offsets = np.cumsum([0] + [len(v) for v, f in pieces[:-1]])
+    faces = np.concatenate([f + o for (v, f), o in zip(pieces, offsets)])
+    used, faces = np.unique(faces, return_inverse=True)  # drop the cropped vertices
+    verts, faces = verts[used], faces.reshape(-1, 3)
+
+    g = (verts - origin) / h  # position in voxel units
+    r = np.round(g)
+    axis = np.argmax(np.abs(g - r), axis=1)  # the other two are integers up to round-off
+    rows = np.arange(len(g))
+    r[rows, axis] = np.floor(g[rows, axis])  # first node of the edge
+    keys = np.c_[r.astype(np.int64), axis]
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.ravel()
+
+    # snap the vertices exactly on their edge
+    newverts = verts[first]
+    snapped = origin + r[first] * h
+    edge = axis[first]
+    mask = np.arange(3)[None, :] != edge[:, None]
+    newverts[mask] = snapped[mask]
+
+    faces = inverse[faces]
+    ok = (faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 0] != faces[:, 2])
+    return newverts, faces[ok]
+
+
+def _recoNormals(polyData, sampleSize):
+    # point cloud with the normals estimated from its neighborhoods
+    normals = vtk.vtkPCANormalEstimation()
+    normals.SetInputData(polyData)
+    if not sampleSize:
+        sampleSize = int(polyData.GetNumberOfPoints()/50)
+    normals.SetSampleSize(sampleSize)
+    normals.SetNormalOrientationToGraphTraversal()
+    normals.Update()
+    #print("Recalculating normals with sample size =", sampleSize)
+    return normals.GetOutput()
+
+
+def _recoSDF(polyData, bounds, dims, radius, sampleSize, holeFilling):
+    sdf = vtk.vtkSignedDistance()
+    sdf.SetBounds(bounds)
+
+    if polyData.GetPointData().GetNormals():
+        sdf.SetInputData(polyData)
+    else:
+        sdf.SetInputData(_recoNormals(polyData, sampleSize))
+
     sdf.SetRadius(radius)
     sdf.SetDimensions(dims)
     sdf.Update()
@@ -688,28 +971,60 @@ def recoSurface(pts, dims=(250,250,250), radius=None,
     surface.ComputeGradientsOff()
     surface.SetInputConnection(sdf.GetOutputPort())
     surface.Update()
-    return Mesh(surface.GetOutput())
+    return surface.GetOutput()
+
+
+def _recoTile(job):
+    # reconstruct one block of recoSurface() and keep the triangles in its core voxels
+    points, normals, bounds, dims, core, h, radius, holeFilling = job
+    poly = _pointCloud(points)[0]
+    poly.GetPointData().SetNormals(numpy_to_vtk(normals, deep=True))
+    surf = _recoSDF(poly, bounds, dims, radius, None, holeFilling)
+    if not surf.GetNumberOfCells():
+        return np.zeros((0, 3)), np.zeros((0, 3), dtype=np.int64)
+    verts = vtk_to_numpy(surf.GetPoints().GetData())
+    offsets, conn = _cellArrayToCSR(surf.GetPolys())
+    faces = conn.reshape(-1, 3)
+    # voxel of each triangle, from its centroid
+    vox = np.floor((verts[faces].mean(axis=1) - bounds[::2]) / h + 1e-09)
+    lo = np.round((core[::2] - bounds[::2]) / h)
+    hi = np.round((core[1::2] - bounds[::2]) / h)
+    faces = faces[np.all((vox >= lo) & (vox < hi), axis=1)]
+    return np.array(verts), faces
+
+
+def _pointCloud(points):
+    # polydata and numpy array of a point cloud, numpy input is not copied
+    if isinstance(points, vtk.vtkActor):
+        poly = points.GetMapper().GetInput()
+        return poly, vtk_to_numpy(poly.GetPoints().GetData())
+    pts = np.asarray(points)
+    if pts.dtype not in (np.float32, np.float64):
+        pts = pts.astype(float)
+    pts = np.ascontiguousarray(pts)
+    if pts.shape[1] == 2:
+        pts = np.c_[pts, np.zeros(len(pts))]
+    vpts = vtk.vtkPoints()
+    vpts.SetData(numpy_to_vtk(pts, deep=False))
+    poly = vtk.vtkPolyData()
+    poly.SetPoints(vpts)
+    return poly, pts
 
 
-def cluster(points, radius):
+def cluster(points, radius, returnIds=False, verbose=False):
     """
     Clustering of points in space.
 
     `radius` is the radius of local search.
     Individual subsets can be accessed through ``mesh.clusters``.
 
+    :param bool returnIds: return the array with the cluster id of each point
+        instead of an ``Assembly`` of ``Points``.
+    :param bool verbose: print a summary of the extracted clusters.
+
     |clustering| |clustering.py|_
     """
-    if isinstance(points, vtk.vtkActor):
-        poly = points.GetMapper().GetInput()
-    else:
-        src = vtk.vtkPointSource()
-        src.SetNumberOfPoints(len(points))
-        src.Update()
-        vpts = src.GetOutput().GetPoints()
-        for i, p in enumerate(points):
-            vpts.SetPoint(i, p)
-        poly = src.GetOutput()
+    poly, pts = _pointCloud(points)
 
     cluster = vtk.vtkEuclideanClusterExtraction()
     cluster.SetInputData(poly)
@@ -718,12 +1033,14 @@ def cluster(points, radius):
     cluster.ColorClustersOn()
     cluster.Update()
 
-    idsarr = cluster.GetOutput().GetPointData().GetArray("ClusterId")
+    ids = vtk_to_numpy(cluster.GetOutput().GetPointData().GetArray("ClusterId"))
+    if returnIds:
+        return np.array(ids)
     Nc = cluster.GetNumberOfExtractedClusters()
 
-    sets = [[] for i in range(Nc)]
-    for i, p in enumerate(points):
-        sets[idsarr.GetValue(i)].append(p)
+    order = np.argsort(ids, kind="stable")
+    counts = np.bincount(ids, minlength=Nc)
+    sets = np.split(pts[order], np.cumsum(counts)[:-1])
 
     acts = []
     for i, aset in enumerate(sets):
@@ -732,56 +1049,59 @@ def cluster(points, radius):
     asse = Assembly(acts)
 
     asse.info["clusters"] = sets
-    print("Nr. of extracted clusters", Nc)
-    if Nc > 10:
-        print("First ten:")
-    for i in range(Nc):
-        if i > 9:
-            print("...")
-            break
-        print("Cluster #" + str(i) + ",  N =", len(sets[i]))
-    print("Access individual clusters through attribute: obj.info['cluster']")
+    if verbose:
+        print("Nr. of extracted clusters", Nc)
+        if Nc > 10:
+            print("First ten:")
+        for i in range(Nc):
+            if i > 9:
+                print("...")
+                break
+            print("Cluster #" + str(i) + ",  N =", counts[i])
+        print("Access individual clusters through attribute: obj.info['cluster']")
     return asse
 
 
-def removeOutliers(points, radius):
+def removeOutliers(points, radius, returnMask=False, verbose=False):
     """
     Remove outliers from a cloud of points within the specified `radius` search.
 
+    :param bool returnMask: return a boolean array which is `True` for the outlier points.
+    :param bool verbose: print the number of removed points.
+
     |clustering| |clustering.py|_
     """
-    isactor = False
-    if isinstance(points, vtk.vtkActor):
-        isactor = True
-        poly = points.GetMapper().GetInput()
-    else:
-        src = vtk.vtkPointSource()
-        src.SetNumberOfPoints(len(points))
-        src.Update()
-        vpts = src.GetOutput().GetPoints()
-        for i, p in enumerate(points):
-            vpts.SetPoint(i, p)
-        poly = src.GetOutput()
+    isactor = isinstance(points, vtk.vtkActor)
+    poly, pts = _pointCloud(points)
+
+    # carry the original point ids through the filter
+    cloud = vtk.vtkPolyData()
+    cloud.SetPoints(poly.GetPoints())
+    idsarr = numpy_to_vtk(np.arange(len(pts)), deep=True, array_type=vtk.VTK_ID_TYPE)
+    idsarr.SetName("OriginalIds")
+    cloud.GetPointData().AddArray(idsarr)
 
     removal = vtk.vtkRadiusOutlierRemoval()
-    removal.SetInputData(poly)
+    removal.SetInputData(cloud)
     removal.SetRadius(radius)
     removal.SetNumberOfNeighbors(5)
     removal.GenerateOutliersOff()
     removal.Update()
-    rpoly = removal.GetOutput()
-    print("# of removed outlier points: ",
-          removal.GetNumberOfPointsRemoved(), '/', poly.GetNumberOfPoints())
-    outpts = []
-    for i in range(rpoly.GetNumberOfPoints()):
-        outpts.append(list(rpoly.GetPoint(i)))
-    outpts = np.array(outpts)
+    if verbose:
+        print("# of removed outlier points: ",
+              removal.GetNumberOfPointsRemoved(), '/', poly.GetNumberOfPoints())
+    mask = np.ones(len(pts), dtype=bool)
+    mask[vtk_to_numpy(removal.GetOutput().GetPointData().GetArray("OriginalIds"))] = False
+    if returnMask:
+        return mask
+    outpts = pts[~mask]
     if not isactor:
         return outpts
 
     return shapes.Points(outpts)
 
 
+@utils.cached
 def booleanOperation(mesh1, operation, mesh2):
     """Volumetric union, intersection and subtraction of surfaces.
 
@@ -840,32 +1160,29 @@ def probePoints(vol, pts):
     if isinstance(pts, Mesh):
         pts = pts.points()
 
-    def readPoints():
-        output = src.GetPolyDataOutput()
-        points = vtk.vtkPoints()
-        for p in pts:
-            x, y, z = p
-            points.InsertNextPoint(x, y, z)
-        output.SetPoints(points)
-
-        cells = vtk.vtkCellArray()
-        cells.InsertNextCell(len(pts))
-        for i in range(len(pts)):
-            cells.InsertCellPoint(i)
-        output.SetVerts(cells)
-
-    src = vtk.vtkProgrammableSource()
-    src.SetExecuteMethod(readPoints)
-    src.Update()
+    poly, pts = _pointCloud(pts)
+    n = len(pts)
+    verts = vtk.vtkCellArray()
+    verts.SetCells(1, numpy_to_vtkIdTypeArray(np.r_[n, np.arange(n)].astype(np.int64), deep=True))
+    poly.SetVerts(verts)
+
+    # the probe filter is cached on the probed object, new points only swap its input
     img = _getinput(vol)
-    probeFilter = vtk.vtkProbeFilter()
-    probeFilter.SetSourceData(img)
-    probeFilter.SetInputConnection(src.GetOutputPort())
+    probeFilter = getattr(vol, "_probeFilter", None)
+    if probeFilter is None or probeFilter.GetSource() is not img:
+        probeFilter = vtk.vtkProbeFilter()
+        probeFilter.SetSourceData(img)
+        try:
+            vol._probeFilter = probeFilter
+        except AttributeError:
+            pass
+    probeFilter.SetInputData(poly)
     probeFilter.Update()
+    out = vtk.vtkPolyData()
+    out.ShallowCopy(probeFilter.GetOutput())
 
-    pact = Mesh(probeFilter.GetOutput())
+    pact = Mesh(out)
     pact.mapper().SetScalarRange(img.GetScalarRange())
-    #del src # to avoid memory leaks, incompatible with python2
     return pact
 
 
@@ -1056,19 +1373,19 @@ def geodesic(mesh, start, end):
     :param end: end vertex index or close point `[x,y,z]`
     :type start: int, list
 
+    .. hint:: To compute distances or paths from many sources at once use
+        ``mesh.geodesicDistance()`` and ``mesh.geodesicPaths()``.
+
     |geodesic| |geodesic.py|_
     """
 
     dijkstra = vtk.vtkDijkstraGraphGeodesicPath()
 
     if utils.isSequence(start):
-        cc = mesh.points()
-        pa = shapes.Points(cc)
-        start = pa.closestPoint(start, returnIds=True)
-        end = pa.closestPoint(end, returnIds=True)
-        dijkstra.SetInputData(pa.polydata())
-    else:
-        dijkstra.SetInputData(mesh.polydata())
+        pts = mesh.points()
+        start = int(np.argmin(np.linalg.norm(pts - start, axis=1)))
+        end = int(np.argmin(np.linalg.norm(pts - end, axis=1)))
+    dijkstra.SetInputData(mesh.polydata())
 
     dijkstra.SetStartVertex(start)
     dijkstra.SetEndVertex(end)
@@ -1076,11 +1393,7 @@ def geodesic(mesh, start, end):
 
     weights = vtk.vtkDoubleArray()
     dijkstra.GetCumulativeWeights(weights)
-
-    length = weights.GetMaxId() + 1
-    arr = np.zeros(length)
-    for i in range(length):
-        arr[i] = weights.GetTuple(i)[0]
+    arr = vtk_to_numpy(weights).copy()
 
     dmesh = Mesh(dijkstra.GetOutput())
     prop = vtk.vtkProperty()
@@ -1130,6 +1443,7 @@ def convexHull(mesh_or_list, alphaConstant=0):
     return Mesh(surfaceFilter.GetOutput())
 
 
+@utils.cached
 def mesh2Volume(mesh, spacing=(1, 1, 1)):
     """
     Convert a mesh it into a ``Volume``
@@ -1198,90 +1512,203 @@ def projectSphereFilter(mesh):
     return Mesh(psf.GetOutput())
 
 
-def voronoi3D(nuclei, bbfactor=1, tol=None):
-    """Generate 3D Voronio tasselization with the `Voro++ <http://math.lbl.gov/voro++/>`_ package.
+@utils.cached
+def voronoi3D(nuclei, bbfactor=1, tol=None, method="scipy"):
+    """Generate 3D Voronio tasselization, clipped to the bounding box of the `nuclei`.
+
+    :param float tol: discard the cells which have a vertex closer than `tol`
+        to the bounding box.
+    :param str method: either `'scipy'` (uses ``scipy.spatial.Voronoi``)
+        or `'voro++'` (uses the `Voro++ <http://math.lbl.gov/voro++/>`_ executable
+        found in ``settings.voro_path``).
+
+    The faces of each cell are listed in ``mesh.info['cells']``, their areas and volumes
+    in ``mesh.info['areas']`` and ``mesh.info['volumes']``.
 
     |voronoi3d| |voronoi3d.py|_
     """
-    from vtkplotter import settings
-    import os
-
-    # run voro++
-    if os.path.isfile(settings.voro_path+'/voro++') or settings.voro_path=='':
-        outF = open('voronoi3d.txt', "w")
-        for i,p in enumerate(nuclei):
-            outF.write(str(i)+' '+str(p[0])+' '+str(p[1])+' '+str(p[2])+'\n')
-        outF.close()
-        ncl = shapes.Points(nuclei)
-        b = np.array(ncl.GetBounds())*bbfactor
-        bbstr = str(b[0])+' '+str(b[1])+' '+str(b[2])+' '+str(b[3])+' '+str(b[4])+' '+str(b[5])
-        print('Using Voro++ in           :', settings.voro_path)
-        os.system(settings.voro_path+'/voro++ -c "%F %v %w %P %t" -v '+bbstr+' voronoi3d.txt')
-        f = open('voronoi3d.txt.vol', "r")
-        lines = f.readlines()
-        f.close()
+    nuclei = np.asarray(nuclei, dtype=float)
+    b = np.array([nuclei[:, 0].min(), nuclei[:, 0].max(),
+                  nuclei[:, 1].min(), nuclei[:, 1].max(),
+                  nuclei[:, 2].min(), nuclei[:, 2].max()]) * bbfactor
+
+    if method == "scipy":
+        verts, cellids, faceids, conn = _voronoiScipy(nuclei, b)
+    elif method == "voro++":
+        verts, cellids, faceids, conn = _voronoiVoro(nuclei, b)
     else:
-        print('Cannot find Voro++ installation in:', settings.voro_path)
-        print('Download and install Voro++ from http://math.lbl.gov/voro++/download')
-        print('Then add:')
-        print('from vtkplotter import settings"')
-        print('settings.voro_path="path_to_voro++_executable"')
+        colors.printc("Error in voronoi3D(): unknown method", method, c=1)
         raise RuntimeError()
 
-    # build polydata
-    sourcePoints = vtk.vtkPoints()
-    sourcePolygons = vtk.vtkCellArray()
-    cells, areas, volumes = [], [], []
-    for l in lines: # each line corresponds to an input point
-        ls = l.split()
-        area = float(ls[0])
-        volu = float(ls[1])
-        n = int(ls[2])
-        ids = []
-        for i in range(3, n+3):
-            p = tuple(map(float, ls[i][1:-1].split(',')))
-            aid = sourcePoints.InsertNextPoint(p[0], p[1], p[2])
-            if tol:
-                bp = np.array([p[0]-b[0], p[0]-b[1],
-                               p[1]-b[2], p[1]-b[3],
-                               p[2]-b[4], p[2]-b[5]])
-                bp = np.abs(bp) < tol
-                if np.any(bp):
-                    ids.append(None)
-                else:
-                    ids.append(aid)
-            else:
-                ids.append(aid)
-
-        # fill polygon elements
-        if None in ids:
-            continue
-
-        faces = []
-        for j in range(n+3, len(ls)):
-            face = tuple(map(int, ls[j][1:-1].split(',')))
-            ele = vtk.vtkPolygon()
-            ele.GetPointIds().SetNumberOfIds(len(face))
-            elems = []
-            for k,f in enumerate(face):
-                ele.GetPointIds().SetId(k, ids[f])
-                elems.append(ids[f])
-            sourcePolygons.InsertNextCell(ele)
-            faces.append(elems)
-        cells.append(faces)
-        areas.append(area)
-        volumes.append(volu)
+    # sort the faces by cell, each cell gets its own copy of the vertices
+    forder = np.argsort(cellids, kind="mergesort")
+    rank = np.empty_like(forder)
+    rank[forder] = np.arange(len(forder))
+    eorder = np.lexsort((np.arange(len(conn)), rank[faceids]))
+    cellids, faceids, conn = cellids[forder], rank[faceids][eorder], conn[eorder]
+    nc = len(nuclei)
+    entcell = cellids[faceids]
+    uid, newid = np.unique(entcell * len(verts) + conn, return_inverse=True)
+    newid = newid.ravel()
+    pts = verts[uid % len(verts)]
 
+    if tol:
+        near = np.min(np.abs(pts[:, [0, 0, 1, 1, 2, 2]] - b), axis=1) < tol
+        dropped = np.zeros(nc, dtype=bool)
+        dropped[entcell[near[newid]]] = True
+    else:
+        dropped = np.zeros(nc, dtype=bool)
+
+    # face areas from triangle fans around the face centers, cell volumes
+    # from the tetrahedra joining the fans to the nucleus (inside the convex cell)
+    nfaces = len(cellids)
+    counts = np.bincount(faceids, minlength=nfaces)
+    fstart = np.r_[0, np.cumsum(counts)[:-1]]
+    k = np.arange(len(conn))
+    nxt = np.where(k + 1 == fstart[faceids] + counts[faceids], fstart[faceids], k + 1)
+    fcenters = np.c_[[np.bincount(faceids, weights=verts[conn, i], minlength=nfaces)
+                      for i in range(3)]].T / np.maximum(counts, 1)[:, np.newaxis]
+    a = verts[conn] - fcenters[faceids]
+    c = verts[conn[nxt]] - fcenters[faceids]
+    areas = np.bincount(cellids, minlength=nc,
+                        weights=np.bincount(faceids, minlength=nfaces,
+                                            weights=np.linalg.norm(np.cross(a, c), axis=1)/2))
+    q = fcenters[faceids] - nuclei[entcell]
+    tets = np.abs(np.einsum("ij,ij->i", q, np.cross(a, c))) / 6
+    volumes = np.bincount(entcell, weights=tets, minlength=nc)
+
+    keepf = ~dropped[cellids]
+    keepe = keepf[faceids]
+    sizes = counts[keepf]
+    legacy = np.empty(len(sizes) + keepe.sum(), dtype=np.int64)
+    heads = np.r_[0, np.cumsum(sizes + 1)[:-1]]
+    legacy[heads] = sizes
+    body = np.ones(len(legacy), dtype=bool)
+    body[heads] = False
+    legacy[body] = newid[keepe]
+    polys = vtk.vtkCellArray()
+    polys.SetCells(len(sizes), numpy_to_vtkIdTypeArray(legacy, deep=True))
+
+    vpts = vtk.vtkPoints()
+    vpts.SetData(numpy_to_vtk(np.ascontiguousarray(pts), deep=True))
     poly = vtk.vtkPolyData()
-    poly.SetPoints(sourcePoints)
-    poly.SetPolys(sourcePolygons)
+    poly.SetPoints(vpts)
+    poly.SetPolys(polys)
     voro = Mesh(poly).alpha(0.5)
-    voro.info['cells'] = cells
-    voro.info['areas'] = areas
-    voro.info['volumes'] = volumes
+
+    faces = np.split(newid, np.cumsum(counts)[:-1])
+    fstarts = np.r_[0, np.cumsum(np.bincount(cellids, minlength=nc))]
+    keep = np.flatnonzero(~dropped)
+    voro.info['cells'] = [[f.tolist() for f in faces[fstarts[i]:fstarts[i+1]]] for i in keep]
+    voro.info['areas'] = areas[keep]
+    voro.info['volumes'] = volumes[keep]
     return voro
 
 
+def _voronoiScipy(nuclei, b):
+    # Voronoi cells clipped to the box b: the nuclei are mirrored across the 6 faces
+    # of the (slightly enlarged) box, so that the bisector planes with the mirrored
+    # points are the box faces. Returns the vertices and the faces as
+    # cell id of each face, face id of each entry and vertex ids.
+    from scipy.spatial import Voronoi
+    from itertools import chain
+    size = b[1::2] - b[::2]
+    eps = 1e-06 * np.linalg.norm(size)
+    lo, hi = b[::2] - eps, b[1::2] + eps
+    n = len(nuclei)
+    # only the nuclei close to a face need to be mirrored: try with a layer
+    # of a few average spacings, and mirror all of them if some cell leaks out
+    spacing = (np.prod(np.maximum(size, eps)) / n)**(1/3.)
+    for layer in (4 * spacing, np.inf):
+        allpts = [nuclei]
+        for i in range(3):
+            for bound in (lo[i], hi[i]):
+                m = nuclei[np.abs(nuclei[:, i] - bound) < layer].copy()
+                m[:, i] = 2 * bound - m[:, i]
+                allpts.append(m)
+        vor = Voronoi(np.concatenate(allpts))
+        regions = [vor.regions[r] for r in vor.point_region[:n]]
+        rverts = np.fromiter(chain.from_iterable(regions), dtype=np.int64)
+        if np.all(rverts >= 0):
+            v = vor.vertices[rverts]
+            if np.all((v >= lo - eps) & (v <= hi + eps)):
+                break
+
+    rp = vor.ridge_points
+    rv = vor.ridge_vertices
+    cellids, faceids, conn, nf = [], [], [], 0
+    for side in (0, 1):  # a face between two nuclei belongs to both cells
+        sel = np.flatnonzero(rp[:, side] < n)
+        rverts = [rv[j] for j in sel]
+        lens = np.fromiter(map(len, rverts), dtype=np.int64, count=len(rverts))
+        cellids.append(rp[sel, side])
+        faceids.append(np.repeat(np.arange(len(sel)) + nf, lens))
+        conn.append(np.fromiter(chain.from_iterable(rverts), dtype=np.int64))
+        nf += len(sel)
+    cellids = np.concatenate(cellids)
+    faceids = np.concatenate(faceids)
+    conn = np.concatenate(conn).astype(np.int64)
+    verts = vor.vertices
+
+    # order the vertices of each face by angle around its center
+    nfaces = len(cellids)
+    counts = np.bincount(faceids, minlength=nfaces)
+    center = np.c_[[np.bincount(faceids, weights=verts[conn, i], minlength=nfaces)
+                    for i in range(3)]].T / counts[:, np.newaxis]
+    # normal pointing out of the cell
+    pairs = np.concatenate([rp[rp[:, 0] < n], rp[rp[:, 1] < n][:, ::-1]])
+    normal = vor.points[pairs[:, 1]] - vor.points[pairs[:, 0]]
+    u = verts[conn[np.r_[0, np.cumsum(counts)[:-1]]]] - center
+    v = np.cross(normal, u)
+    d = verts[conn] - center[faceids]
+    ang = np.arctan2(np.einsum("ij,ij->i", d, v[faceids]), np.einsum("ij,ij->i", d, u[faceids]))
+    conn = conn[np.lexsort((ang, faceids))]
+    return verts, cellids, faceids, conn
+
+
+def _voronoiVoro(nuclei, b):
+    # run the voro++ executable in a private temporary directory
+    import os, subprocess, tempfile, shutil
+    from vtkplotter import settings
+    exe = os.path.join(settings.voro_path, 'voro++')
+    if not os.path.isfile(exe) and not shutil.which('voro++'):
+        colors.printc('Cannot find Voro++ installation in:', settings.voro_path, c=1)
+        colors.printc('Download and install Voro++ from http://math.lbl.gov/voro++/download', c=1)
+        colors.printc('Then set: settings.voro_path="path_to_voro++_executable"', c=1)
+        raise RuntimeError()
+    if not os.path.isfile(exe):
+        exe = shutil.which('voro++')
+
+    tmpdir = tempfile.mkdtemp(prefix="vtkplotter_voro_")
+    try:
+        fname = os.path.join(tmpdir, 'nuclei.txt')
+        np.savetxt(fname, np.c_[np.arange(len(nuclei)), nuclei], fmt=['%d', '%.17g', '%.17g', '%.17g'])
+        subprocess.run([exe, '-c', '%i %w %P %t', '-o'] + ['%.17g' % x for x in b] + [fname],
+                       check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        with open(fname + '.vol') as f:
+            lines = f.read().splitlines()
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    # lines: "id nverts (x,y,z) ... (i,j,k) ...", cell ids in input order with -o
+    verts, cellids, faceids, conn = [], [], [], []
+    nv = nf = 0
+    for l in lines:
+        ls = l.split()
+        ci, n = int(ls[0]), int(ls[1])
+        verts.append(np.array(" ".join(ls[2:n+2]).replace('(', '').replace(')', '')
+                              .replace(',', ' ').split(), dtype=float).reshape(-1, 3))
+        for fc in ls[n+2:]:
+            ids = [int(x) for x in fc[1:-1].split(',')]
+            conn.extend([i + nv for i in ids])
+            faceids.extend([nf] * len(ids))
+            cellids.append(ci)
+            nf += 1
+        nv += n
+    return (np.concatenate(verts), np.array(cellids, dtype=np.int64),
+            np.array(faceids, dtype=np.int64), np.array(conn, dtype=np.int64))
+
+
 def extractCellsByType(obj, types=(7,)):
     """Extract cells of a specified type.
 
@@ -1326,9 +1753,139 @@ def pointCloudFrom(obj, useCellData=False):
     return Mesh(poly, c=None)
 
 
+def _pointLocator(source):
+    # point locator of a dataset, cached on the dataset itself
+    # and rebuilt only when its points change
+    key = source.GetPoints().GetMTime()
+    cached = getattr(source, "_interpLocator", None)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    locator = vtk.vtkStaticPointLocator()
+    locator.SetDataSet(source)
+    locator.BuildLocator()
+    try:
+        source._interpLocator = (key, locator)
+    except AttributeError:
+        pass
+    return locator
+
+
+def _interpKernel(kernel, radius):
+    if kernel == 'shepard':
+        kern = vtk.vtkShepardKernel()
+        kern.SetPowerParameter(2)
+        kern.SetRadius(radius)
+    elif kernel == 'gaussian':
+        kern = vtk.vtkGaussianKernel()
+        kern.SetRadius(radius)
+    elif kernel == 'voronoi':
+        kern = vtk.vtkVoronoiKernel()
+    elif kernel == 'linear':
+        kern = vtk.vtkLinearKernel()
+        kern.SetRadius(radius)
+    else:
+        return None
+    return kern
+
+
+def _gridProbe(bounds, dims, k0, k1, structured):
+    # probe grid covering the z-slices k0 to k1 (excluded) of the full grid
+    delta = [(bounds[2*i+1]-bounds[2*i]) / (dims[i]-1) for i in range(3)]
+    nd = (dims[0], dims[1], k1-k0)
+    if not structured:
+        probe = vtk.vtkImageData()
+        probe.SetDimensions(nd)
+        probe.SetOrigin(bounds[0], bounds[2], bounds[4] + k0*delta[2])
+        probe.SetSpacing(delta)
+        return probe
+    xs = bounds[0] + np.arange(dims[0]) * delta[0]
+    ys = bounds[2] + np.arange(dims[1]) * delta[1]
+    zs = bounds[4] + np.arange(k0, k1) * delta[2]
+    z, y, x = np.meshgrid(zs, ys, xs, indexing='ij')
+    points = vtk.vtkPoints()
+    points.SetData(numpy_to_vtk(np.c_[x.ravel(), y.ravel(), z.ravel()], deep=False))
+    probe = vtk.vtkStructuredGrid()
+    probe.SetDimensions(nd)
+    probe.SetPoints(points)
+    return probe
+
+
+def _interpolate(source, locator, probe, kern, nullValue):
+    interpolator = vtk.vtkPointInterpolator()
+    interpolator.SetInputData(probe)
+    interpolator.SetSourceData(source)
+    interpolator.SetKernel(kern)
+    interpolator.SetLocator(locator)
+    if nullValue is not None:
+        interpolator.SetNullValue(nullValue)
+    else:
+        interpolator.SetNullPointsStrategyToClosestPoint()
+    interpolator.Update()
+    return interpolator.GetOutput()
+
+
+_interpFarm = dict()  # state of the worker processes of _interpolateGrid()
+
+def _interpFarmInit(polystring, kernel, radius, nullValue):
+    reader = vtk.vtkPolyDataReader()
+    reader.ReadFromInputStringOn()
+    reader.SetBinaryInputString(polystring, len(polystring))
+    reader.Update()
+    _interpFarm['source'] = reader.GetOutput()
+    _interpFarm['locator'] = _pointLocator(_interpFarm['source'])
+    _interpFarm['args'] = (kernel, radius, nullValue)
+
+def _interpFarmRun(job):
+    kernel, radius, nullValue = _interpFarm['args']
+    out = _interpolate(_interpFarm['source'], _interpFarm['locator'],
+                       _gridProbe(*job), _interpKernel(kernel, radius), nullValue)
+    pd = out.GetPointData()
+    return [(pd.GetArrayName(i), vtk_to_numpy(pd.GetArray(i)))
+            for i in range(pd.GetNumberOfArrays())]
+
+
+def _interpolateGrid(source, kernel, radius, bounds, nullValue, dims, structured, workers):
+    # interpolate the source point data on a regular grid,
+    # with workers>1 chunks of z-slices are interpolated in separate processes
+    if workers <= 1 or dims[2] < 2*workers:
+        return _interpolate(source, _pointLocator(source),
+                            _gridProbe(bounds, dims, 0, dims[2], structured),
+                            _interpKernel(kernel, radius), nullValue)
+
+    import multiprocessing
+    w = vtk.vtkPolyDataWriter()
+    w.SetInputData(source)
+    w.SetFileTypeToBinary()
+    w.WriteToOutputStringOn()
+    w.Write()
+    if hasattr(w, "GetOutputStdString"):
+        polystring = w.GetOutputStdString()
+    else:
+        polystring = w.GetBinaryOutputString()
+    ks = np.linspace(0, dims[2], min(dims[2], workers*4) + 1).astype(int)
+    jobs = [(bounds, dims, k0, k1, structured) for k0, k1 in zip(ks[:-1], ks[1:])]
+    pool = multiprocessing.Pool(workers, initializer=_interpFarmInit,
+                                initargs=(polystring, kernel, radius, nullValue))
+    try:
+        results = pool.map(_interpFarmRun, jobs)
+    finally:
+        pool.close()
+        pool.join()
+
+    out = _gridProbe(bounds, dims, 0, dims[2], structured)
+    for i, (name, _) in enumerate(results[0]):
+        arr = numpy_to_vtk(np.concatenate([r[i][1] for r in results]), deep=True)
+        arr.SetName(name)
+        out.GetPointData().AddArray(arr)
+    active = source.GetPointData().GetScalars()
+    if active is not None:
+        out.GetPointData().SetActiveScalars(active.GetName())
+    return out
+
+
 def interpolateToVolume(mesh, kernel='shepard', radius=None,
                        bounds=None, nullValue=None,
-                       dims=(20,20,20)):
+                       dims=(20,20,20), workers=1):
     """
     Generate a ``Volume`` by interpolating a scalar
     or vector field which is only known on a scattered set of points or mesh.
@@ -1339,6 +1896,9 @@ def interpolateToVolume(mesh, kernel='shepard', radius=None,
     :param list bounds: bounding box of the output Volume object
     :param list dims: dimensions of the output Volume object
     :param float nullValue: value to be assigned to invalid points
+    :param int workers: number of processes interpolating chunks of z-slices.
+
+    The point locator is cached on the input and reused by later calls.
 
     |interpolateVolume| |interpolateVolume.py|_
     """
@@ -1347,55 +1907,23 @@ def interpolateToVolume(mesh, kernel='shepard', radius=None,
     else:
         output = mesh.polydata()
 
-    # Create a probe volume
-    probe = vtk.vtkImageData()
-    probe.SetDimensions(dims)
     if bounds is None:
         bounds = output.GetBounds()
-    probe.SetOrigin(bounds[0],bounds[2],bounds[4])
-    probe.SetSpacing((bounds[1]-bounds[0])/(dims[0]-1),
-                     (bounds[3]-bounds[2])/(dims[1]-1),
-                     (bounds[5]-bounds[4])/(dims[2]-1))
 
     if radius is None:
         radius = min(bounds[1]-bounds[0], bounds[3]-bounds[2], bounds[5]-bounds[4])/3
 
-    locator = vtk.vtkPointLocator()
-    locator.SetDataSet(output)
-    locator.BuildLocator()
-
-    if kernel == 'shepard':
-        kern = vtk.vtkShepardKernel()
-        kern.SetPowerParameter(2)
-        kern.SetRadius(radius)
-    elif kernel == 'gaussian':
-        kern = vtk.vtkGaussianKernel()
-        kern.SetRadius(radius)
-    elif kernel == 'voronoi':
-        kern = vtk.vtkVoronoiKernel()
-    elif kernel == 'linear':
-        kern = vtk.vtkLinearKernel()
-        kern.SetRadius(radius)
-    else:
+    if _interpKernel(kernel, radius) is None:
         print('Error in interpolateToVolume, available kernels are:')
         print(' [shepard, gaussian, voronoi, linear]')
         raise RuntimeError()
 
-    interpolator = vtk.vtkPointInterpolator()
-    interpolator.SetInputData(probe)
-    interpolator.SetSourceData(output)
-    interpolator.SetKernel(kern)
-    interpolator.SetLocator(locator)
-    if nullValue is not None:
-        interpolator.SetNullValue(nullValue)
-    else:
-        interpolator.SetNullPointsStrategyToClosestPoint()
-    interpolator.Update()
-    return Volume(interpolator.GetOutput())
+    img = _interpolateGrid(output, kernel, radius, bounds, nullValue, dims, False, workers)
+    return Volume(img)
 
 
 def interpolateToStructuredGrid(mesh, kernel=None, radius=None,
-                               bounds=None, nullValue=None, dims=None):
+                               bounds=None, nullValue=None, dims=None, workers=1):
     """
     Generate a volumetric dataset (vtkStructuredData) by interpolating a scalar
     or vector field which is only known on a scattered set of points or mesh.
@@ -1406,6 +1934,9 @@ def interpolateToStructuredGrid(mesh, kernel=None, radius=None,
     :param list bounds: bounding box of the output vtkStructuredGrid object
     :param list dims: dimensions of the output vtkStructuredGrid object
     :param float nullValue: value to be assigned to invalid points
+    :param int workers: number of processes interpolating chunks of z-slices.
+
+    The point locator is cached on the input and reused by later calls.
     """
     if isinstance(mesh, vtk.vtkPolyData):
         output = mesh
@@ -1418,58 +1949,13 @@ def interpolateToStructuredGrid(mesh, kernel=None, radius=None,
     if bounds is None:
         bounds = output.GetBounds()
 
-    # Create a probe volume
-    probe = vtk.vtkStructuredGrid()
-    probe.SetDimensions(dims)
-
-    points = vtk.vtkPoints()
-    points.Allocate(dims[0] * dims[1] * dims[2])
-    deltaZ = (bounds[5]-bounds[4]) / (dims[2] - 1)
-    deltaY = (bounds[3]-bounds[2]) / (dims[1] - 1)
-    deltaX = (bounds[1]-bounds[0]) / (dims[0] - 1)
-    for k in range(dims[2]):
-        z = bounds[4] + k * deltaZ
-        kOffset = k * dims[0] * dims[1]
-        for j in range(dims[1]):
-            y = bounds[2] + j * deltaY
-            jOffset = j * dims[0]
-            for i  in range(dims[0]):
-                x = bounds[0] + i * deltaX
-                offset = i + jOffset + kOffset
-                points.InsertPoint(offset, [x,y,z])
-    probe.SetPoints(points)
-
     if radius is None:
         radius = min(bounds[1]-bounds[0], bounds[3]-bounds[2], bounds[5]-bounds[4])/3
 
-    locator = vtk.vtkPointLocator()
-    locator.SetDataSet(output)
-    locator.BuildLocator()
+    if _interpKernel(kernel, radius) is None:
+        kernel = 'shepard'
 
-    if kernel == 'gaussian':
-        kern = vtk.vtkGaussianKernel()
-        kern.SetRadius(radius)
-    elif kernel == 'voronoi':
-        kern = vtk.vtkVoronoiKernel()
-    elif kernel == 'linear':
-        kern = vtk.vtkLinearKernel()
-        kern.SetRadius(radius)
-    else:
-        kern = vtk.vtkShepardKernel()
-        kern.SetPowerParameter(2)
-        kern.SetRadius(radius)
-
-    interpolator = vtk.vtkPointInterpolator()
-    interpolator.SetInputData(probe)
-    interpolator.SetSourceData(output)
-    interpolator.SetKernel(kern)
-    interpolator.SetLocator(locator)
-    if nullValue is not None:
-        interpolator.SetNullValue(nullValue)
-    else:
-        interpolator.SetNullPointsStrategyToClosestPoint()
-    interpolator.Update()
-    return interpolator.GetOutput()
+    return _interpolateGrid(output, kernel, radius, bounds, nullValue, dims, True, workers)
 
 
 def rectilinearGridToTetrahedra(rgrid, tetraPerCell=6):
@@ -1580,19 +2066,11 @@ def streamLines(domain, probe,
         pts = probe
     else:
         pts = probe.clean().points()
-    src = vtk.vtkProgrammableSource()
-    def readPoints():
-        output = src.GetPolyDataOutput()
-        points = vtk.vtkPoints()
-        for x, y, z in pts:
-            points.InsertNextPoint(x, y, z)
-        output.SetPoints(points)
-    src.SetExecuteMethod(readPoints)
-    src.Update()
+    seeds = _pointCloud(pts)[0]
 
     st = vtk.vtkStreamTracer()
     st.SetInputDataObject(grid)
-    st.SetSourceConnection(src.GetOutputPort())
+    st.SetSourceData(seeds)
 
     st.SetInitialIntegrationStep(initialStepSize)
     st.SetComputeVorticity(computeVorticity)
@@ -1702,19 +2180,9 @@ def densifyCloud(mesh, targetDistance, closestN=6, radius=0, maxIter=None, maxN=
         Also, `maxN` can be set to limit the explosion of points.
         It is also recommended that a N closest neighborhood is used.
     """
-    src = vtk.vtkProgrammableSource()
-    def readPoints():
-        output = src.GetPolyDataOutput()
-        points = vtk.vtkPoints()
-        pts = mesh.points()
-        for p in pts:
-            x, y, z = p
-            points.InsertNextPoint(x, y, z)
-        output.SetPoints(points)
-    src.SetExecuteMethod(readPoints)
-
     dens = vtk.vtkDensifyPointCloudFilter()
-    dens.SetInputConnection(src.GetOutputPort())
+    # single precision points: vtkDensifyPointCloudFilter corrupts memory with doubles
+    dens.SetInputData(_pointCloud(mesh.points().astype(np.float32))[0])
     dens.InterpolateAttributeDataOn()
     dens.SetTargetDistance(targetDistance)
     if maxIter: dens.SetMaximumNumberOfIterations(maxIter)
@@ -1758,6 +2226,7 @@ def implicitModeller(mesh, distance=0.05, res=(110,40,20), bounds=(), maxdist=No
     return Mesh(poly, c='lb')
 
 
+@utils.cached
 def signedDistanceFromPointCloud(mesh, maxradius=None, bounds=None, dims=(20,20,20)):
     """
     Compute signed distances over a volume from an input point cloud.
@@ -1781,6 +2250,7 @@ def signedDistanceFromPointCloud(mesh, maxradius=None, bounds=None, dims=(20,20,
     return Volume(dist.GetOutput())
 
 
+@utils.cached
 def volumeFromMesh(mesh, bounds=None, dims=(20,20,20), signed=True, negate=False):
     """
     Compute signed distances over a volume from an input mesh.
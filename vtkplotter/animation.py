@@ -1,7 +1,7 @@
 from __future__ import division, print_function
 import numpy as np
 import vtkplotter.utils as utils
-from vtkplotter.utils import ProgressBar, linInterpolate
+from vtkplotter.utils import ProgressBar
 from vtkplotter.colors import printc, getColor
 import vtkplotter.docs as docs
 from vtkplotter.vtkio import Video
@@ -30,16 +30,23 @@ class Animation(Plotter):
     A ``Plotter`` derived class that allows to animate simultaneously various objects
     by specifying event times and durations of different visual effects.
 
+    Each effect is booked once as a time interval with its start and end values.
+    When calling ``play()`` the interpolated values of all effects are precomputed
+    for every output frame and the scene is rendered exactly once per frame.
+
     :param float totalDuration: expand or shrink the total duration of video to this value
-    :param float timeResolution: in seconds, save a frame at this rate
+    :param float timeResolution: in seconds, quantize the event times to this value
     :param bool showProgressBar: show the progressbar
     :param str videoFileName: output file name of the video
     :param int videoFPS: desired value of the nr of frames per second.
+    :param str videoBackend: backend used by ``Video`` to encode the frames.
+    :param bool offscreen: do not show the rendering window while producing the video.
     """
 
     def __init__(self, totalDuration=None, timeResolution=0.02, showProgressBar=True,
-                 videoFileName='animation.mp4', videoFPS=12):
-        Plotter.__init__(self)
+                 videoFileName='animation.mp4', videoFPS=12, videoBackend='ffmpeg',
+                 offscreen=False):
+        Plotter.__init__(self, offscreen=offscreen)
         self.verbose = False
         self.resetcam = True
 
@@ -49,6 +56,7 @@ class Animation(Plotter):
         self.showProgressBar = showProgressBar
         self.videoFileName = videoFileName
         self.videoFPS = videoFPS
+        self.videoBackend = videoBackend
         self.bookingMode = True
         self._inputvalues = []
         self._performers = []
@@ -88,8 +96,6 @@ class Animation(Plotter):
         nsteps =   int(duration/self.timeResolution+0.5)
         duration = nsteps*self.timeResolution
 
-        rng = np.linspace(t, t+duration, nsteps+1)
-
         self._lastT = t
         self._lastDuration = duration
         self._lastActs = objs2
@@ -98,7 +104,12 @@ class Animation(Plotter):
             if a not in self.actors:
                 self.actors.append(a)
 
-        return objs2, t, duration, rng
+        return objs2, t, duration
+
+    def _book(self, t, duration, action, acts, v0, v1, mode='linear'):
+        # mode can be 'linear', 'quadratic' or 'delta' (values are increments)
+        self.events.append((t, duration, action, acts,
+                            np.asarray(v0, dtype=float), np.asarray(v1, dtype=float), mode))
 
 
     def switchOn(self, acts=None, t=None, duration=None):
@@ -113,10 +124,8 @@ class Animation(Plotter):
     def fadeIn(self, acts=None, t=None, duration=None):
         """Gradually switch on the input list of meshes by increasing opacity."""
         if self.bookingMode:
-            acts, t, duration, rng = self._parse(acts, t, duration)
-            for tt in rng:
-                alpha = linInterpolate(tt, [t,t+duration], [0,1])
-                self.events.append((tt, self.fadeIn, acts, alpha))
+            acts, t, duration = self._parse(acts, t, duration)
+            self._book(t, duration, self.fadeIn, acts, 0, 1)
         else:
             for a in self._performers:
                 if a.alpha() >= self._inputvalues:
@@ -127,10 +136,8 @@ class Animation(Plotter):
     def fadeOut(self, acts=None, t=None, duration=None):
         """Gradually switch off the input list of meshes by increasing transparency."""
         if self.bookingMode:
-            acts, t, duration, rng = self._parse(acts, t, duration)
-            for tt in rng:
-                alpha = linInterpolate(tt, [t,t+duration], [1,0])
-                self.events.append((tt, self.fadeOut, acts, alpha))
+            acts, t, duration = self._parse(acts, t, duration)
+            self._book(t, duration, self.fadeOut, acts, 1, 0)
         else:
             for a in self._performers:
                 if a.alpha() <= self._inputvalues:
@@ -142,10 +149,8 @@ class Animation(Plotter):
     def changeAlphaBetween(self, alpha1, alpha2, acts=None, t=None, duration=None):
         """Gradually change transparency for the input list of meshes."""
         if self.bookingMode:
-            acts, t, duration, rng = self._parse(acts, t, duration)
-            for tt in rng:
-                alpha = linInterpolate(tt, [t,t+duration], [alpha1, alpha2])
-                self.events.append((tt, self.fadeOut, acts, alpha))
+            acts, t, duration = self._parse(acts, t, duration)
+            self._book(t, duration, self.changeAlphaBetween, acts, alpha1, alpha2)
         else:
             for a in self._performers:
                 a.alpha(self._inputvalues)
@@ -155,18 +160,10 @@ class Animation(Plotter):
     def changeColor(self,  c, acts=None, t=None, duration=None):
         """Gradually change color for the input list of meshes."""
         if self.bookingMode:
-            acts, t, duration, rng = self._parse(acts, t, duration)
-
-            col2 = getColor(c)
-            for tt in rng:
-                inputvalues = []
-                for a in acts:
-                    col1 = a.color()
-                    r = linInterpolate(tt, [t,t+duration], [col1[0], col2[0]])
-                    g = linInterpolate(tt, [t,t+duration], [col1[1], col2[1]])
-                    b = linInterpolate(tt, [t,t+duration], [col1[2], col2[2]])
-                    inputvalues.append((r,g,b))
-                self.events.append((tt, self.changeColor, acts, inputvalues))
+            acts, t, duration = self._parse(acts, t, duration)
+            col1 = [a.color() for a in acts]
+            col2 = [getColor(c)]*len(acts)
+            self._book(t, duration, self.changeColor, acts, col1, col2)
         else:
             for i,a in enumerate(self._performers):
                 a.color(self._inputvalues[i])
@@ -177,21 +174,13 @@ class Animation(Plotter):
         """Gradually change backface color for the input list of meshes.
         An initial backface color should be set in advance."""
         if self.bookingMode:
-            acts, t, duration, rng = self._parse(acts, t, duration)
-
-            col2 = getColor(c)
-            for tt in rng:
-                inputvalues = []
-                for a in acts:
-                    if a.GetBackfaceProperty():
-                        col1 = a.backColor()
-                        r = linInterpolate(tt, [t,t+duration], [col1[0], col2[0]])
-                        g = linInterpolate(tt, [t,t+duration], [col1[1], col2[1]])
-                        b = linInterpolate(tt, [t,t+duration], [col1[2], col2[2]])
-                        inputvalues.append((r,g,b))
-                    else:
-                        inputvalues.append(None)
-                self.events.append((tt, self.changeBackColor, acts, inputvalues))
+            acts, t, duration = self._parse(acts, t, duration)
+            acts = [a for a in acts if a.GetBackfaceProperty()]
+            if not acts:
+                return self
+            col1 = [a.backColor() for a in acts]
+            col2 = [getColor(c)]*len(acts)
+            self._book(t, duration, self.changeBackColor, acts, col1, col2)
         else:
             for i,a in enumerate(self._performers):
                 a.backColor(self._inputvalues[i])
@@ -201,34 +190,30 @@ class Animation(Plotter):
     def changeToWireframe(self, acts=None, t=None):
         """Switch representation to wireframe for the input list of meshes at time `t`."""
         if self.bookingMode:
-            acts, t, duration, rng = self._parse(acts, t, None)
-            self.events.append((t, self.changeToWireframe, acts, True))
+            acts, t, _ = self._parse(acts, t, None)
+            self._book(t, 0, self.changeToWireframe, acts, 1, 1)
         else:
             for a in self._performers:
-                a.wireframe(self._inputvalues)
+                a.wireframe(True)
         return self
 
     def changeToSurface(self, acts=None, t=None):
         """Switch representation to surface for the input list of meshes at time `t`."""
         if self.bookingMode:
-            acts, t, duration, rng = self._parse(acts, t, None)
-            self.events.append((t, self.changeToSurface, acts, False))
+            acts, t, _ = self._parse(acts, t, None)
+            self._book(t, 0, self.changeToSurface, acts, 0, 0)
         else:
             for a in self._performers:
-                a.wireframe(self._inputvalues)
+                a.wireframe(False)
         return self
 
 
     def changeLineWidth(self, lw, acts=None, t=None, duration=None):
         """Gradually change line width of the mesh edges for the input list of meshes."""
         if self.bookingMode:
-            acts, t, duration, rng = self._parse(acts, t, duration)
-            for tt in rng:
-                inputvalues = []
-                for a in acts:
-                    newlw = linInterpolate(tt, [t,t+duration], [a.lw(), lw])
-                    inputvalues.append(newlw)
-                self.events.append((tt, self.changeLineWidth, acts, inputvalues))
+            acts, t, duration = self._parse(acts, t, duration)
+            lw1 = [a.lw() for a in acts]
+            self._book(t, duration, self.changeLineWidth, acts, lw1, [lw]*len(acts))
         else:
             for i,a in enumerate(self._performers):
                 a.lw(self._inputvalues[i])
@@ -238,17 +223,10 @@ class Animation(Plotter):
     def changeLineColor(self, c, acts=None, t=None, duration=None):
         """Gradually change line color of the mesh edges for the input list of meshes."""
         if self.bookingMode:
-            acts, t, duration, rng = self._parse(acts, t, duration)
-            col2 = getColor(c)
-            for tt in rng:
-                inputvalues = []
-                for a in acts:
-                    col1 = a.lineColor()
-                    r = linInterpolate(tt, [t,t+duration], [col1[0], col2[0]])
-                    g = linInterpolate(tt, [t,t+duration], [col1[1], col2[1]])
-                    b = linInterpolate(tt, [t,t+duration], [col1[2], col2[2]])
-                    inputvalues.append((r,g,b))
-                self.events.append((tt, self.changeLineColor, acts, inputvalues))
+            acts, t, duration = self._parse(acts, t, duration)
+            col1 = [a.lineColor() for a in acts]
+            col2 = [getColor(c)]*len(acts)
+            self._book(t, duration, self.changeLineColor, acts, col1, col2)
         else:
             for i,a in enumerate(self._performers):
                 a.lineColor(self._inputvalues[i])
@@ -261,31 +239,23 @@ class Animation(Plotter):
         Allowed styles are: [metallic, plastic, shiny, glossy, default].
         """
         if self.bookingMode:
-            acts, t, duration, rng = self._parse(acts, t, duration)
-
-            c = (1,1,0.99)
-            if   style=='metallic': pars = [0.1, 0.3, 1.0, 10, c]
-            elif style=='plastic' : pars = [0.3, 0.4, 0.3,  5, c]
-            elif style=='shiny'   : pars = [0.2, 0.6, 0.8, 50, c]
-            elif style=='glossy'  : pars = [0.1, 0.7, 0.9, 90, c]
-            elif style=='default' : pars = [0.1, 1.0, 0.05, 5, c]
+            acts, t, duration = self._parse(acts, t, duration)
+
+            if   style=='metallic': pars = [0.1, 0.3, 1.0, 10]
+            elif style=='plastic' : pars = [0.3, 0.4, 0.3,  5]
+            elif style=='shiny'   : pars = [0.2, 0.6, 0.8, 50]
+            elif style=='glossy'  : pars = [0.1, 0.7, 0.9, 90]
+            elif style=='default' : pars = [0.1, 1.0, 0.05, 5]
             else:
                 printc('Unknown lighting style:', [style], c=1)
+                return self
 
-            for tt in rng:
-                inputvalues = []
-                for a in acts:
-                    pr = a.GetProperty()
-                    aa = pr.GetAmbient()
-                    ad = pr.GetDiffuse()
-                    asp = pr.GetSpecular()
-                    aspp = pr.GetSpecularPower()
-                    naa  = linInterpolate(tt, [t,t+duration], [aa,  pars[0]])
-                    nad  = linInterpolate(tt, [t,t+duration], [ad,  pars[1]])
-                    nasp = linInterpolate(tt, [t,t+duration], [asp, pars[2]])
-                    naspp= linInterpolate(tt, [t,t+duration], [aspp,pars[3]])
-                    inputvalues.append((naa, nad, nasp, naspp))
-                self.events.append((tt, self.changeLighting, acts, inputvalues))
+            vals1 = []
+            for a in acts:
+                pr = a.GetProperty()
+                vals1.append((pr.GetAmbient(), pr.GetDiffuse(),
+                              pr.GetSpecular(), pr.GetSpecularPower()))
+            self._book(t, duration, self.changeLighting, acts, vals1, [pars]*len(acts))
         else:
             for i,a in enumerate(self._performers):
                 pr = a.GetProperty()
@@ -298,23 +268,16 @@ class Animation(Plotter):
 
 
     def move(self, act=None, pt=(0,0,0), t=None, duration=None, style='linear'):
-        """Smoothly change the position of a specific object to a new point in space."""
+        """Smoothly change the position of a specific object to a new point in space.
+
+        :param str style: either `'linear'` or `'quadratic'` (accelerating motion).
+        """
         if self.bookingMode:
-            acts, t, duration, rng = self._parse(act, t, duration)
+            acts, t, duration = self._parse(act, t, duration)
             if len(acts) != 1:
                 printc('Error in move(), can move only one object.', c=1)
-            cpos = acts[0].pos()
-            pt = np.array(pt)
-            dv = (pt - cpos)/len(rng)
-            for j,tt in enumerate(rng):
-                i = j+1
-                if 'quad' in style:
-                    x = i/len(rng)
-                    y = x*x
-                    #print(x,y)
-                    self.events.append((tt, self.move, acts, cpos+dv*i*y))
-                else:
-                    self.events.append((tt, self.move, acts, cpos+dv*i))
+            mode = 'quadratic' if 'quad' in style else 'linear'
+            self._book(t, duration, self.move, acts, acts[0].pos(), pt, mode)
         else:
             self._performers[0].pos(self._inputvalues)
         return self
@@ -323,33 +286,34 @@ class Animation(Plotter):
     def rotate(self, act=None, axis=(1,0,0), angle=0, t=None, duration=None):
         """Smoothly rotate a specific object by a specified angle and axis."""
         if self.bookingMode:
-            acts, t, duration, rng = self._parse(act, t, duration)
+            acts, t, duration = self._parse(act, t, duration)
             if len(acts) != 1:
                 printc('Error in rotate(), can move only one object.', c=1)
-            for tt in rng:
-                ang = angle/len(rng)
-                self.events.append((tt, self.rotate, acts, (axis, ang)))
+            self._book(t, duration, self.rotate, acts, 0, angle, 'delta')
+            self.events[-1] += (axis,)
         else:
-            ax = self._inputvalues[0]
+            ax, ang = self._inputvalues
             if   ax == 'x':
-                self._performers[0].rotateX(self._inputvalues[1])
+                self._performers[0].rotateX(ang)
             elif ax == 'y':
-                self._performers[0].rotateY(self._inputvalues[1])
+                self._performers[0].rotateY(ang)
             elif ax == 'z':
-                self._performers[0].rotateZ(self._inputvalues[1])
+                self._performers[0].rotateZ(ang)
+            else:
+                self._performers[0].rotate(ang, ax)
         return self
 
 
     def scale(self, acts=None, factor=1, t=None, duration=None):
         """Smoothly scale a specific object to a specified scale factor."""
         if self.bookingMode:
-            acts, t, duration, rng = self._parse(acts, t, duration)
-            for tt in rng:
-                fac = linInterpolate(tt, [t,t+duration], [1, factor])
-                self.events.append((tt, self.scale, acts, fac))
+            acts, t, duration = self._parse(acts, t, duration)
+            s1 = [a.GetScale() for a in acts]
+            s2 = [np.multiply(a.GetScale(), factor) for a in acts]
+            self._book(t, duration, self.scale, acts, s1, s2)
         else:
-            for a in self._performers:
-                a.scale(self._inputvalues)
+            for i,a in enumerate(self._performers):
+                a.SetScale(self._inputvalues[i])
         return self
 
 
@@ -358,7 +322,7 @@ class Animation(Plotter):
         of the bounding box.
         """
         if self.bookingMode:
-            acts, t, duration, rng = self._parse(act, t, duration)
+            acts, t, duration = self._parse(act, t, duration)
             if len(acts) != 1:
                 printc('Error in meshErode(), can erode only one object.', c=1)
             diag = acts[0].diagonalSize()
@@ -367,15 +331,15 @@ class Animation(Plotter):
                         (x0,y0,z1), (x1,y0,z1), (x1,y1,z1), (x0,y1,z1) ]
             pcl = acts[0].closestPoint(corners[corner])
             dmin = np.linalg.norm(pcl - corners[corner])
-            for tt in rng:
-                d = linInterpolate(tt, [t,t+duration], [dmin, diag*1.01])
-                if d>0:
-                    ids = acts[0].closestPoint(corners[corner],
-                                               radius=d, returnIds=True)
-                    if len(ids) <= acts[0].N():
-                        self.events.append((tt, self.meshErode, acts, ids))
+            self._book(t, duration, self.meshErode, acts, dmin, diag*1.01)
+            self.events[-1] += (corners[corner],)
         else:
-            self._performers[0].deletePoints(self._inputvalues)
+            crn, d = self._inputvalues
+            if d > 0:
+                msh = self._performers[0]
+                ids = msh.closestPoint(crn, radius=d, returnIds=True)
+                if len(ids) <= msh.N():
+                    msh.deletePoints(ids)
         return self
 
 
@@ -389,77 +353,124 @@ class Animation(Plotter):
                     printc("Error in moveCamera(), no camera exists.")
                     return
                 camstart = self.camera
-            acts, t, duration, rng = self._parse(None, t, duration)
-            p1 = np.array(camstart.GetPosition())
-            f1 = np.array(camstart.GetFocalPoint())
-            v1 = np.array(camstart.GetViewUp())
-            c1 = np.array(camstart.GetClippingRange())
-            s1 = camstart.GetDistance()
-
-            p2 = np.array(camstop.GetPosition())
-            f2 = np.array(camstop.GetFocalPoint())
-            v2 = np.array(camstop.GetViewUp())
-            c2 = np.array(camstop.GetClippingRange())
-            s2 = camstop.GetDistance()
-            for tt in rng:
-                np1 = linInterpolate(tt, [t,t+duration], [p1,p2])
-                nf1 = linInterpolate(tt, [t,t+duration], [f1,f2])
-                nv1 = linInterpolate(tt, [t,t+duration], [v1,v2])
-                nc1 = linInterpolate(tt, [t,t+duration], [c1,c2])
-                ns1 = linInterpolate(tt, [t,t+duration], [s1,s2])
-                inps = (np1, nf1, nv1, nc1, ns1)
-                self.events.append((tt, self.moveCamera, acts, inps))
+            acts, t, duration = self._parse(None, t, duration)
+            cams = []
+            for cm in (camstart, camstop):
+                cams.append(np.concatenate([cm.GetPosition(), cm.GetFocalPoint(),
+                                            cm.GetViewUp(), cm.GetClippingRange(),
+                                            [cm.GetDistance()]]))
+            self._book(t, duration, self.moveCamera, acts, cams[0], cams[1])
         else:
             if not self.camera:
                 return
-            np1, nf1, nv1, nc1, ns1 = self._inputvalues
-            self.camera.SetPosition(np1)
-            self.camera.SetFocalPoint(nf1)
-            self.camera.SetViewUp(nv1)
-            self.camera.SetClippingRange(nc1)
-            self.camera.SetDistance(ns1)
+            v = self._inputvalues
+            self.camera.SetPosition(v[0:3])
+            self.camera.SetFocalPoint(v[3:6])
+            self.camera.SetViewUp(v[6:9])
+            self.camera.SetClippingRange(v[9:11])
+            self.camera.SetDistance(v[11])
+
+
+    def _buildTimeline(self, nframes, ftimes):
+        """Precompute the interpolated values of all booked events at the frame times.
+        Return a list which holds for each frame the list of (action, acts, value)."""
+        timeline = [[] for _ in range(nframes)]
+        for e in self.events:
+            t, duration, action, acts, v0, v1, mode = e[:7]
+            extra = e[7] if len(e) > 7 else None
+
+            i0 = np.searchsorted(ftimes, t - self.eps)
+            i1 = np.searchsorted(ftimes, t + duration - self.eps)
+            if i0 >= nframes:
+                continue
+            idx = np.arange(i0, min(i1, nframes-1)+1)
+            if duration > 0:
+                x = np.clip((ftimes[idx] - t) / duration, 0, 1)
+            else:
+                x = np.ones(len(idx))
+            if mode == 'quadratic':
+                x = x*x
+            if mode == 'delta':
+                vals = np.multiply.outer(np.diff(np.concatenate([[0], x])), v1 - v0)
+            else:
+                vals = v0 + np.multiply.outer(x, v1 - v0)
 
+            for i, v in zip(idx, vals):
+                if extra is None:
+                    timeline[i].append((action, acts, v))
+                else:
+                    timeline[i].append((action, acts, (extra, v)))
+        return timeline
 
-    def play(self):
-        """Play the internal list of events and save a video."""
+    def _applyFrame(self, changes):
+        for action, self._performers, self._inputvalues in changes:
+            action(0, 0)
 
-        self.events = sorted(self.events, key=lambda x: x[0])
-        self.bookingMode = False
+    def play(self, realtime=False):
+        """Play the internal list of events and save a video.
 
-        for a in self.actors: a.alpha(0)
+        :param bool realtime: preview the animation in real time on screen,
+            frames that cannot be rendered in time are dropped and no video is saved.
+        """
+        if not self.events:
+            printc('Animation.play(): no events were booked.', c=1)
+            return self
 
-        if self.showProgressBar:
-            pb = ProgressBar(0, len(self.events), c='g')
+        self.bookingMode = False
 
+        tend = max([e[0]+e[1] for e in self.events])
         if self.totalDuration is None:
-            self.totalDuration = self.events[-1][0] - self.events[0][0]
-        vd = Video(self.videoFileName, fps=self.videoFPS, duration=self.totalDuration)
+            self.totalDuration = tend
+        tscale = tend / self.totalDuration if self.totalDuration else 1
 
-        ttlast=0
-        for e in self.events:
-
-            tt, action, self._performers, self._inputvalues = e
-            action(0,0)
-
-            dt = tt-ttlast
-            if dt > self.eps:
-                self.show(interactive=False, resetcam=self.resetcam)
-                vd.addFrame()
+        fps = float(self.videoFPS)
+        nframes = int(self.totalDuration * fps + 0.5) + 1
+        ftimes = np.arange(nframes) / fps * tscale # in units of the event times
 
-                if dt > self.timeResolution+self.eps:
-                    vd.pause(dt)
+        timeline = self._buildTimeline(nframes, ftimes)
 
-            ttlast = tt
-
-            if self.showProgressBar:
-                pb.print('t='+str(int(tt*100)/100)+'s,  '+action.__name__)
+        for a in self.actors: a.alpha(0)
 
         self.show(interactive=False, resetcam=self.resetcam)
-        vd.addFrame()
 
-        vd.close()
-        self.show(interactive=True, resetcam=self.resetcam)
+        if self.showProgressBar:
+            pb = ProgressBar(0, nframes, c='g')
+
+        if realtime:
+            import time
+            t0 = time.time()
+            iframe = 0
+            while iframe < nframes:
+                target = min(int((time.time()-t0) * fps), nframes-1)
+                while iframe <= target:  # apply changes of dropped frames too
+                    self._applyFrame(timeline[iframe])
+                    iframe += 1
+                if self.resetcam:
+                    self.renderer.ResetCamera()
+                self.window.Render()
+                if self.showProgressBar:
+                    pb.print('t='+str(int(ftimes[iframe-1]*100)/100)+'s')
+                if self.allowInteraction:
+                    self.allowInteraction()
+                wait = iframe/fps - (time.time()-t0)
+                if wait > 0:
+                    time.sleep(wait)
+        else:
+            vd = Video(self.videoFileName, fps=fps, backend=self.videoBackend)
+            for i in range(nframes):
+                self._applyFrame(timeline[i])
+                if self.resetcam:
+                    self.renderer.ResetCamera()
+                self.window.Render()
+                vd.addFrame()
+                if self.showProgressBar:
+                    pb.print('t='+str(int(ftimes[i]*100)/100)+'s')
+            vd.close()
+
         self.bookingMode = True
+        if not self.offscreen:
+            self.show(interactive=True, resetcam=self.resetcam)
+        return self
 
 
 
@@ -53,6 +53,7 @@ class ActorBase(object):
         self.flagText = None
         self._mapper = None
         self.transform = None
+        self._lod = None  # levels of detail, see lod()
 
     def mapper(self, newMapper=None):
         """Return the ``vtkMapper`` data object, or update it with a new one."""
@@ -163,6 +164,36 @@ class ActorBase(object):
         return show(self, **options)
 
 
+    def lodInfo(self):
+        """
+        Return a list with one dictionary per level of detail (full resolution first)
+        with keys `fraction`, `points`, `cells` and `memory` (in MB).
+        The `fraction` of a level is its number of points (the vertices of a mesh,
+        the voxels of a volume) relative to the full resolution data.
+        Levels still under construction are not listed.
+        """
+        data = [(1.0, self._lodData()[0])]
+        if self._lod:
+            data += list(self._lod["levels"])
+        return [dict(fraction=f, points=d.GetNumberOfPoints(), cells=d.GetNumberOfCells(),
+                     memory=d.GetActualMemorySize() / 1024.0) for f, d in data]
+
+    def _lodSelect(self, fraction):
+        # render the finest level of detail with at most the given fraction of the
+        # points of the full resolution (all of it if None), return the rendered fraction
+        data, key = self._lodData()
+        used = 1.0
+        if fraction is not None and fraction < 1 and self._lod["key"] == key:
+            for f, d in self._lod["levels"]:  # from fine to coarse
+                data, used = d, f
+                if f <= fraction:
+                    break
+        if self._mapper.GetInput() is not data:
+            self._mapper.SetInputData(data)
+        self._lod["fraction"] = used
+        return used
+
+
     def N(self):
         """Retrieve number of points. Shortcut for `NPoints()`."""
         return self.inputdata().GetNumberOfPoints()
@@ -0,0 +1,444 @@
+from __future__ import division, print_function
+
+import os
+import json
+import numpy as np
+import vtk
+import vtkplotter.colors as colors
+import vtkplotter.docs as docs
+import vtkplotter.utils as utils
+from vtk.util.numpy_support import numpy_to_vtk, vtk_to_numpy
+from vtkplotter.volume import Volume
+from vtkplotter.mesh import Mesh
+
+__doc__ = (
+    """
+Submodule to handle volumetric datasets too large to fit in memory.
+"""
+    + docs._defs
+)
+
+__all__ = ["BrickedVolume"]
+
+
+_metTypes = {"MET_CHAR": "i1", "MET_UCHAR": "u1", "MET_SHORT": "i2", "MET_USHORT": "u2",
+             "MET_INT": "i4", "MET_UINT": "u4", "MET_LONG": "i8", "MET_ULONG": "u8",
+             "MET_FLOAT": "f4", "MET_DOUBLE": "f8"}
+
+
+def _mhdMemmap(filename):
+    # map the raw data of an uncompressed .mhd file, without reading it
+    header = dict()
+    with open(filename, "rb") as f:
+        for line in f:
+            key, _, value = line.decode("latin-1").partition("=")
+            header[key.strip()] = value.strip()
+            if key.strip() == "ElementDataFile":
+                local_offset = f.tell()
+                break
+    if header.get("CompressedData", "False").lower() == "true":
+        return None
+    if int(header.get("ElementNumberOfChannels", 1)) != 1 or int(header.get("NDims", 3)) != 3:
+        return None
+    dims = [int(d) for d in header["DimSize"].split()]
+    msb = header.get("BinaryDataByteOrderMSB", header.get("ElementByteOrderMSB", "False"))
+    dtype = np.dtype((">" if msb.lower() == "true" else "<") + _metTypes[header["ElementType"]])
+    datafile = header["ElementDataFile"]
+    if datafile == "LOCAL":
+        datafile, offset = filename, local_offset
+    else:
+        datafile = os.path.join(os.path.dirname(filename), datafile)
+        offset = int(header.get("HeaderSize", 0))
+        if offset < 0:
+            offset = os.path.getsize(datafile) - int(np.prod(dims)) * dtype.itemsize
+    arr = np.memmap(datafile, dtype=dtype, mode="r", offset=offset, shape=tuple(dims[::-1]))
+    spacing = [float(s) for s in header.get("ElementSpacing", "1 1 1").split()]
+    origin = [float(s) for s in header.get("Offset", header.get("Origin", "0 0 0")).split()]
+    return arr.transpose(2, 1, 0), spacing, origin  # indexed as [x,y,z]
+
+
+class _SliceStack(object):
+    # a list of 2D image files seen as a 3D array indexed as [x,y,z],
+    # the planes are read only when needed and the last slab is kept in memory
+    def __init__(self, filenames):
+        self.filenames = filenames
+        p = self._plane(0)
+        self.shape = (p.shape[0], p.shape[1], len(filenames))
+        self.dtype = p.dtype
+        self._slab = (None, None)
+
+    def _plane(self, k):
+        reader = vtk.vtkImageReader2Factory.CreateImageReader2(self.filenames[k])
+        if reader is None:
+            colors.printc("~times Cannot read image file", self.filenames[k], c=1)
+            raise RuntimeError()
+        reader.SetFileName(self.filenames[k])
+        reader.Update()
+        img = reader.GetOutput()
+        nx, ny = img.GetDimensions()[:2]
+        arr = vtk_to_numpy(img.GetPointData().GetScalars())
+        if arr.ndim > 1:
+            arr = arr[:, 0]
+        return arr.reshape(ny, nx).T
+
+    def __getitem__(self, index):
+        sx, sy, sz = index
+        key = (sz.start, sz.stop)
+        if self._slab[0] != key:
+            self._slab = (key, np.stack([self._plane(k) for k in range(*sz.indices(self.shape[2]))], axis=2))
+        return self._slab[1][sx, sy]
+
+
+def _asArray(source):
+    # return an array-like object indexed as [x,y,z], its spacing and origin
+    if isinstance(source, Volume):
+        source = source.imagedata()
+    if isinstance(source, vtk.vtkImageData):
+        arr = vtk_to_numpy(source.GetPointData().GetScalars())
+        return arr.reshape(source.GetDimensions(), order="F"), source.GetSpacing(), source.GetOrigin()
+    if isinstance(source, str):
+        if os.path.isdir(source):
+            source = [os.path.join(source, f) for f in os.listdir(source)]
+        elif source.lower().endswith(".mhd"):
+            mapped = _mhdMemmap(source)
+            if mapped is not None:
+                return mapped
+        elif "*" in source:
+            import glob
+            source = glob.glob(source)
+        if isinstance(source, str):  # read it all, the format cannot be mapped
+            from vtkplotter.vtkio import load
+            return _asArray(load(source))
+    if isinstance(source, (list, tuple)) and isinstance(source[0], str):
+        source = list(source)
+        utils.humansort(source)
+        return _SliceStack(source), None, None
+    if not hasattr(source, "shape"):  # e.g. nested lists
+        source = np.asarray(source)
+    return source, None, None
+
+
+##########################################################################
+class BrickedVolume(object):
+    """
+    A volumetric dataset stored on disk as a multi-resolution pyramid of bricks.
+    Only the bricks needed by each operation are read from disk.
+
+    The pyramid is built once in directory `path` from `source`, and reopened later
+    by just passing the `path`. Level 0 is the full resolution, each further level
+    halves the resolution along each axis, the coarsest one fits a single brick.
+    Each level is a ``.npy`` file where each brick of `brickSize`^3 voxels is stored
+    contiguously, so it can be mapped in memory with ``numpy.load(mmap_mode='r')``.
+
+    :param str path: directory of the pyramid.
+    :param source: the data to convert. Can be a numpy array indexed as [x,y,z]
+        (possibly a ``numpy.memmap``, or any array-like object supporting slicing,
+        like a `h5py` or `zarr` dataset), a ``Volume``, a ``vtkImageData``,
+        a `.mhd` file (uncompressed data are read without loading them in memory),
+        a list, a directory or a glob pattern of 2D image files (one per z-plane),
+        or any other file readable by ``load()``.
+    :param int brickSize: size of the bricks in voxels.
+    :param list spacing: voxel sizes, by default taken from the source or (1,1,1).
+    :param list origin: position of the first voxel, by default taken from the source.
+
+    :Example:
+        .. code-block:: python
+
+            from vtkplotter import *
+            bv = BrickedVolume('embryo_pyramid', source='embryo_stack/*.tif')
+            print(bv.levels(), bv.shape())
+            vol = bv.crop(VOI=(1000,1500, 2000,2300, 400,600))  # a Volume of the region
+            iso = bv.isosurface(80, VOI=(1000,1500, 2000,2300, 400,600))
+            plt = Plotter()
+            plt.show(bv.viewVolume(plt), iso)  # reloads the visible region at the right level
+    """
+
+    def __init__(self, path, source=None, brickSize=64, spacing=None, origin=None):
+        self.path = path
+        self.loadedBricks = 0  # nr of bricks read from disk so far
+        self._mmaps = dict()
+        if source is not None:
+            self._build(source, brickSize, spacing, origin)
+        if not os.path.isfile(os.path.join(path, "pyramid.json")):
+            colors.printc("~times BrickedVolume(): no pyramid found in", path, c=1)
+            raise RuntimeError()
+        with open(os.path.join(path, "pyramid.json")) as f:
+            self.header = json.load(f)
+        self.brickSize = self.header["brickSize"]
+        self.dtype = np.dtype(self.header["dtype"])
+
+    def _build(self, source, B, spacing, origin):
+        arr, sp, org = _asArray(source)
+        if len(arr.shape) != 3:
+            colors.printc("~times BrickedVolume(): source must be 3D, shape is", arr.shape, c=1)
+            raise RuntimeError()
+        if spacing is None:
+            spacing = sp if sp is not None else (1, 1, 1)
+        if origin is None:
+            origin = org if org is not None else (0, 0, 0)
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+
+        shapes = [np.array(arr.shape, dtype=np.int64)]
+        while shapes[-1].max() > B:
+            shapes.append((shapes[-1] + 1) // 2)
+        header = dict(version=1, brickSize=B, dtype=np.dtype(arr.dtype).str,
+                      spacing=[float(s) for s in spacing], origin=[float(o) for o in origin],
+                      shapes=[s.tolist() for s in shapes])
+
+        # level 0: copy the source one row of bricks at a time
+        mm = self._create(0, shapes[0], B, arr.dtype)
+        nb = mm.shape[:3]
+        pb = utils.ProgressBar(0, sum((s[2] + B - 1) // B for s in shapes))
+        for k in range(nb[2]):
+            for j in range(nb[1]):
+                z0, z1 = k*B, min((k+1)*B, shapes[0][2])
+                y0, y1 = j*B, min((j+1)*B, shapes[0][1])
+                row = np.asarray(arr[:, y0:y1, z0:z1])
+                for i in range(nb[0]):
+                    x0, x1 = i*B, min((i+1)*B, shapes[0][0])
+                    mm[i, j, k, :x1-x0, :y1-y0, :z1-z0] = row[x0:x1]
+            pb.print("building level 0")
+        mm.flush()
+
+        # further levels: average 2x2x2 voxels of the previous one, brick by brick
+        self.header, self.brickSize, self.dtype = header, B, np.dtype(arr.dtype)
+        for l in range(1, len(shapes)):
+            mm = self._create(l, shapes[l], B, arr.dtype)
+            for k in range(mm.shape[2]):
+                for j in range(mm.shape[1]):
+                    for i in range(mm.shape[0]):
+                        lo = np.array([i, j, k]) * 2 * B
+                        hi = np.minimum(lo + 2*B, shapes[l-1])
+                        block = self._read(l-1, lo, hi).astype(np.float32)
+                        pad = [(0, s % 2) for s in block.shape]
+                        block = np.pad(block, pad, mode="edge")
+                        sx, sy, sz = np.array(block.shape) // 2
+                        block = block.reshape(sx, 2, sy, 2, sz, 2).mean(axis=(1, 3, 5))
+                        if self.dtype.kind in "iub":
+                            block = np.rint(block)
+                        mm[i, j, k, :sx, :sy, :sz] = block.astype(self.dtype)
+                pb.print("building level " + str(l))
+            mm.flush()
+        self._mmaps.clear()
+        self.loadedBricks = 0
+
+        with open(os.path.join(self.path, "pyramid.json"), "w") as f:
+            json.dump(header, f)
+
+    def _create(self, level, shape, B, dtype):
+        nb = (np.asarray(shape) + B - 1) // B
+        fname = os.path.join(self.path, "level%d.npy" % level)
+        mm = np.lib.format.open_memmap(fname, mode="w+", dtype=dtype,
+                                       shape=tuple(nb.tolist()) + (B, B, B))
+        self._mmaps[level] = mm
+        return mm
+
+    def _bricks(self, level):
+        if level not in self._mmaps:
+            fname = os.path.join(self.path, "level%d.npy" % level)
+            self._mmaps[level] = np.load(fname, mmap_mode="r")
+        return self._mmaps[level]
+
+    def _read(self, level, lo, hi):
+        # voxels [lo, hi) of a level, reading only the bricks which intersect them
+        B = self.brickSize
+        lo, hi = np.asarray(lo, dtype=np.int64), np.asarray(hi, dtype=np.int64)
+        mm = self._bricks(level)
+        out = np.empty(hi - lo, dtype=self.dtype)
+        b0, b1 = lo // B, (hi - 1) // B + 1
+        for i in range(b0[0], b1[0]):
+            for j in range(b0[1], b1[1]):
+                for k in range(b0[2], b1[2]):
+                    start = np.array([i, j, k]) * B
+                    s = np.maximum(lo, start)
+                    e = np.minimum(hi, start + B)
+                    out[s[0]-lo[0]:e[0]-lo[0], s[1]-lo[1]:e[1]-lo[1], s[2]-lo[2]:e[2]-lo[2]] = \
+                        mm[i, j, k, s[0]-start[0]:e[0]-start[0],
+                                    s[1]-start[1]:e[1]-start[1],
+                                    s[2]-start[2]:e[2]-start[2]]
+                    self.loadedBricks += 1
+        return out
+
+    def levels(self):
+        """Return the number of resolution levels."""
+        return len(self.header["shapes"])
+
+    def shape(self, level=0):
+        """Return the number of voxels along x, y and z at a given level."""
+        return tuple(self.header["shapes"][level])
+
+    def spacing(self, level=0):
+        """Return the voxel sizes at a given level."""
+        return tuple(float(s) * 2**level for s in self.header["spacing"])
+
+    def origin(self, level=0):
+        """Return the position of the first voxel at a given level."""
+        sp = np.array(self.header["spacing"])
+        return tuple((np.array(self.header["origin"]) + (2**level - 1) / 2.0 * sp).tolist())
+
+    def bounds(self):
+        """Return the bounding box as ``[x0,x1, y0,y1, z0,z1]``."""
+        o, s, n = np.array(self.origin()), np.array(self.spacing()), np.array(self.shape())
+        return np.array([o, o + (n-1)*s]).T.ravel().tolist()
+
+    def _voi(self, VOI, level):
+        # inclusive level-0 voxel ranges to [lo, hi) at a given level
+        n = np.array(self.shape(0))
+        if VOI is None or not len(VOI):
+            VOI = (0, n[0]-1, 0, n[1]-1, 0, n[2]-1)
+        v = np.clip(np.array(VOI, dtype=np.int64).reshape(3, 2), 0, (n - 1)[:, None])
+        lo = v[:, 0] >> level
+        hi = np.minimum((v[:, 1] >> level) + 1, self.shape(level))
+        return lo, np.maximum(hi, lo + 1)
+
+    def pickLevel(self, VOI=None, maxVoxels=256**3):
+        """Return the finest level at which the region `VOI` has at most `maxVoxels` voxels."""
+        for level in range(self.levels()):
+            lo, hi = self._voi(VOI, level)
+            if np.prod(hi - lo) <= maxVoxels:
+                return level
+        return self.levels() - 1
+
+    def region(self, VOI=None, level=0):
+        """
+        Return the voxel values in a region as a numpy array indexed as [x,y,z].
+
+        :param list VOI: ``(xmin, xmax, ymin, ymax, zmin, zmax)`` in voxel indices
+            of the full resolution level, bounds included. Default is everything.
+        :param int level: the resolution level to read.
+        """
+        lo, hi = self._voi(VOI, level)
+        return self._read(level, lo, hi)
+
+    def imagedata(self, VOI=None, level=0):
+        """Return a region as a ``vtkImageData`` placed at its position in space."""
+        lo, hi = self._voi(VOI, level)
+        arr = self._read(level, lo, hi)
+        img = vtk.vtkImageData()
+        img.SetDimensions(arr.shape)
+        img.SetSpacing(self.spacing(level))
+        img.SetOrigin(np.array(self.origin(level)) + lo * np.array(self.spacing(level)))
+        varr = numpy_to_vtk(arr.ravel(order="F"), deep=True)
+        varr.SetName("input_scalars")
+        img.GetPointData().SetScalars(varr)
+        return img
+
+    def crop(self, top=None, bottom=None, right=None, left=None, front=None, back=None,
+             VOI=(), level=None, maxVoxels=256**3, **options):
+        """
+        Load a region as a ``Volume``. Arguments are the same as ``Volume.crop()``.
+
+        :param int level: resolution level, by default the finest one
+            at which the region has at most `maxVoxels` voxels.
+        :param options: passed to ``Volume``, e.g. `c`, `alpha`, `mode`.
+        """
+        if not len(VOI):
+            d = self.shape()
+            bx0, bx1, by0, by1, bz0, bz1 = 0, d[0]-1, 0, d[1]-1, 0, d[2]-1
+            if left is not None:   bx0 = int((d[0]-1)*left)
+            if right is not None:  bx1 = int((d[0]-1)*(1-right))
+            if back is not None:   by0 = int((d[1]-1)*back)
+            if front is not None:  by1 = int((d[1]-1)*(1-front))
+            if bottom is not None: bz0 = int((d[2]-1)*bottom)
+            if top is not None:    bz1 = int((d[2]-1)*(1-top))
+            VOI = (bx0, bx1, by0, by1, bz0, bz1)
+        if level is None:
+            level = self.pickLevel(VOI, maxVoxels)
+        return Volume(self.imagedata(VOI, level), **options)
+
+    def _slice(self, axis, index, level):
+        n = self.shape(0)
+        index = int(min(max(index, 0), n[axis]-1))
+        VOI = [0, n[0]-1, 0, n[1]-1, 0, n[2]-1]
+        VOI[2*axis] = VOI[2*axis+1] = index
+        img = self.imagedata(VOI, level)
+        vslice = vtk.vtkImageDataGeometryFilter()
+        vslice.SetInputData(img)
+        vslice.Update()
+        return Mesh(vslice.GetOutput())
+
+    def xSlice(self, i, level=0):
+        """Extract the slice at index `i` (of the full resolution) along x-axis."""
+        return self._slice(0, i, level)
+
+    def ySlice(self, j, level=0):
+        """Extract the slice at index `j` (of the full resolution) along y-axis."""
+        return self._slice(1, j, level)
+
+    def zSlice(self, k, level=0):
+        """Extract the slice at index `k` (of the full resolution) along z-axis."""
+        return self._slice(2, k, level)
+
+    def isosurface(self, threshold=True, VOI=(), level=None, maxVoxels=256**3, connectivity=False):
+        """
+        Return a ``Mesh`` isosurface of a region, see ``Volume.isosurface()``.
+
+        :param list VOI: region in voxel indices of the full resolution level.
+        :param int level: resolution level, by default the finest one
+            at which the region has at most `maxVoxels` voxels.
+        """
+        if level is None:
+            level = self.pickLevel(VOI, maxVoxels)
+        return Volume(self.imagedata(VOI, level)).isosurface(threshold, connectivity)
+
+    def _visibleVOI(self, ren, maxVoxels):
+        # bounding box of the view frustum clipped to the data, and the level
+        # whose voxels are not smaller than the screen pixels
+        cam = ren.GetActiveCamera()
+        crange = cam.GetClippingRange()
+        ren.ResetCameraClippingRange(self.bounds())
+        ox, oy = ren.GetOrigin()
+        w, h = ren.GetSize()
+        pts = []
+        for x in (ox, ox + w):
+            for y in (oy, oy + h):
+                for z in (0, 1):
+                    ren.SetDisplayPoint(x, y, z)
+                    ren.DisplayToWorld()
+                    p = ren.GetWorldPoint()
+                    pts.append(np.array(p[:3]) / p[3])
+        cam.SetClippingRange(crange)
+        pts = np.array(pts)
+        o, s = np.array(self.origin()), np.array(self.spacing())
+        lo = np.floor((pts.min(axis=0) - o) / s).astype(np.int64)
+        hi = np.ceil((pts.max(axis=0) - o) / s).astype(np.int64)
+        VOI = np.array([lo, hi]).T.ravel().tolist()
+
+        # world size of a pixel at the focal point
+        d = cam.GetDistance()
+        if cam.GetParallelProjection():
+            pixel = 2 * cam.GetParallelScale() / max(h, 1)
+        else:
+            pixel = 2 * d * np.tan(np.deg2rad(cam.GetViewAngle()) / 2) / max(h, 1)
+        level = int(np.clip(np.floor(np.log2(max(pixel / s.min(), 1))), 0, self.levels()-1))
+        level = max(level, self.pickLevel(VOI, maxVoxels))
+        return VOI, level
+
+    def viewVolume(self, plotter, maxVoxels=128**3, **options):
+        """
+        Return a ``Volume`` which reloads the region visible in the view of `plotter`,
+        at a matching resolution, every time the camera stops moving.
+
+        :param int maxVoxels: maximum number of voxels loaded in memory.
+        :param options: passed to ``Volume``, e.g. `c`, `alpha`, `mode`.
+        """
+        vol = Volume(self.imagedata(None, self.pickLevel(None, maxVoxels)), **options)
+        state = dict()
+
+        def _reload(ren, event):
+            if not ren.HasViewProp(vol):
+                return
+            if (plotter.interactor and plotter.window.GetDesiredUpdateRate()
+                    > plotter.interactor.GetStillUpdateRate()):
+                return  # camera is moving, keep what is loaded
+            VOI, level = self._visibleVOI(ren, maxVoxels)
+            lo, hi = self._voi(VOI, level)
+            region = (lo.tolist(), hi.tolist(), level)
+            if state.get(ren) != region:
+                state[ren] = region
+                vol._update(self.imagedata(VOI, level))
+
+        for ren in plotter.renderers:
+            ren.AddObserver("StartEvent", _reload)
+        return vol
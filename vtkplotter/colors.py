@@ -23,14 +23,20 @@ __all__ = [
 ]
 
 
-try:
-    import matplotlib
-    import matplotlib.cm as cm_mpl
+_mapscales = None  # matplotlib.cm, imported on first use by _getMapScales()
+
 
-    _mapscales = cm_mpl
-except:
-    _mapscales = None
-    # see below, this is dealt with in colorMap()
+def _getMapScales():
+    # matplotlib is slow to import, do it only when a colormap is actually needed
+    global _mapscales
+    if _mapscales is None:
+        try:
+            import matplotlib.cm as cm_mpl
+            _mapscales = cm_mpl
+        except:
+            _mapscales = False
+            # see below, this is dealt with in colorMap()
+    return _mapscales
 
 
 #########################################################
@@ -425,7 +431,8 @@ def colorMap(value, name="jet", vmin=None, vmax=None):
 
                 (1.0, 0.809016994374948, 0.6173258487801733)
     """
-    if not _mapscales:
+    cm_mpl = _getMapScales()
+    if not cm_mpl:
         print("-------------------------------------------------------------------")
         print("WARNING : cannot import matplotlib.cm (colormaps will show up gray).")
         print("Try e.g.: sudo apt-get install python3-matplotlib")
@@ -433,6 +440,7 @@ def colorMap(value, name="jet", vmin=None, vmax=None):
         print("     or : build your own map (see example in basic/mesh_custom.py).")
         return (0.5, 0.5, 0.5)
 
+    import matplotlib
     if isinstance(name, matplotlib.colors.LinearSegmentedColormap):
         mp = name
     else:
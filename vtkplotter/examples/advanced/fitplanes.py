@@ -12,7 +12,9 @@ vp += Text2D(__doc__)
 s = load(datadir+"cow.vtk").subdivide().normalize().alpha(0.3)
 vp += s
 
-variances = []
+# fit all the neighborhoods of N=12 closest points at once
+centers, normals, variances = fitPlanes(s, 12)
+
 for i, p in enumerate(s.points()):
     if i % 100:
         continue  # skip most points
@@ -20,8 +22,7 @@ for i, p in enumerate(s.points()):
     plane = fitPlane(pts)          # find the fitting plane
     vp += plane
     vp += Points(pts)              # blue points
-    vp += Arrow(plane.center, plane.center+plane.normal/10, c="g")
-    variances.append(plane.variance)
+    vp += Arrow(centers[i], centers[i]+normals[i]/10, c="g")
 
 vp += histogram(variances).scale(25).pos(.6,-.3,-.9)
 
@@ -1,16 +1,13 @@
 """Dijkstra algorithm to compute the graph geodesic.
 
-Takes as input a polygonal mesh and performs
-a shortest path calculation 20 times.
+Takes as input a polygonal mesh and extracts
+20 shortest paths from a single distance computation.
 """
 from vtkplotter import *
 
 s = Sphere(r=1.02, res=200).clean(0.007).wireframe().alpha(0.02)
 
-paths = []
-for i in range(20):
-    paths.append(geodesic(s, 2500, i * 700))
-    # print(paths[-1].info['CumulativeWeights'])
+paths = s.geodesicPaths(2500, [i * 700 for i in range(20)])
 
 doc = Text2D(__doc__)
 
@@ -0,0 +1,22 @@
+"""
+Draw a rectangle with the left mouse button
+to select and paint in red the visible cells of the mesh.
+Hold the Ctrl key to rotate the scene.
+"""
+from vtkplotter import *
+import numpy as np
+
+mesh = load(datadir+"bunny.obj").normalize()
+selected = np.zeros(mesh.NCells())
+mesh.cellColors(selected, cmap="Reds", vmin=0, vmax=1)
+
+def paint(selection):
+    if mesh in selection:
+        ids = selection[mesh]
+        selected[ids] = 1
+        mesh.cellColors(selected, cmap="Reds", vmin=0, vmax=1)
+        printc("selected", len(ids), "cells", c="g")
+
+vp = Plotter(verbose=0)
+vp.addAreaPicker(paint)
+vp.show(mesh, Text2D(__doc__))
@@ -1,11 +1,12 @@
 '''
-Voronoi in 3D with Voro++ library.
+Voronoi in 3D with scipy,
+or with the Voro++ library (method='voro++').
 '''
 from vtkplotter import voronoi3D, Points, show
 import numpy as np
 
 #from vtkplotter import settings
-#settings.voro_path = '/g/sharpeba/software/bin'
+#settings.voro_path = '/g/sharpeba/software/bin' # for method='voro++'
 
 N = 2000
 nuclei = np.random.rand(N, 3) - (0.5,0.5,0.5)
@@ -15,9 +15,8 @@ axes2 = s2.buildAxes(c='g')
 axes3 = s3.buildAxes(c='b', numberOfDivisions=10)
 
 # axes3 is an Assembly (group of Meshes).
-# Unpack it and scale the 7th label getting it by its name,
-# make it 5 times bigger big and fuchsia:
-axes3.unpack('xNumericLabel7').scale(5).c('fuchsia')
+# Unpack it and get the x labels by their name, make them fuchsia:
+axes3.unpack('xNumericLabels').c('fuchsia')
 # Print all element names in axes3:
 #for m in axes3.getMeshes(): print(m.name)
 
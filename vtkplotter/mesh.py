@@ -10,7 +10,7 @@ import vtkplotter.utils as utils
 
 from vtkplotter.base import ActorBase
 
-from vtk.util.numpy_support import numpy_to_vtk, vtk_to_numpy
+from vtk.util.numpy_support import numpy_to_vtk, numpy_to_vtkIdTypeArray, vtk_to_numpy
 
 __doc__ = ("""Submodule extending the ``vtkActor`` object functionality."""
     + docs._defs
@@ -58,6 +58,250 @@ def merge(*meshs):
     return msh
 
 
+def _cellArrayToCSR(carr):
+    # offsets and connectivity of a vtkCellArray as numpy arrays
+    if hasattr(carr, "GetOffsetsArray"): # vtk9
+        offsets = vtk_to_numpy(carr.GetOffsetsArray()).astype(np.int64)
+        conn = vtk_to_numpy(carr.GetConnectivityArray()).astype(np.int64)
+        return offsets, conn
+    arr = vtk_to_numpy(carr.GetData()).astype(np.int64)
+    nc = carr.GetNumberOfCells()
+    if not nc:
+        return np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    k = arr[0]
+    if len(arr) == nc*(k+1) and np.all(arr[::k+1] == k): # all cells of same size
+        return np.arange(nc+1, dtype=np.int64)*k, arr.reshape(nc, k+1)[:, 1:].ravel()
+    offsets = np.zeros(nc+1, dtype=np.int64)
+    keep = np.ones(len(arr), dtype=bool)
+    i = 0
+    for c in range(nc):
+        n = arr[i]
+        keep[i] = False
+        offsets[c+1] = offsets[c] + n
+        i += n+1
+    return offsets, arr[keep]
+
+
+def _csrToCellArray(offsets, conn):
+    # inverse of _cellArrayToCSR()
+    carr = vtk.vtkCellArray()
+    if hasattr(carr, "GetOffsetsArray"): # vtk9
+        carr.SetData(numpy_to_vtkIdTypeArray(np.ascontiguousarray(offsets, dtype=np.int64), deep=True),
+                     numpy_to_vtkIdTypeArray(np.ascontiguousarray(conn, dtype=np.int64), deep=True))
+        return carr
+    sizes = np.diff(offsets)
+    arr = np.insert(np.asarray(conn, dtype=np.int64), offsets[:-1], sizes)
+    carr.SetCells(len(sizes), numpy_to_vtkIdTypeArray(arr, deep=True))
+    return carr
+
+
+def _csrPairs(offsets, conn):
+    # all the (a, b) pairs of ids belonging to the same cell
+    sizes = np.diff(offsets)
+    pa, pb = [], []
+    for k in np.unique(sizes):
+        if not k:
+            continue
+        starts = offsets[:-1][sizes == k]
+        block = conn[starts[:, None] + np.arange(k)]
+        pa.append(np.repeat(block, k, axis=1).ravel())
+        pb.append(np.tile(block, (1, k)).ravel())
+    if not pa:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    return np.concatenate(pa), np.concatenate(pb)
+
+
+def _pairsToCSR(a, b, n):
+    # compressed sparse rows of the unique pairs (a, b) with a != b
+    keep = a != b
+    code = np.unique(a[keep] * n + b[keep])
+    rows, cols = code // n, code % n
+    indptr = np.zeros(n+1, dtype=np.int64)
+    indptr[1:] = np.cumsum(np.bincount(rows, minlength=n))
+    return indptr, cols
+
+
+def _geometryKey(poly):
+    # changes when the points or the cells of the polydata change,
+    # but not when its point or cell data arrays are modified
+    vpts = poly.GetPoints()
+    return [poly, vpts.GetMTime() if vpts else 0] + [ca.GetMTime() for ca in
+            (poly.GetVerts(), poly.GetLines(), poly.GetPolys(), poly.GetStrips())]
+
+
+def _rayLocator(poly):
+    # cell locator used for ray casting, vtkStaticCellLocator is much faster
+    # than vtkOBBTree/vtkModifiedBSPTree when casting many rays
+    if hasattr(vtk, "vtkStaticCellLocator"):
+        loc = vtk.vtkStaticCellLocator()
+    else:
+        loc = vtk.vtkCellLocator()
+    loc.SetDataSet(poly)
+    loc.BuildLocator()
+    return loc
+
+
+def _castRays(loc, p0, p1, tol):
+    # first hit of each segment p0->p1: parametric coordinate and cell id
+    n = len(p0)
+    ts = np.full(n, np.nan)
+    cids = np.full(n, -1, dtype=np.int64)
+    t = vtk.reference(0.0)
+    x, pc = [0, 0, 0], [0, 0, 0]
+    subid, cid = vtk.reference(0), vtk.reference(0)
+    cell = vtk.vtkGenericCell()
+    a, b = p0.tolist(), p1.tolist()
+    for i in range(n):
+        if loc.IntersectWithLine(a[i], b[i], tol, t, x, pc, subid, cid, cell):
+            ts[i] = t
+            cids[i] = cid
+    return ts, cids
+
+
+_rayFarm = dict()  # state of the worker processes of intersectWithLines()
+
+def _rayFarmInit(polystring):
+    reader = vtk.vtkPolyDataReader()
+    reader.ReadFromInputStringOn()
+    reader.SetBinaryInputString(polystring, len(polystring))
+    reader.Update()
+    _rayFarm['poly'] = reader.GetOutput()
+    _rayFarm['locator'] = _rayLocator(_rayFarm['poly'])
+
+def _rayFarmCast(job):
+    p0, p1, tol = job
+    return _castRays(_rayFarm['locator'], p0, p1, tol)
+
+
+def _idListToNumpy(idlist, iota):
+    # copy of a vtkIdList as a numpy array, iota is a vtkIdTypeArray
+    # holding 0,1,2.. so that picking its tuples returns the ids themselves
+    out = vtk.vtkIdTypeArray()
+    out.SetNumberOfTuples(idlist.GetNumberOfIds())
+    if idlist.GetNumberOfIds():
+        iota.GetTuples(idlist, out)
+    return vtk_to_numpy(out).astype(np.int64)
+
+
+def _worldToLocal(actor, pts):
+    # move world coordinates to the reference frame of the actor polydata
+    if actor.GetIsIdentity():
+        return pts
+    M = np.array([[actor.GetMatrix().GetElement(i, j) for j in range(4)]
+                  for i in range(4)])
+    Minv = np.linalg.inv(M)
+    return np.dot(pts, Minv[:3, :3].T) + Minv[:3, 3]
+
+
+class _InsideTester(object):
+    # Point in closed surface test for arrays of points.
+    # The surface is voxelized once: the voxels touched by the cells are marked
+    # as boundary, the others are known to be all inside or all outside.
+    # Only the query points falling in boundary voxels are tested exactly.
+    # The boundary voxels cover a band of width `tol` around the surface,
+    # so any query tolerance up to `tol` can reuse the same voxelization.
+    def __init__(self, poly, tol=1e-05, res=None):
+        self.poly = poly
+        self.key = _geometryKey(poly)
+        self.tol = tol
+        self.sep = vtk.vtkSelectEnclosedPoints()
+        self.sep.SetTolerance(tol)
+        self.sep.Initialize(poly)
+
+        if poly.GetNumberOfPoints() == 0:
+            self.state = None
+            return
+        pts = vtk_to_numpy(poly.GetPoints().GetData()).astype(float)
+        po, pc = _cellArrayToCSR(poly.GetPolys())
+        so, sc = _cellArrayToCSR(poly.GetStrips())
+        offsets = np.concatenate([po, so[1:] + po[-1]])
+        conn = np.concatenate([pc, sc])
+        starts = offsets[:-1][np.diff(offsets) > 0]
+
+        lo, hi = pts.min(axis=0), pts.max(axis=0)
+        diag = np.linalg.norm(hi - lo)
+        if res is None:
+            res = int(np.clip(3 * np.sqrt(len(starts)), 16, 128))
+        h = max(diag / res, 1e-12)
+        pad = tol * diag + 1e-06 * h
+        self.h = h
+        self.origin = lo - pad - h  # leave one layer of outside voxels
+        dims = np.floor((hi + pad - self.origin) / h).astype(int) + 2
+        occ = np.zeros(dims, dtype=bool)
+
+        # mark the voxels overlapping the bounding box of each cell
+        if len(starts):
+            cp = pts[conn]
+            i0 = np.floor((np.minimum.reduceat(cp, starts) - pad - self.origin) / h).astype(int)
+            i1 = np.floor((np.maximum.reduceat(cp, starts) + pad - self.origin) / h).astype(int)
+            ext = i1 - i0 + 1
+            nvox = np.prod(ext, axis=1)
+            chunks = np.searchsorted(np.cumsum(nvox), np.arange(1, nvox.sum()//5000000 + 1)*5000000)
+            for sel in np.split(np.arange(len(nvox)), chunks):
+                n = nvox[sel]
+                rep = np.repeat(sel, n)
+                k = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+                ex = ext[rep]
+                occ[i0[rep, 0] + k % ex[:, 0],
+                    i0[rep, 1] + k // ex[:, 0] % ex[:, 1],
+                    i0[rep, 2] + k // (ex[:, 0] * ex[:, 1])] = True
+
+        # free voxels along a row of x have the same state between two boundary
+        # voxels: test one voxel per run, runs touching the grid border are outside
+        nx = dims[0]
+        free = ~occ.transpose(1, 2, 0).reshape(-1, nx)
+        first = free.copy()
+        first[:, 1:] &= ~free[:, :-1]
+        runid = np.cumsum(first.ravel()).reshape(free.shape) - 1
+        nruns = runid[-1, -1] + 1
+        border = np.zeros(nruns, dtype=bool)
+        border[runid[free[:, 0], 0]] = True
+        border[runid[free[:, -1], -1]] = True
+        inside = np.zeros(nruns, dtype=bool)
+        rows, cols = np.nonzero(first)
+        rid = runid[rows, cols]
+        test = ~border[rid]
+        j, k = np.divmod(rows[test], dims[2])
+        centers = self.origin + (np.c_[cols[test], j, k] + 0.5) * h
+        inside[rid[test]] = self._exact(centers)
+
+        state = np.where(inside[runid], 1, 0).astype(np.int8)
+        state[~free] = -1
+        self.state = state.reshape(dims[1], dims[2], nx).transpose(2, 0, 1)
+
+    def _exact(self, pts, tol=None):
+        if tol is None:
+            tol = self.tol
+        if len(pts) > 5000:  # run the filter on the whole set
+            vpts = vtk.vtkPoints()
+            vpts.SetData(numpy_to_vtk(np.ascontiguousarray(pts), deep=True))
+            ppoly = vtk.vtkPolyData()
+            ppoly.SetPoints(vpts)
+            sep = vtk.vtkSelectEnclosedPoints()
+            sep.SetTolerance(tol)
+            sep.SetInputData(ppoly)
+            sep.SetSurfaceData(self.poly)
+            sep.Update()
+            return vtk_to_numpy(sep.GetOutput().GetPointData().GetArray(0)).astype(bool)
+        self.sep.SetTolerance(tol)
+        isin = self.sep.IsInsideSurface
+        return np.array([isin(p) for p in pts.tolist()], dtype=bool)
+
+    def __call__(self, pts, tol=None):
+        pts = np.asarray(pts, dtype=float).reshape(-1, 3)
+        mask = np.zeros(len(pts), dtype=bool)
+        if self.state is None:
+            return mask
+        idx = np.floor((pts - self.origin) / self.h).astype(int)
+        ingrid = np.all((idx >= 0) & (idx < self.state.shape), axis=1)
+        st = self.state[tuple(idx[ingrid].T)]
+        mask[ingrid] = st == 1
+        unknown = np.flatnonzero(ingrid)[st == -1]
+        if len(unknown):
+            mask[unknown] = self._exact(pts[unknown], tol)
+        return mask
+
+
 ####################################################
 class Mesh(vtk.vtkFollower, ActorBase):
     """
@@ -200,6 +444,10 @@ class Mesh(vtk.vtkFollower, ActorBase):
         self.point_locator = None
         self.cell_locator = None
         self.line_locator = None
+        self._rayCache = None # cached locator and processes, see intersectWithLines()
+        self._insideTester = None # cached voxelization, see isInside()
+        self._cellTree = None # cached locator, see findCellsWithin()
+        self._adjacency = None  # cached topology, see adjacency()
         self.transform = None
         self._bfprop = None  # backface property holder
         self._scals_idx = 0  # index of the active scalar changed from CLI
@@ -1044,9 +1292,16 @@ class Mesh(vtk.vtkFollower, ActorBase):
         """
         Find cells that are within specified bounds.
         Setting a color will add a vtk array to colorize these cells.
+
+        A batch of boxes can be passed as an array of shape `(K,6)`,
+        in this case a list with the cell ids found in each box is returned.
+
+        The cell tree is cached and only rebuilt when the mesh changes.
         """
-        if len(xbounds) == 6:
-            bnds = xbounds
+        if np.ndim(xbounds) == 2:
+            boxes = np.asarray(xbounds, dtype=float)
+        elif len(xbounds) == 6:
+            boxes = [xbounds]
         else:
             bnds = list(self.bounds())
             if len(xbounds) == 2:
@@ -1058,34 +1313,39 @@ class Mesh(vtk.vtkFollower, ActorBase):
             if len(zbounds) == 2:
                 bnds[4] = zbounds[0]
                 bnds[5] = zbounds[1]
+            boxes = [bnds]
+
+        poly = self.polydata(False)
+        M = self.GetMatrix()
+        key = _geometryKey(poly) + [M.GetElement(i, j) for i in range(4) for j in range(4)]
+        if self._cellTree is None or self._cellTree[0] != key:
+            tree = vtk.vtkCellTreeLocator()
+            tree.SetDataSet(self.polydata())
+            tree.BuildLocator()
+            iota = np.arange(poly.GetNumberOfCells()).astype(vtk_to_numpy(vtk.vtkIdTypeArray()).dtype)
+            self._cellTree = [key, tree, numpy_to_vtkIdTypeArray(iota, deep=True)]
+        tree, iota = self._cellTree[1], self._cellTree[2]
 
         cellIds = vtk.vtkIdList()
-        self.cell_locator = vtk.vtkCellTreeLocator()
-        self.cell_locator.SetDataSet(self.polydata())
-        #self.cell_locator.SetNumberOfCellsPerNode(2)
-        self.cell_locator.BuildLocator()
-        self.cell_locator.FindCellsWithinBounds(bnds, cellIds)
+        cids = []
+        for bnds in boxes:
+            cellIds.Reset()  # the locator appends to the list
+            tree.FindCellsWithinBounds(list(bnds), cellIds)
+            cids.append(_idListToNumpy(cellIds, iota))
 
         if c is not None:
-            cellData = vtk.vtkUnsignedCharArray()
-            cellData.SetNumberOfComponents(3)
-            cellData.SetName('CellsWithinBoundsColor')
-            cellData.SetNumberOfTuples(self.polydata(False).GetNumberOfCells())
             defcol = np.array(self.color())*255
-            for i in range(cellData.GetNumberOfTuples()):
-                cellData.InsertTuple(i, defcol)
-            self.polydata(False).GetCellData().SetScalars(cellData)
+            cols = np.empty((poly.GetNumberOfCells(), 3), dtype=np.uint8)
+            cols[:] = defcol
+            cols[np.concatenate(cids)] = np.array(colors.getColor(c))*255
+            cellData = numpy_to_vtk(cols, deep=True, array_type=vtk.VTK_UNSIGNED_CHAR)
+            cellData.SetName('CellsWithinBoundsColor')
+            poly.GetCellData().SetScalars(cellData)
             self._mapper.ScalarVisibilityOn()
-            flagcol = np.array(colors.getColor(c))*255
-
-        cids = []
-        for i in range(cellIds.GetNumberOfIds()):
-            cid = cellIds.GetId(i)
-            if c is not None:
-                cellData.InsertTuple(cid, flagcol)
-            cids.append(cid)
 
-        return np.array(cids)
+        if np.ndim(xbounds) == 2:
+            return cids
+        return cids[0]
 
 
     def distanceToMesh(self, mesh, signed=False, negate=False):
@@ -2341,6 +2601,7 @@ class Mesh(vtk.vtkFollower, ActorBase):
         sdf.Update()
         return self._update(sdf.GetOutput())
 
+    @utils.cached
     def decimate(self, fraction=0.5, N=None, method='quadric', boundaries=False):
         """
         Downsample the number of vertices in a mesh to `fraction`.
@@ -2385,6 +2646,59 @@ class Mesh(vtk.vtkFollower, ActorBase):
         decimate.Update()
         return self._update(decimate.GetOutput())
 
+    def lod(self, levels=(0.25, 0.05, 0.01), background=True):
+        """
+        Precompute decimated versions of the mesh to be rendered while the camera moves.
+
+        During interaction the ``Plotter`` renders the finest level which keeps
+        the frame rate above ``settings.interactiveFrameRate``,
+        the full resolution mesh is rendered again as soon as the interaction stops.
+
+        :param list levels: fractions of the original number of vertices of each level.
+        :param bool background: compute the levels in a background thread,
+            each one becomes available as soon as it is ready.
+
+        Levels are computed with ``decimate()``, each from the previous finer one.
+        They are discarded when the mesh points or cells are modified, call ``lod()`` again.
+        Use ``lodInfo()`` to check the size of each level.
+
+        :Example:
+            .. code-block:: python
+
+                from vtkplotter import *
+                m = load(datadir+'bunny.obj').subdivide(3).lod([0.1, 0.01])
+                show(m)
+        """
+        poly = vtk.vtkPolyData()
+        poly.ShallowCopy(self._polydata)
+        lod = dict(key=self._lodData()[1], levels=[], fraction=None, thread=None)
+
+        def _build():
+            src, f0 = poly, 1.0
+            for f in sorted(levels, reverse=True):
+                if f >= 1:
+                    continue
+                dec = Mesh(src).decimate(f / f0).polydata(False)
+                dec.Squeeze()  # release the memory preallocated by the filter
+                fraction = dec.GetNumberOfPoints() / float(max(poly.GetNumberOfPoints(), 1))
+                lod["levels"].append((fraction, dec))  # from fine to coarse
+                src, f0 = dec, f
+
+        self._lod = lod
+        self._mapper.Modified()  # let the Plotter know at next show()
+        if background:
+            import threading
+            lod["thread"] = threading.Thread(target=_build)
+            lod["thread"].daemon = True
+            lod["thread"].start()
+        else:
+            _build()
+        return self
+
+    def _lodData(self):
+        # full resolution data and the key which tells if the levels are still valid
+        return self._polydata, _geometryKey(self._polydata)
+
     def smoothLaplacian(self, niter=15, relaxfact=0.1, edgeAngle=15, featureAngle=60):
         """
         Adjust mesh point positions using `Laplacian` smoothing.
@@ -2610,20 +2924,24 @@ class Mesh(vtk.vtkFollower, ActorBase):
     def isInside(self, point, tol=0.0001):
         """
         Return True if point is inside a polydata closed surface.
+        If `point` is an array of shape `(M,3)` return a boolean numpy mask.
+
+        The surface is preprocessed once and the result is cached on the mesh,
+        so repeated queries only pay for the points lying close to the surface.
         """
-        poly = self.polydata()
-        points = vtk.vtkPoints()
-        points.InsertNextPoint(point)
-        pointsPolydata = vtk.vtkPolyData()
-        pointsPolydata.SetPoints(points)
-        sep = vtk.vtkSelectEnclosedPoints()
-        sep.SetTolerance(tol)
-        sep.CheckSurfaceOff()
-        sep.SetInputData(pointsPolydata)
-        sep.SetSurfaceData(poly)
-        sep.Update()
-        return sep.IsInside(0)
+        mask = self._insideMask(point, tol)
+        if np.ndim(point) > 1:
+            return mask
+        return bool(mask[0])
 
+    def _insideMask(self, pts, tol):
+        poly = self.polydata(False)
+        tester = self._insideTester
+        if tester is None or tester.key != _geometryKey(poly) or tester.tol < tol:
+            # the default tolerances of isInside() and insidePoints() share the tester
+            tester = self._insideTester = _InsideTester(poly, max(tol, 1e-04))
+        pts = np.asarray(pts, dtype=float).reshape(-1, 3)
+        return tester(_worldToLocal(self, pts), tol)
 
     def insidePoints(self, pts, invert=False, tol=1e-05, returnIds=False):
         """
@@ -2632,24 +2950,13 @@ class Mesh(vtk.vtkFollower, ActorBase):
         |pca| |pca.py|_
         """
         if isinstance(pts, Mesh):
-            pointsPolydata = pts.polydata()
             pts = pts.points()
-        else:
-            vpoints = vtk.vtkPoints()
-            pts = np.ascontiguousarray(pts)
-            vpoints.SetData(numpy_to_vtk(pts, deep=True))
-            pointsPolydata = vtk.vtkPolyData()
-            pointsPolydata.SetPoints(vpoints)
-
-        sep = vtk.vtkSelectEnclosedPoints()
-        sep.SetTolerance(tol)
-        sep.SetInputData(pointsPolydata)
-        sep.SetSurfaceData(self.polydata())
-        sep.SetInsideOut(invert)
-        sep.Update()
-
-        mask = Mesh(sep.GetOutput()).getPointArray(0).astype(np.bool)
-        ids = np.array(range(len(pts)))[mask]
+        pts = np.asarray(pts)
+
+        mask = self._insideMask(pts, tol)
+        if invert:
+            mask = ~mask
+        ids = np.flatnonzero(mask)
 
         if returnIds:
             return ids
@@ -2709,73 +3016,291 @@ class Mesh(vtk.vtkFollower, ActorBase):
             return Mesh(fe.GetOutput(), c="p").lw(5)
 
 
-    def connectedVertices(self, index, returnIds=False):
-        """Find all vertices connected to an input vertex specified by its index.
+    def adjacency(self, kind="vv"):
+        """Return the mesh topology in compressed sparse row format,
+        as a pair of numpy arrays ``(indptr, indices)``: the neighbours of
+        element `i` are ``indices[indptr[i]:indptr[i+1]]``.
 
-        :param bool returnIds: return vertex IDs instead of vertex coordinates.
+        :param str kind: either
 
-        |connVtx| |connVtx.py|_
+            - `'vv'`, vertices sharing a cell with each vertex,
+            - `'vc'`, cells containing each vertex,
+            - `'cv'`, vertices of each cell,
+            - `'cc'`, cells sharing a vertex with each cell.
+
+        The structures are built with numpy on first use and cached
+        until the mesh connectivity changes.
         """
         poly = self._polydata
+        cas = [poly.GetVerts(), poly.GetLines(), poly.GetPolys(), poly.GetStrips()]
+        key = _geometryKey(poly)
+        if self._adjacency is None or self._adjacency[0] != key:
+            offsets, conn, n = [np.zeros(1, dtype=np.int64)], [], 0
+            for ca in cas: # cell ids are ordered as verts, lines, polys, strips
+                o, c = _cellArrayToCSR(ca)
+                offsets.append(o[1:] + n)
+                conn.append(c)
+                n += len(c)
+            self._adjacency = [key, {"cv": (np.concatenate(offsets), np.concatenate(conn))}]
+        topo = self._adjacency[1]
+        if kind in topo:
+            return topo[kind]
+
+        npts = poly.GetNumberOfPoints()
+        offsets, conn = topo["cv"]
+        ncells = len(offsets) - 1
+        if kind == "vc":
+            cellof = np.repeat(np.arange(ncells), np.diff(offsets))
+            order = np.argsort(conn, kind="mergesort")
+            indptr = np.zeros(npts+1, dtype=np.int64)
+            indptr[1:] = np.cumsum(np.bincount(conn, minlength=npts))
+            topo[kind] = (indptr, cellof[order])
+        elif kind == "vv":
+            topo[kind] = _pairsToCSR(*_csrPairs(offsets, conn), n=npts)
+        elif kind == "cc":
+            topo[kind] = _pairsToCSR(*_csrPairs(*self.adjacency("vc")), n=ncells)
+        else:
+            colors.printc("Error in adjacency(): unknown kind", kind, c=1)
+            raise RuntimeError()
+        return topo[kind]
 
-        cellIdList = vtk.vtkIdList()
-        poly.GetPointCells(index, cellIdList)
+    def _neighbours(self, index, kind):
+        indptr, indices = self.adjacency(kind)
+        if utils.isSequence(index):
+            return [indices[indptr[i]:indptr[i+1]] for i in index]
+        return indices[indptr[index]:indptr[index+1]].tolist()
 
-        idxs = []
-        for i in range(cellIdList.GetNumberOfIds()):
-            pointIdList = vtk.vtkIdList()
-            poly.GetCellPoints(cellIdList.GetId(i), pointIdList)
-            for j in range(pointIdList.GetNumberOfIds()):
-                idj = pointIdList.GetId(j)
-                if idj == index:
-                    continue
-                if idj in idxs:
-                    continue
-                idxs.append(idj)
+    def connectedVertices(self, index, returnIds=False):
+        """Find all vertices connected to an input vertex specified by its index.
+        If `index` is a list, return a list with the result for each vertex.
 
+        :param bool returnIds: return vertex IDs instead of vertex coordinates.
+
+        |connVtx| |connVtx.py|_
+        """
+        idxs = self._neighbours(index, "vv")
         if returnIds:
             return idxs
-        else:
-            trgp = []
-            for i in idxs:
-                p = [0, 0, 0]
-                poly.GetPoints().GetPoint(i, p)
-                trgp.append(p)
-            return np.array(trgp)
+        pts = vtk_to_numpy(self._polydata.GetPoints().GetData())
+        if utils.isSequence(index):
+            return [pts[i] for i in idxs]
+        return pts[idxs]
 
 
     def connectedCells(self, index, returnIds=False):
-        """Find all cellls connected to an input vertex specified by its index."""
-
-        # Find all cells connected to point index
-        dpoly = self._polydata
-        cellPointIds = vtk.vtkIdList()
-        dpoly.GetPointCells(index, cellPointIds)
-
-        ids = vtk.vtkIdTypeArray()
-        ids.SetNumberOfComponents(1)
-        rids = []
-        for k in range(cellPointIds.GetNumberOfIds()):
-            cid = cellPointIds.GetId(k)
-            ids.InsertNextValue(cid)
-            rids.append(int(cid))
+        """Find all cellls connected to an input vertex specified by its index.
+        If `index` is a list and `returnIds` is True, return a list of cell ids
+        for each vertex."""
+        rids = self._neighbours(index, "vc")
         if returnIds:
             return rids
+        if utils.isSequence(index):
+            rids = np.unique(np.concatenate(rids)) if len(rids) else []
 
-        selectionNode = vtk.vtkSelectionNode()
-        selectionNode.SetFieldType(vtk.vtkSelectionNode.CELL)
-        selectionNode.SetContentType(vtk.vtkSelectionNode.INDICES)
-        selectionNode.SetSelectionList(ids)
-        selection = vtk.vtkSelection()
-        selection.AddNode(selectionNode)
-        extractSelection = vtk.vtkExtractSelection()
-        extractSelection.SetInputData(0, dpoly)
-        extractSelection.SetInputData(1, selection)
-        extractSelection.Update()
-        gf = vtk.vtkGeometryFilter()
-        gf.SetInputData(extractSelection.GetOutput())
-        gf.Update()
-        return Mesh(gf.GetOutput()).lw(1)
+        # build a polydata with the selected cells only
+        dpoly = self._polydata
+        offsets, conn = self.adjacency("cv")
+        ptids = np.unique(np.concatenate([conn[offsets[c]:offsets[c+1]] for c in rids]
+                                         + [np.zeros(0, dtype=np.int64)]))
+        newid = np.zeros(dpoly.GetNumberOfPoints(), dtype=np.int64)
+        newid[ptids] = np.arange(len(ptids))
+        allpts = vtk_to_numpy(dpoly.GetPoints().GetData())
+
+        poly = vtk.vtkPolyData()
+        vpts = vtk.vtkPoints()
+        vpts.SetData(numpy_to_vtk(np.ascontiguousarray(allpts[ptids]), deep=True))
+        poly.SetPoints(vpts)
+        poly.Allocate(len(rids))
+        poly.GetPointData().CopyAllocate(dpoly.GetPointData(), len(ptids))
+        poly.GetCellData().CopyAllocate(dpoly.GetCellData(), len(rids))
+        for i, p in enumerate(ptids):
+            poly.GetPointData().CopyData(dpoly.GetPointData(), int(p), i)
+        for i, c in enumerate(rids):
+            cids = vtk.vtkIdList()
+            for p in newid[conn[offsets[c]:offsets[c+1]]]:
+                cids.InsertNextId(int(p))
+            poly.InsertNextCell(dpoly.GetCellType(int(c)), cids)
+            poly.GetCellData().CopyData(dpoly.GetCellData(), int(c), i)
+        return Mesh(poly).lw(1)
+
+    def kRing(self, index, k=1, cells=False):
+        """Return the ids of the vertices that can be reached from vertex `index`
+        (or from any vertex in a list) in at most `k` steps along the mesh cells.
+        If `cells` is True, `index` refers to cells and the ids of the cells
+        reached through shared vertices are returned.
+        """
+        indptr, indices = self.adjacency("cc" if cells else "vv")
+        seen = np.zeros(len(indptr)-1, dtype=bool)
+        front = np.unique(np.atleast_1d(index).astype(np.int64))
+        seen[front] = True
+        for _ in range(k):
+            if not len(front):
+                break
+            lens = indptr[front+1] - indptr[front]
+            starts = np.repeat(indptr[front] - np.cumsum(lens) + lens, lens)
+            nb = indices[starts + np.arange(lens.sum())]
+            nb = np.unique(nb[~seen[nb]])
+            seen[nb] = True
+            front = nb
+        return np.nonzero(seen)[0]
+
+    def _edgeGraph(self):
+        # symmetric sparse matrix of the lengths of the cell edges
+        from scipy.sparse import csr_matrix
+        self.adjacency("cv")  # validates the topology cache
+        topo = self._adjacency[1]
+        M = self.GetMatrix()
+        mkey = [M.GetElement(i, j) for i in range(4) for j in range(4)]
+        if "graph" in topo and topo["graph"][0] == mkey:
+            return topo["graph"][1]
+
+        poly = self._polydata
+        a, b = [], []
+        for ca, kind in [(poly.GetLines(), "l"), (poly.GetPolys(), "p"), (poly.GetStrips(), "s")]:
+            offsets, conn = _cellArrayToCSR(ca)
+            sizes = np.diff(offsets)
+            last = np.zeros(len(conn)+1, dtype=bool)
+            last[offsets[1:][sizes > 0] - 1] = True
+            i = np.flatnonzero(~last[:-1])
+            a.append(conn[i])
+            b.append(conn[i+1])
+            if kind == "p":  # close the polygons
+                a.append(conn[offsets[1:][sizes > 0] - 1])
+                b.append(conn[offsets[:-1][sizes > 0]])
+            elif kind == "s":  # diagonals of the triangle strips
+                i = i[~last[i+1]]
+                a.append(conn[i])
+                b.append(conn[i+2])
+        a, b = np.concatenate(a), np.concatenate(b)
+        n = poly.GetNumberOfPoints()
+        indptr, cols = _pairsToCSR(np.r_[a, b], np.r_[b, a], n)
+        rows = np.repeat(np.arange(n), np.diff(indptr))
+        pts = self.points()
+        w = np.linalg.norm(pts[rows] - pts[cols], axis=1)
+        graph = csr_matrix((w, cols, indptr), shape=(n, n))
+        topo["graph"] = (mkey, graph)
+        return graph
+
+    def _heatSolvers(self):
+        # prefactored operators of the heat method, see geodesicDistance()
+        from scipy.sparse import coo_matrix, diags
+        from scipy.sparse.linalg import factorized
+        graph = self._edgeGraph()  # validates the caches
+        topo = self._adjacency[1]
+        if "heat" in topo and topo["heat"][0] is graph:
+            return topo["heat"][1]
+
+        offsets, F = _cellArrayToCSR(self._polydata.GetPolys())
+        if self._polydata.GetStrips().GetNumberOfCells() or np.any(np.diff(offsets) != 3):
+            colors.printc("Error in geodesicDistance(): heat method needs a triangular mesh.", c=1)
+            colors.printc("  Use triangulate() to convert it.", c=1)
+            raise RuntimeError()
+        F = F.reshape(-1, 3)
+        V = self.points()
+        n = len(V)
+        e = [V[F[:, 2]] - V[F[:, 1]], V[F[:, 0]] - V[F[:, 2]], V[F[:, 1]] - V[F[:, 0]]]
+        nrm = np.cross(e[2], -e[1])
+        area2 = np.linalg.norm(nrm, axis=1)
+        area2[area2 == 0] = 1e-30
+        # cotangent of the angle at each corner, its opposite edge is e[k]
+        cot = np.c_[np.einsum("ij,ij->i", e[2], -e[1]),
+                    np.einsum("ij,ij->i", e[0], -e[2]),
+                    np.einsum("ij,ij->i", e[1], -e[0])] / area2[:, np.newaxis]
+
+        # cotangent laplacian (positive semidefinite) and lumped mass matrix
+        I = np.r_[F[:, 1], F[:, 2], F[:, 0]]
+        J = np.r_[F[:, 2], F[:, 0], F[:, 1]]
+        w = cot.T.ravel() / 2
+        L = coo_matrix((np.r_[-w, -w, w, w], (np.r_[I, J, I, J], np.r_[J, I, I, J])),
+                       shape=(n, n)).tocsc()
+        mass = np.bincount(F.ravel(), weights=np.repeat(area2/6, 3), minlength=n)
+        t = np.mean(graph.data)**2
+        heat = factorized((diags(mass) + t*L).tocsc())
+        poisson = factorized((L + 1e-08*diags(mass)).tocsc())
+        solvers = (F, e, nrm / area2[:, np.newaxis], area2, cot, heat, poisson)
+        topo["heat"] = (graph, solvers)
+        return solvers
+
+    def geodesicDistance(self, sources, method="dijkstra"):
+        """Compute the geodesic distance of all the mesh vertices
+        from the closest of the `sources` vertices, in a single solve.
+
+        :param sources: a vertex index or a list of indices.
+        :param str method: either
+
+            - `'dijkstra'`, shortest paths along the mesh edges,
+            - `'heat'`, heat method of Crane et al. (2013), a smooth approximation
+              of the distance across the surface (needs a triangular mesh).
+
+        The edge graph and the heat method operators are built with `scipy` on first use
+        and cached until the mesh points or cells change.
+
+        :Example:
+            .. code-block:: python
+
+                from vtkplotter import *
+                s = Sphere(res=50)
+                d = s.geodesicDistance([0, 100], method='heat')
+                s.addPointScalars(d, 'geodesic').addScalarBar()
+                show(s)
+        """
+        sources = np.atleast_1d(sources).astype(np.int64)
+        if method == "dijkstra":
+            from scipy.sparse.csgraph import dijkstra
+            return dijkstra(self._edgeGraph(), indices=sources, min_only=True)
+
+        elif method == "heat":
+            F, e, unitn, area2, cot, heat, poisson = self._heatSolvers()
+            n = self.N()
+            delta = np.zeros(n)
+            delta[sources] = 1
+            u = heat(delta)
+            # normalized gradient of the heat on the faces
+            grad = sum(np.cross(unitn, e[k]) * u[F[:, k]][:, np.newaxis] for k in range(3))
+            gnorm = np.linalg.norm(grad, axis=1)
+            gnorm[gnorm == 0] = 1
+            X = -grad / gnorm[:, np.newaxis]
+            # integrated divergence at the vertices
+            dot = [np.einsum("ij,ij->i", e[k], X) for k in range(3)]
+            div = np.zeros(n)
+            np.add.at(div, F[:, 0], (cot[:, 2]*dot[2] - cot[:, 1]*dot[1]) / 2)
+            np.add.at(div, F[:, 1], (cot[:, 0]*dot[0] - cot[:, 2]*dot[2]) / 2)
+            np.add.at(div, F[:, 2], (cot[:, 1]*dot[1] - cot[:, 0]*dot[0]) / 2)
+            phi = poisson(-div)
+            return phi - phi[sources].min()
+
+        colors.printc("Error in geodesicDistance(): unknown method", method, c=1)
+        raise RuntimeError()
+
+    def geodesicPaths(self, sources, ends, returnIds=False):
+        """Extract the shortest paths along the mesh edges from the closest
+        of the `sources` vertices to each of the `ends` vertices, from a single solve.
+
+        :param bool returnIds: return the lists of vertex ids instead of ``Line`` objects.
+
+        The returned list has one entry per end vertex. If an end cannot be
+        reached from the sources its path is empty, and it is ``None`` instead
+        of a ``Line`` when an end has no path or is a source itself.
+
+        |geodesic| |geodesic.py|_
+        """
+        from scipy.sparse.csgraph import dijkstra
+        sources = np.atleast_1d(sources).astype(np.int64)
+        _, pred, _ = dijkstra(self._edgeGraph(), indices=sources,
+                              min_only=True, return_predecessors=True)
+        paths = []
+        for i in np.atleast_1d(ends):
+            path = [i]
+            while pred[path[-1]] >= 0:
+                path.append(pred[path[-1]])
+            if path[-1] not in sources:
+                path = []  # not reachable
+            paths.append(np.array(path[::-1], dtype=np.int64))
+        if returnIds:
+            return paths
+        from vtkplotter.shapes import Line
+        pts = self.points()
+        return [Line(pts[p], c=self.color(), lw=3) if len(p) > 1 else None for p in paths]
 
     def labels(self, content=None, cells=False, scale=None, ratio=1, precision=3):
         """Generate value or ID labels for mesh cells or points.
@@ -2847,39 +3372,40 @@ class Mesh(vtk.vtkFollower, ActorBase):
             colors.printc('Error in labels(): array not found for points/cells', c=1)
             return None
 
-        tapp = vtk.vtkAppendPolyData()
-        for i,e in enumerate(elems):
-            if i % ratio:
-                continue
-            tx = vtk.vtkVectorText()
-            if mode==1:
-                tx.SetText(str(i))
-            else:
-                tx.SetText(utils.precision(arr[i], precision))
-            tx.Update()
-
-            T = vtk.vtkTransform()
-            T.PostMultiply()
-            if hasnorms:
-                ni = norms[i]
-                if cells: # center-justify
-                    bb = tx.GetOutput().GetBounds()
-                    dx, dy = (bb[1]-bb[0])/2, (bb[3]-bb[2])/2
-                    T.Translate(-dx,-dy,0)
-                crossvec = np.cross([0,0,1], ni)
-                angle = np.arccos(np.dot([0,0,1], ni))*57.3
-                T.RotateWXYZ(angle, crossvec)
-                if cells: # small offset along normal only for cells
-                    T.Translate(ni*scale/2)
-            T.Scale(scale,scale,scale)
-            T.Translate(e)
-            tf = vtk.vtkTransformPolyDataFilter()
-            tf.SetInputData(tx.GetOutput())
-            tf.SetTransform(T)
-            tf.Update()
-            tapp.AddInputData(tf.GetOutput())
-        tapp.Update()
-        ids = Mesh(tapp.GetOutput(), c=[.5,.5,.5]).pickable(0)
+        # lay out all the labels at once from the cached character glyphs
+        idx = np.arange(0, len(elems), ratio)
+        if mode == 1:
+            txts = [str(i) for i in idx]
+        else:
+            txts = [utils.precision(arr[i], precision) for i in idx]
+        pts, tris, plab = utils._vectorTextLayout(txts)
+
+        if hasnorms:
+            ns = np.asarray(norms)[idx]
+            if cells: # center-justify
+                bmin, bmax, _ = utils._vectorTextBounds(pts, plab, len(idx))
+                pts = pts - ((bmax - bmin) / 2 * [1, 1, 0])[plab]
+            # rotate each label from the z axis to its normal
+            axis = np.cross([0, 0, 1], ns)
+            axlen = np.linalg.norm(axis, axis=1)
+            angle = np.deg2rad(np.arccos(np.clip(ns[:, 2], -1, 1))*57.3)
+            axlen[axlen == 0] = 1 # no rotation when parallel to z
+            k = axis / axlen[:, None]
+            c, sn = np.cos(angle)[:, None, None], np.sin(angle)[:, None, None]
+            K = np.zeros((len(idx), 3, 3))
+            K[:, 0, 1], K[:, 0, 2], K[:, 1, 2] = -k[:, 2], k[:, 1], -k[:, 0]
+            K[:, 1, 0], K[:, 2, 0], K[:, 2, 1] = k[:, 2], -k[:, 1], k[:, 0]
+            R = np.eye(3) + sn*K + (1 - c) * np.matmul(K, K)
+            # glyphs lie on the xy plane: only the first two columns of R are needed
+            R = R.astype(pts.dtype)
+            pts = R[plab, :, 0] * pts[:, 0:1] + R[plab, :, 1] * pts[:, 1:2]
+            if cells: # small offset along normal only for cells
+                pts += (ns * scale / 2)[plab]
+        pts *= scale
+        pts += np.asarray(elems)[idx][plab]
+
+        tpoly = utils.buildPolyData(pts, tris) if len(pts) else vtk.vtkPolyData()
+        ids = Mesh(tpoly, c=[.5,.5,.5]).pickable(0)
         ids.flat().lighting('ambient')
         return ids
 
@@ -2899,9 +3425,11 @@ class Mesh(vtk.vtkFollower, ActorBase):
 
             |intline|
         """
-        if not self.line_locator:
+        poly = self.polydata()
+        if not self.line_locator or self.line_locator.GetDataSet() != poly \
+            or self.line_locator.GetMTime() < poly.GetMTime():
             self.line_locator = vtk.vtkOBBTree()
-            self.line_locator.SetDataSet(self.polydata())
+            self.line_locator.SetDataSet(poly)
             self.line_locator.BuildLocator()
 
         intersectPoints = vtk.vtkPoints()
@@ -2913,6 +3441,89 @@ class Mesh(vtk.vtkFollower, ActorBase):
             pts.append(intersection)
         return pts
 
+    def intersectWithLines(self, p0, p1=None, directions=None, tol=1e-06, workers=1):
+        """Find the first intersection of many segments (or rays) with the mesh.
+
+        Segments can be given as an array of shape `(M,2,3)`, or as two arrays `p0` and `p1`
+        of shape `(M,3)`. If `directions` is given instead of `p1` the rays start
+        at `p0` and extend beyond the mesh.
+
+        Returns three numpy arrays: the `(M,3)` coordinates of the first hit points,
+        the `(M,)` ids of the hit cells and the `(M,)` distances from the starting points.
+        Segments which do not hit the mesh get `nan` coordinates and distance, and cell id -1.
+
+        The cell locator is cached and only rebuilt when the mesh points or cells change.
+
+        :param float tol: tolerance of the intersection test.
+        :param int workers: number of processes used to cast the rays.
+            Starting them costs a copy of the mesh to each process, so they are
+            kept alive and reused by the following calls with the same `workers`
+            until the mesh points or cells change.
+
+        :Example:
+            .. code-block:: python
+
+                import numpy as np
+                from vtkplotter import *
+                s = load(datadir+'bunny.obj')
+                origins = np.random.randn(1000, 3)
+                pts, cids, dists = s.intersectWithLines(origins, directions=-origins)
+                show(s, Points(pts[cids>=0], r=5, c='r'), bg='white')
+        """
+        p0 = np.asarray(p0, dtype=float)
+        if p1 is None and directions is None:
+            p0, p1 = p0[:, 0], p0[:, 1]
+        elif directions is not None:
+            d = np.asarray(directions, dtype=float).reshape(-1, 3)
+            d = d / np.linalg.norm(d, axis=1)[:, np.newaxis]
+            reach = np.linalg.norm(p0 - self.GetCenter(), axis=1) + self.diagonalSize()
+            p1 = p0 + d * reach[:, np.newaxis]
+        else:
+            p1 = np.asarray(p1, dtype=float)
+        p0, p1 = np.broadcast_arrays(p0.reshape(-1, 3), p1.reshape(-1, 3))
+
+        # cast the rays in the mesh local coordinates, the locator is built once
+        poly = self.polydata(False)
+        key = _geometryKey(poly)
+        if self._rayCache is None or self._rayCache[0] != key:
+            if self._rayCache and self._rayCache[2]:
+                self._rayCache[2].terminate()
+            self._rayCache = [key, _rayLocator(poly), None, 0] # key, locator, pool, workers
+        loc = self._rayCache[1]
+        q0, q1 = _worldToLocal(self, p0), _worldToLocal(self, p1)
+
+        if workers > 1 and len(p0) > 1:
+            if self._rayCache[3] != workers:
+                import multiprocessing, weakref
+                if self._rayCache[2]:
+                    self._rayCache[2].terminate()
+                w = vtk.vtkPolyDataWriter()
+                w.SetInputData(poly)
+                w.SetFileTypeToBinary()
+                w.WriteToOutputStringOn()
+                w.Write()
+                if hasattr(w, "GetOutputStdString"):
+                    polystring = w.GetOutputStdString()
+                else:
+                    polystring = w.GetBinaryOutputString()
+                pool = multiprocessing.Pool(workers, initializer=_rayFarmInit,
+                                            initargs=(polystring,))
+                # stop the processes with the mesh, or at exit
+                weakref.finalize(self, pool.terminate)
+                self._rayCache[2:] = [pool, workers]
+            nchunks = min(len(p0), workers*4)
+            jobs = [(a, b, tol) for a, b in zip(np.array_split(q0, nchunks),
+                                                np.array_split(q1, nchunks))]
+            res = self._rayCache[2].map(_rayFarmCast, jobs)
+            ts = np.concatenate([r[0] for r in res])
+            cids = np.concatenate([r[1] for r in res])
+        else:
+            ts, cids = _castRays(loc, q0, q1, tol)
+
+        pts = p0 + ts[:, np.newaxis] * (p1 - p0)
+        dists = ts * np.linalg.norm(p1 - p0, axis=1)
+        return pts, cids, dists
+
     def projectOnPlane(self, direction='z'):
         """
         Project the mesh on one of the Cartesian planes.
@@ -0,0 +1,368 @@
+from __future__ import division, print_function
+import time
+import numpy as np
+import vtk
+from vtk.util.numpy_support import numpy_to_vtk, vtk_to_numpy
+import vtkplotter.colors as colors
+import vtkplotter.docs as docs
+import vtkplotter.settings as settings
+from vtkplotter.mesh import Mesh, _cellArrayToCSR, _csrToCellArray
+
+__doc__ = (
+    """
+Apply the same processing to many meshes in parallel.
+
+.. code-block:: python
+
+    import vtkplotter.parallel as parallel
+
+    def process(m):
+        return m.clean().triangulate().decimate(0.5).smoothWSinc()
+
+    outputs = parallel.map(process, meshes, workers=8)
+"""
+    + docs._defs
+)
+
+__all__ = ["map", "configureSMP"]
+
+
+_farm = dict()  # per-process state of the map() workers
+_gilProbe = []  # cached result of _vtkReleasesGIL()
+
+
+###########################################################################
+def configureSMP(backend=None, nthreads=None):
+    """
+    Configure the ``vtkSMPTools`` multithreading of the VTK filters which support it
+    (e.g. ``vtkFlyingEdges3D``, ``vtkPointInterpolator``, ``vtkStaticPointLocator``).
+
+    The arguments override ``settings.smpBackend`` and ``settings.numThreads``,
+    then the current settings are applied.
+
+    :param str backend: one of `'Sequential'`, `'STDThread'`, `'TBB'` or `'OpenMP'`,
+        depending on how VTK was compiled.
+    :param int nthreads: maximum number of threads used by each filter.
+    """
+    if backend is not None:
+        settings.smpBackend = backend
+    if nthreads is not None:
+        settings.numThreads = nthreads
+    if not hasattr(vtk, "vtkSMPTools"):
+        return
+    smp = vtk.vtkSMPTools
+    if settings.smpBackend and hasattr(smp, "SetBackend"):
+        if smp.GetBackend() != settings.smpBackend:
+            if not smp.SetBackend(settings.smpBackend):
+                colors.printc("~bomb configureSMP(): backend", settings.smpBackend,
+                              "not available, using", smp.GetBackend(), c=1)
+    if settings.numThreads:
+        smp.Initialize(int(settings.numThreads))
+
+
+def _vtkReleasesGIL():
+    """Check whether the VTK python wrappers release the GIL while a filter runs:
+    a python thread is counting while a VTK filter executes in the main thread."""
+    if _gilProbe:
+        return _gilProbe[0]
+    import sys, threading
+
+    count = [0]
+    done = []
+    def _counter():
+        while not done:
+            count[0] += 1
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(0.0005)  # a held GIL leaks at most a short time slice
+    thread = threading.Thread(target=_counter)
+    thread.daemon = True
+    thread.start()
+
+    c0, t0 = count[0], time.time()
+    time.sleep(0.02)  # a sleeping main thread releases the GIL for sure
+    rate = (count[0] - c0) / (time.time() - t0)
+
+    src = vtk.vtkSphereSource()
+    src.SetThetaResolution(800)
+    src.SetPhiResolution(800)
+    c0, t0 = count[0], time.time()
+    src.Update()
+    dt = time.time() - t0
+    released = (count[0] - c0) / (rate * dt + 1) > 0.25
+    done.append(True)
+    thread.join()
+    sys.setswitchinterval(interval)
+    _gilProbe.append(released)
+    return released
+
+
+###########################################################################
+# transfer of polydata between processes through shared memory buffers
+def _packPolyData(poly):
+    # list of (key, metadata, numpy array) holding all the buffers of the polydata
+    bufs = []
+    if poly.GetPoints():
+        bufs.append(("points", None, vtk_to_numpy(poly.GetPoints().GetData())))
+    for key, carr in (("verts", poly.GetVerts()), ("lines", poly.GetLines()),
+                      ("polys", poly.GetPolys()), ("strips", poly.GetStrips())):
+        if carr.GetNumberOfCells():
+            offsets, conn = _cellArrayToCSR(carr)
+            bufs.append((key, "offsets", offsets))
+            bufs.append((key, "conn", conn))
+    for key, data in (("pointdata", poly.GetPointData()), ("celldata", poly.GetCellData())):
+        for i in range(data.GetNumberOfArrays()):
+            arr = data.GetArray(i)
+            if arr is None:  # string arrays are not transferred
+                continue
+            bufs.append((key, (arr.GetName(), data.IsArrayAnAttribute(i)), vtk_to_numpy(arr)))
+    return bufs
+
+
+def _unpackPolyData(bufs):
+    # inverse of _packPolyData(), all the buffers are copied
+    poly = vtk.vtkPolyData()
+    cells = dict()
+    for key, meta, a in bufs:
+        if key == "points":
+            vpts = vtk.vtkPoints()
+            vpts.SetData(numpy_to_vtk(a, deep=True))
+            poly.SetPoints(vpts)
+        elif key in ("pointdata", "celldata"):
+            data = poly.GetPointData() if key == "pointdata" else poly.GetCellData()
+            name, attribute = meta
+            varr = numpy_to_vtk(a, deep=True)
+            if name is not None:
+                varr.SetName(name)
+            idx = data.AddArray(varr)
+            if attribute >= 0:
+                data.SetActiveAttribute(idx, attribute)
+        else:
+            cells.setdefault(key, dict())[meta] = a
+    for key, csr in cells.items():
+        carr = _csrToCellArray(csr["offsets"], csr["conn"])
+        getattr(poly, "Set" + key.capitalize())(carr)
+    return poly
+
+
+def _encode(obj, shared=True):
+    """Convert a mesh to a picklable job, its buffers are stored in shared memory."""
+    if isinstance(obj, Mesh):
+        pr = obj.GetProperty()
+        extra = dict(origin=obj.GetOrigin(), scale=obj.GetScale(),
+                     orientation=obj.GetOrientation(), position=obj.GetPosition(),
+                     color=pr.GetColor(), alpha=pr.GetOpacity(), info=obj.info)
+        bufs = _packPolyData(obj.polydata(False))
+    elif isinstance(obj, vtk.vtkPolyData):
+        extra = None
+        bufs = _packPolyData(obj)
+    else:
+        return ("raw", obj), None
+
+    try:
+        from multiprocessing import shared_memory
+    except ImportError:  # python < 3.8
+        shared = False
+    if not shared:
+        return ("pickle", bufs, extra), None
+
+    layout = []
+    nbytes = 0
+    for key, meta, a in bufs:
+        a = np.ascontiguousarray(a)
+        layout.append((key, meta, a.dtype.str, a.shape, nbytes))
+        nbytes += (a.nbytes + 7) // 8 * 8
+    shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 8))
+    for (key, meta, a), (_, _, dtype, shape, offset) in zip(bufs, layout):
+        np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)[...] = a
+    shm.close()
+    return ("shm", shm.name, layout, extra), shm
+
+
+def _decode(job, unlink=False):
+    """Inverse of _encode(), optionally free the shared memory once it is read."""
+    kind = job[0]
+    if kind == "raw":
+        return job[1]
+    elif kind == "pickle":
+        bufs, extra = job[1], job[2]
+        poly = _unpackPolyData(bufs)
+    else:
+        from multiprocessing import shared_memory
+        name, layout, extra = job[1], job[2], job[3]
+        shm = shared_memory.SharedMemory(name=name)
+        bufs = [(key, meta, np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset))
+                for key, meta, dtype, shape, offset in layout]
+        poly = _unpackPolyData(bufs)
+        del bufs  # no views on the buffer can survive its closing
+        shm.close()
+        if unlink:
+            _unlink(shm)
+    if extra is None:
+        return poly
+    m = Mesh(poly, c=extra["color"], alpha=extra["alpha"])
+    m.SetOrigin(extra["origin"])
+    m.SetScale(extra["scale"])
+    m.SetOrientation(extra["orientation"])
+    m.SetPosition(extra["position"])
+    m.info = extra["info"]
+    return m
+
+
+def _unlink(shm):
+    if shm is not None:
+        try:
+            shm.unlink()
+        except OSError:
+            pass
+
+
+def _discard(job):
+    # free the shared memory of a job which will not be decoded
+    if job[0] == "shm":
+        from multiprocessing import shared_memory
+        try:
+            shm = shared_memory.SharedMemory(name=job[1])
+        except OSError:
+            return
+        shm.close()
+        _unlink(shm)
+
+
+def _farmInit(func, shared, smpBackend, numThreads):
+    _farm['func'] = func
+    _farm['shared'] = shared
+    settings.smpBackend = smpBackend
+    settings.numThreads = numThreads or 1  # avoid oversubscribing the cores
+    configureSMP()
+
+def _farmRun(job):
+    obj = _decode(job)
+    if isinstance(obj, str):
+        from vtkplotter.vtkio import load
+        obj = load(obj)
+    job, shm = _encode(_farm['func'](obj), _farm['shared'])
+    return job  # the caller unlinks the shared memory
+
+
+def _run(func, obj):
+    if isinstance(obj, str):
+        from vtkplotter.vtkio import load
+        obj = load(obj)
+    return func(obj)
+
+
+###########################################################################
+def map(func, meshes, workers=None, backend=None, chunksize=1, shared=True):
+    """
+    Apply `func` to each mesh in a list and return the list of results, in the same order.
+
+    :param func: a function taking a ``Mesh`` as argument.
+        With the `'process'` backend it must be importable by the worker processes
+        (lambdas and local functions only work where processes are forked).
+    :param list meshes: a list of ``Mesh``, ``vtkPolyData`` or file names.
+        Files are loaded by the workers.
+    :param int workers: number of threads or processes.
+        Default is the number of available cores. If 0 or 1 run in the current thread.
+    :param str backend: either `'thread'` or `'process'`.
+        Threads only pay off when the VTK wrappers release the GIL,
+        which is checked at runtime when `backend` is not specified.
+    :param int chunksize: number of meshes sent to a worker process at once.
+    :param bool shared: with the `'process'` backend move the polygonal data
+        through shared memory buffers instead of pickling them.
+
+    With the `'process'` backend the returned meshes are copies: modifications made
+    by `func` in place are not reflected in the input meshes.
+    Each worker process runs the VTK multithreaded filters with ``settings.numThreads``
+    threads (1 if not set). If `func` raises an exception no further meshes are sent,
+    and the exception is raised once the meshes already sent are processed.
+
+    :Example:
+        .. code-block:: python
+
+            from vtkplotter import *
+            import vtkplotter.parallel as parallel
+            import glob
+
+            def process(m):
+                return m.clean().triangulate().decimate(0.5).smoothWSinc()
+
+            outputs = parallel.map(process, glob.glob('data/*.ply'), workers=8)
+    """
+    import os
+    configureSMP()
+    meshes = list(meshes)
+    if workers is None:
+        workers = os.cpu_count() if hasattr(os, "cpu_count") else 1
+    workers = min(workers, len(meshes))
+
+    if workers <= 1:
+        return [_run(func, m) for m in meshes]
+
+    if backend is None:
+        backend = "thread" if _vtkReleasesGIL() else "process"
+
+    if backend == "thread":
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(workers) as ex:
+            return list(ex.map(lambda m: _run(func, m), meshes))
+
+    elif backend == "process":
+        import threading
+        import multiprocessing
+
+        inflight = threading.Semaphore(4 * workers * chunksize)
+        inputs = []
+        stop = []
+
+        def _jobs():  # consumed by the pool feeder thread
+            for m in meshes:
+                inflight.acquire()
+                if stop:
+                    return
+                job, shm = _encode(m, shared)
+                inputs.append(shm)
+                yield job
+
+        if shared:
+            try:  # the workers must share the tracker of the shared memory blocks
+                from multiprocessing import resource_tracker
+                resource_tracker.ensure_running()
+            except ImportError:
+                pass
+        results = []
+        pool = multiprocessing.Pool(workers, initializer=_farmInit,
+                                    initargs=(func, shared, settings.smpBackend, settings.numThreads))
+        outputs = pool.imap(_farmRun, _jobs(), chunksize)
+        try:
+            for i, job in enumerate(outputs):
+                _unlink(inputs[i])
+                inputs[i] = None
+                inflight.release()
+                results.append(_decode(job, unlink=True))
+        except Exception:
+            # stop feeding new jobs, then wait for the ones already submitted
+            # so that the shared memory of their results can be freed
+            stop.append(True)
+            inflight.release()
+            while True:
+                try:
+                    _discard(next(outputs))
+                except StopIteration:
+                    break
+                except Exception:
+                    pass
+            raise
+        except BaseException:  # e.g. KeyboardInterrupt, do not wait
+            stop.append(True)
+            inflight.release()
+            pool.terminate()
+            raise
+        finally:
+            pool.close()
+            pool.join()
+            for shm in inputs:
+                _unlink(shm)
+        return results
+
+    colors.printc("~bomb map(): unknown backend", backend, c=1)
+    raise RuntimeError()
@@ -3,6 +3,7 @@ import time
 import sys
 import vtk
 import numpy as np
+from vtk.util.numpy_support import vtk_to_numpy
 
 from vtkplotter import __version__
 import vtkplotter.vtkio as vtkio
@@ -28,6 +29,19 @@ __all__ = ["show", "clear", "ion", "ioff",
            "Plotter", "closeWindow", "closePlotter", "interactive"]
 
 ########################################################################
+def _actorSignature(a):
+    # a cheap fingerprint of the state of an actor, changes when the actor
+    # or its mapper or its input data are modified
+    mt = a.GetMTime()
+    if hasattr(a, 'GetMapper'):
+        mpr = a.GetMapper()
+        if mpr:
+            mt = max(mt, mpr.GetMTime())
+            if hasattr(mpr, 'GetInput') and mpr.GetInput():
+                mt = max(mt, mpr.GetInput().GetMTime())
+    return (mt, id(getattr(a, 'scalarbar', None)), getattr(a, 'flagText', None))
+
+
 def show(*actors, **options):
     """
     Create on the fly an instance of class ``Plotter`` and show the object(s) provided.
@@ -527,11 +541,23 @@ class Plotter:
         self.mouseLeftClickFunction = None
         self.mouseMiddleClickFunction = None
         self.mouseRightClickFunction = None
+        self.areaPickFunction = None
         self._first_viewup = True
+        self._hwSelector = None   # reused across picking events
+        self._propPicker = None
+        self._cellPicker = None
+        self._pickLocators = dict()  # per actor (mtime, cell locator)
+        self._lastClick = None  # (x, y, renderer nr) of the last click, see clickedIds()
+        self._lastClickIds = None
         self.extralight = None
         self.size = size
         self.interactor = None
         self.allowInteraction = None
+        self._captureFilter = None
+        self._sceneState = dict()  # per renderer: {actor: signature} at last show()
+        self._lodActors = dict()  # per renderer: meshes with levels of detail
+        self._renderTimeText = dict()  # per renderer: text actor of the frame time
+        self._dirty = True  # scene needs to be rendered again
 
         self.xtitle = settings.xtitle  # x axis label and units
         self.ytitle = settings.ytitle  # y axis label and units
@@ -776,6 +802,7 @@ class Plotter:
         else:
             self.interactor = vtk.vtkRenderWindowInteractor()
         self.interactor.SetRenderWindow(self.window)
+        self.interactor.SetDesiredUpdateRate(settings.interactiveFrameRate)
         vsty = vtk.vtkInteractorStyleTrackballCamera()
         self.interactor.SetInteractorStyle(vsty)
 
@@ -828,6 +855,8 @@ class Plotter:
 
         :return: returns input actor for possible concatenation.
         """
+        self._dirty = True
+        self._forgetScene()
         if utils.isSequence(actors):
             for a in actors:
                 if a not in self.actors:
@@ -847,6 +876,8 @@ class Plotter:
 
     def remove(self, actors, render=True):
         """Remove ``vtkActor`` or actor index from current renderer."""
+        self._dirty = True
+        self._forgetScene()
         if not utils.isSequence(actors):
             actors = [actors]
 
@@ -867,6 +898,12 @@ class Plotter:
         if render and hasattr(self, 'interactor') and self.interactor:
             self.interactor.Render()
 
+    def _forgetScene(self):
+        # adding or removing props does not modify the renderer MTime:
+        # the next show() must scan the whole scene of the current renderer
+        if self.renderer in self.renderers:
+            self._sceneState.pop(self.renderers.index(self.renderer), None)
+
 
     ####################################################
     def load(self, inputobj, c=None, alpha=1, threshold=False, spacing=(), unpack=True):
@@ -1267,6 +1304,191 @@ class Plotter:
     def addLegend(self):
         return addons.addLegend()
 
+    def addAreaPicker(self, func, cells=True):
+        """Draw a rectangle with the left mouse button to select
+        the cells (or the points) of the meshes which are visible inside it.
+        Hold the `Ctrl` key to rotate the scene.
+
+        The function `func` is called with the dictionary
+        ``{mesh: numpy array of ids}`` returned by ``pickArea()``.
+        """
+        self.areaPickFunction = func
+        if not self.interactor:
+            return self
+        style = vtk.vtkInteractorStyleRubberBand3D()
+
+        def _selectionChanged(obj, event):
+            x0, y0 = obj.GetStartPosition()
+            x1, y1 = obj.GetEndPosition()
+            renderer = self.interactor.FindPokedRenderer(x0, y0)
+            at = self.renderers.index(renderer)
+            res = self.pickArea(x0, y0, x1, y1, at=at, cells=cells)
+            if self.areaPickFunction:
+                self.areaPickFunction(res)
+
+        style.AddObserver("SelectionChangedEvent", _selectionChanged)
+        self.interactor.SetInteractorStyle(style)
+        return self
+
+    def pick(self, x, y, at=None, hardware=None):
+        """Pick the object rendered at display position `(x, y)` (in pixels).
+
+        Returns the picked object, the id of the picked cell, the id of the
+        closest point of that cell and the 3D position of the picked point,
+        or ``(None, -1, -1, None)`` if there is nothing at `(x, y)`.
+
+        :param int at: renderer number, by default the one at position `(x, y)`.
+        :param bool hardware: identify object and cell on the graphics card
+            with a single selection render pass. If False use a cell picker
+            accelerated by a cell locator that is cached for each object.
+            Default is ``settings.hardwarePicking``.
+        """
+        renderer = self._pickRenderer(x, y, at)
+        if hardware is None:
+            hardware = settings.hardwarePicking
+
+        if hardware:
+            sel = self._selector(renderer, cells=True)
+            sel.SetArea(int(x), int(y), int(x), int(y))
+            selection = sel.Select()
+            if not selection.GetNumberOfNodes():
+                return None, -1, -1, None
+            node = selection.GetNode(0)
+            actor = node.GetProperties().Get(vtk.vtkSelectionNode.PROP())
+            cid = int(node.GetSelectionList().GetValue(0))
+            renderer.SetDisplayPoint(x, y, renderer.GetZ(int(x), int(y)))
+            renderer.DisplayToWorld()
+            wp = renderer.GetWorldPoint()
+            pos = np.array(wp[:3]) / wp[3]
+        else:
+            picker = self._cellPicker
+            if picker is None:
+                picker = vtk.vtkCellPicker()
+                picker.SetTolerance(0.0005)
+                self._cellPicker = picker
+            picker.RemoveAllLocators()
+            for a in renderer.GetActors():
+                loc = self._cellLocator(a)
+                if loc:
+                    picker.AddLocator(loc)
+            if not picker.Pick(x, y, 0, renderer):
+                return None, -1, -1, None
+            actor = picker.GetProp3D()
+            cid = picker.GetCellId()
+            pos = np.array(picker.GetPickPosition())
+
+        if not actor:
+            return None, -1, -1, None
+
+        # closest point of the picked cell (e.g. volumes have no cell id)
+        pid = -1
+        mapper = actor.GetMapper() if hasattr(actor, "GetMapper") else None
+        if cid >= 0 and mapper and mapper.GetInput() and cid < mapper.GetInput().GetNumberOfCells():
+            ids = mapper.GetInput().GetCell(cid).GetPointIds()
+            pts = mapper.GetInput().GetPoints()
+            if ids.GetNumberOfIds() and pts:
+                M = vtk.vtkMatrix4x4()
+                M.DeepCopy(actor.GetMatrix())
+                M.Invert()
+                lpos = M.MultiplyPoint(list(pos) + [1])
+                lpos = np.array(lpos[:3]) / lpos[3]
+                cpids = [ids.GetId(i) for i in range(ids.GetNumberOfIds())]
+                cpts = np.array([pts.GetPoint(i) for i in cpids])
+                pid = cpids[np.argmin(np.sum((cpts - lpos)**2, axis=1))]
+
+        return self._pickedObject(actor, renderer), cid, pid, pos
+
+    def pickArea(self, x0, y0, x1, y1, at=None, cells=True):
+        """Select the cells (or the points if `cells=False`) of the objects which are
+        visible in the display rectangle of corners `(x0, y0)` and `(x1, y1)`.
+        Only the front-most visible cells are selected.
+
+        Returns a dictionary ``{object: numpy array of ids}``.
+        """
+        x0, x1 = sorted([int(x0), int(x1)])
+        y0, y1 = sorted([int(y0), int(y1)])
+        renderer = self._pickRenderer(x0, y0, at)
+        sel = self._selector(renderer, cells)
+        sel.SetArea(x0, y0, x1, y1)
+        selection = sel.Select()
+        res = dict()
+        for i in range(selection.GetNumberOfNodes()):
+            node = selection.GetNode(i)
+            actor = node.GetProperties().Get(vtk.vtkSelectionNode.PROP())
+            if not actor:
+                continue
+            actor = self._pickedObject(actor, renderer)
+            ids = vtk_to_numpy(node.GetSelectionList()).astype(int)
+            if actor in res:
+                ids = np.union1d(res[actor], ids)
+            res[actor] = ids
+        return res
+
+    def _pickRenderer(self, x, y, at):
+        if at is not None:
+            return self.renderers[at]
+        if self.interactor:
+            return self.interactor.FindPokedRenderer(int(x), int(y))
+        return self.renderer
+
+    def _selector(self, renderer, cells):
+        if self._hwSelector is None:
+            self._hwSelector = vtk.vtkHardwareSelector()
+        sel = self._hwSelector
+        sel.SetRenderer(renderer)
+        if cells:
+            sel.SetFieldAssociation(vtk.vtkDataObject.FIELD_ASSOCIATION_CELLS)
+        else:
+            sel.SetFieldAssociation(vtk.vtkDataObject.FIELD_ASSOCIATION_POINTS)
+        return sel
+
+    def _cellLocator(self, actor):
+        # cell locator of the input of the actor mapper, rebuilt only if data changes
+        if not actor.GetPickable() or not actor.GetVisibility():
+            return None
+        mapper = actor.GetMapper()
+        if not mapper or not isinstance(mapper.GetInput(), vtk.vtkPolyData):
+            return None
+        data = mapper.GetInput()
+        mt, loc = self._pickLocators.get(actor, (None, None))
+        if mt != data.GetMTime():
+            loc = vtk.vtkCellLocator()
+            loc.SetDataSet(data)
+            loc.BuildLocator()
+            self._pickLocators[actor] = (data.GetMTime(), loc)
+        return loc
+
+    def _pickedObject(self, actor, renderer):
+        # if the picked actor is part of an Assembly (possibly nested)
+        # return the Assembly, as vtkPropPicker does
+        def _contains(asse):
+            parts = asse.GetParts()
+            for i in range(parts.GetNumberOfItems()):
+                p = parts.GetItemAsObject(i)
+                if p == actor or (isinstance(p, vtk.vtkAssembly) and _contains(p)):
+                    return True
+            return False
+
+        props = renderer.GetViewProps()
+        for i in range(props.GetNumberOfItems()):
+            a = props.GetItemAsObject(i)
+            if isinstance(a, vtk.vtkAssembly) and _contains(a):
+                return a
+        return actor
+
+    def clickedIds(self):
+        """Return the id of the cell clicked last and the id of its point closest
+        to the click, or ``(-1, -1)``. They are computed with ``pick()``
+        at the first call after each click, so call it from the click callback
+        function before the scene changes.
+        """
+        if self._lastClick is None:
+            return -1, -1
+        if self._lastClickIds is None:
+            x, y, at = self._lastClick
+            self._lastClickIds = self.pick(x, y, at)[1:3]
+        return self._lastClickIds
+
 
     ##############################################################################
     def show(self, *actors, **options):
@@ -1462,16 +1684,16 @@ class Plotter:
             actors = utils.flatten(actors)
 
         if actors is not None:
-            self.actors = []
             actors2show = scan(actors)
-            for a in actors2show:
-                if a not in self.actors:
-                    self.actors.append(a)
+            seen = set()
+            self.actors = [a for a in actors2show if not (a in seen or seen.add(a))]
         else:
             actors2show = scan(self.actors)
             self.actors = list(actors2show)
 
         if axes is not None:
+            if axes != self.axes:
+                self._dirty = True
             self.axes = axes
 
         #########################################################################
@@ -1527,89 +1749,144 @@ class Plotter:
         if len(self.renderers) == 1:
             self.renderer.SetActiveCamera(self.camera)
 
+        # find out which actors were added, removed or modified since last show().
+        # If the renderer was modified from outside, fall back to a full scan.
+        renmtime, oldstate = self._sceneState.get(at, (None, None))
+        fullscan = oldstate is None or self.renderer.GetMTime() != renmtime
+        newstate = dict()
+        changed = []
+        for ia in actors2show:
+            if not ia:
+                continue
+            sig = _actorSignature(ia)
+            newstate[ia] = sig
+            if fullscan or oldstate.get(ia) != sig:
+                changed.append(ia)
+        if fullscan:
+            removed = None
+        else:
+            removed = [ia for ia in oldstate if ia not in newstate
+                       and isinstance(ia, (vtk.vtkActor, vtk.vtkVolume)) and ia.GetPickable()]
+        if changed or removed or fullscan:
+            self._dirty = True
+
         # rendering
-        for ia in actors2show:  # add the actors that are not already in scene
-            if ia:
+        for ia in changed:  # add the actors that are not already in scene
+            if fullscan or ia not in oldstate:
                 if isinstance(ia, vtk.vtkVolume):
                     self.renderer.AddVolume(ia)
                 else:
                     self.renderer.AddActor(ia)
 
-                if hasattr(ia, 'renderedAt'):
-                    ia.renderedAt.add(at)
-
-                if hasattr(ia, 'scalarbar') and ia.scalarbar:
-                    self.renderer.AddActor(ia.scalarbar)
-                    # fix gray color labels and title to white or black
-                    if isinstance(ia.scalarbar, vtk.vtkScalarBarActor):
-                        ltc = np.array(ia.scalarbar.GetLabelTextProperty().GetColor())
-                        if np.linalg.norm(ltc-(.5,.5,.5))/3 < 0.05:
-                            c = (0.9, 0.9, 0.9)
-                            if np.sum(self.renderer.GetBackground()) > 1.5:
-                                c = (0.1, 0.1, 0.1)
-                            ia.scalarbar.GetLabelTextProperty().SetColor(c)
-                            ia.scalarbar.GetTitleTextProperty().SetColor(c)
-                    if ia.scalarbar not in self.scalarbars:
-                        self.scalarbars.append(ia.scalarbar)
-
-                if hasattr(ia, 'GetTextProperty'):
-                    #fix gray color of corner annotations
-                    cacol = np.array(ia.GetTextProperty().GetColor())
-                    if np.linalg.norm(cacol-(.5,.5,.5))/3 < 0.05:
+            if hasattr(ia, 'renderedAt'):
+                ia.renderedAt.add(at)
+
+            if getattr(ia, '_lod', None):
+                if self.renderer not in self._lodActors:
+                    self._lodActors[self.renderer] = set()
+                    self.renderer.AddObserver("StartEvent", self._lodSwitch)
+                self._lodActors[self.renderer].add(ia)
+                mpr = ia.GetMapper()
+                if self.interactor and hasattr(mpr, "SetInteractiveUpdateRate"):
+                    # the smart volume mapper lowers its quality when a render is
+                    # asked at least at the rate the interactor uses during interaction
+                    mpr.SetInteractiveUpdateRate(self.interactor.GetDesiredUpdateRate())
+
+            if hasattr(ia, 'scalarbar') and ia.scalarbar:
+                self.renderer.AddActor(ia.scalarbar)
+                # fix gray color labels and title to white or black
+                if isinstance(ia.scalarbar, vtk.vtkScalarBarActor):
+                    ltc = np.array(ia.scalarbar.GetLabelTextProperty().GetColor())
+                    if np.linalg.norm(ltc-(.5,.5,.5))/3 < 0.05:
                         c = (0.9, 0.9, 0.9)
                         if np.sum(self.renderer.GetBackground()) > 1.5:
                             c = (0.1, 0.1, 0.1)
-                        ia.GetTextProperty().SetColor(c)
-
-                if hasattr(ia, 'flagText') and self.interactor and not self.offscreen:
-                    #check balloons
-                    if ia.flagText:
-                        if not self.flagWidget: # Create widget on the fly
-                            self._flagRep = vtk.vtkBalloonRepresentation()
-                            self._flagRep.SetBalloonLayoutToImageRight()
-                            breppr = self._flagRep.GetTextProperty()
-                            breppr.SetFontFamilyAsString(settings.flagFont)
-                            breppr.SetFontSize(settings.flagFontSize)
-                            breppr.SetBold(settings.flagBold)
-                            breppr.SetItalic(settings.flagItalic)
-                            breppr.SetColor(colors.getColor(settings.flagColor))
-                            breppr.SetBackgroundColor(colors.getColor(settings.flagBackgroundColor))
-                            breppr.SetShadow(settings.flagShadow)
-                            breppr.SetJustification(settings.flagJustification)
-                            breppr.UseTightBoundingBoxOn()
-                            if settings.flagAngle:
-                                breppr.SetOrientation(settings.flagAngle)
-                                breppr.SetBackgroundOpacity(0)
-                            self.flagWidget = vtk.vtkBalloonWidget()
-                            self.flagWidget.SetTimerDuration(settings.flagDelay)
-                            self.flagWidget.ManagesCursorOff()
-                            self.flagWidget.SetRepresentation(self._flagRep)
-                            self.flagWidget.SetInteractor(self.interactor)
-                            self.widgets.append(self.flagWidget)
-                        bst = self.flagWidget.GetBalloonString(ia)
-                        if bst:
-                            if bst != ia.flagText:
-                                self.flagWidget.UpdateBalloonString(ia, ia.flagText)
-                        else:
-                            self.flagWidget.AddBalloon(ia, ia.flagText)
-                    if ia.flagText is False and self.flagWidget:
-                        self.flagWidget.RemoveBalloon(ia)
+                        ia.scalarbar.GetLabelTextProperty().SetColor(c)
+                        ia.scalarbar.GetTitleTextProperty().SetColor(c)
+                if ia.scalarbar not in self.scalarbars:
+                    self.scalarbars.append(ia.scalarbar)
+
+            if hasattr(ia, 'GetTextProperty'):
+                #fix gray color of corner annotations
+                cacol = np.array(ia.GetTextProperty().GetColor())
+                if np.linalg.norm(cacol-(.5,.5,.5))/3 < 0.05:
+                    c = (0.9, 0.9, 0.9)
+                    if np.sum(self.renderer.GetBackground()) > 1.5:
+                        c = (0.1, 0.1, 0.1)
+                    ia.GetTextProperty().SetColor(c)
+
+            if hasattr(ia, 'flagText') and self.interactor and not self.offscreen:
+                #check balloons
+                if ia.flagText:
+                    if not self.flagWidget: # Create widget on the fly
+                        self._flagRep = vtk.vtkBalloonRepresentation()
+                        self._flagRep.SetBalloonLayoutToImageRight()
+                        breppr = self._flagRep.GetTextProperty()
+                        breppr.SetFontFamilyAsString(settings.flagFont)
+                        breppr.SetFontSize(settings.flagFontSize)
+                        breppr.SetBold(settings.flagBold)
+                        breppr.SetItalic(settings.flagItalic)
+                        breppr.SetColor(colors.getColor(settings.flagColor))
+                        breppr.SetBackgroundColor(colors.getColor(settings.flagBackgroundColor))
+                        breppr.SetShadow(settings.flagShadow)
+                        breppr.SetJustification(settings.flagJustification)
+                        breppr.UseTightBoundingBoxOn()
+                        if settings.flagAngle:
+                            breppr.SetOrientation(settings.flagAngle)
+                            breppr.SetBackgroundOpacity(0)
+                        self.flagWidget = vtk.vtkBalloonWidget()
+                        self.flagWidget.SetTimerDuration(settings.flagDelay)
+                        self.flagWidget.ManagesCursorOff()
+                        self.flagWidget.SetRepresentation(self._flagRep)
+                        self.flagWidget.SetInteractor(self.interactor)
+                        self.widgets.append(self.flagWidget)
+                    bst = self.flagWidget.GetBalloonString(ia)
+                    if bst:
+                        if bst != ia.flagText:
+                            self.flagWidget.UpdateBalloonString(ia, ia.flagText)
+                    else:
+                        self.flagWidget.AddBalloon(ia, ia.flagText)
+                if ia.flagText is False and self.flagWidget:
+                    self.flagWidget.RemoveBalloon(ia)
+
+        txt = self._renderTimeText.get(self.renderer)
+        if txt is not None and not self.renderer.HasViewProp(txt):  # e.g. after clear()
+            self.renderer.AddActor(txt)
+        if settings.showRenderTime and txt is None:
+            txt = vtk.vtkTextActor()
+            txt.SetDisplayPosition(5, 5)
+            txt.GetTextProperty().SetFontSize(12)
+            c = (0.9, 0.9, 0.9)
+            if np.sum(self.renderer.GetBackground()) > 1.5:
+                c = (0.1, 0.1, 0.1)
+            txt.GetTextProperty().SetColor(c)
+            txt.PickableOff()
+            self.renderer.AddActor(txt)
+            self._renderTimeText[self.renderer] = txt
+            self.renderer.AddObserver("StartEvent", self._renderTimeReadout)
 
         # remove the ones that are not in actors2show (and their scalarbar if any)
-        for ia in self.getMeshes(at) + self.getVolumes(at):
-            if ia not in actors2show:
-                self.renderer.RemoveActor(ia)
-                if hasattr(ia, 'scalarbar') and ia.scalarbar:
-                    if isinstance(ia.scalarbar, vtk.vtkActor):
-                        self.renderer.RemoveActor(ia.scalarbar)
-                    elif isinstance(ia.scalarbar, Assembly):
-                        for a in ia.scalarbar.unpack():
-                            self.renderer.RemoveActor(a)
-                if hasattr(ia, 'renderedAt'):
-                    ia.renderedAt.discard(at)
-
-
-        if self.axes is not None:
+        if removed is None:
+            removed = [ia for ia in self.getMeshes(at) + self.getVolumes(at)
+                       if ia not in newstate]
+        for ia in removed:
+            self.renderer.RemoveActor(ia)
+            if hasattr(ia, 'scalarbar') and ia.scalarbar:
+                if isinstance(ia.scalarbar, vtk.vtkActor):
+                    self.renderer.RemoveActor(ia.scalarbar)
+                elif isinstance(ia.scalarbar, Assembly):
+                    for a in ia.scalarbar.unpack():
+                        self.renderer.RemoveActor(a)
+            if hasattr(ia, 'renderedAt'):
+                ia.renderedAt.discard(at)
+
+
+        if (zoom or azimuth or elevation or roll or camera is not None
+            or (self._first_viewup and len(viewup))
+            or self.camera.GetMTime() != self._sceneState.get(('cammtime', at))):
+            self._dirty = True
+
+        if self._dirty and self.axes is not None:
             if viewup != "2d" or self.axes in [1, 8] or isinstance(self.axes, dict):
                 addons.addGlobalAxes(self.axes)
 
@@ -1618,9 +1895,10 @@ class Plotter:
             return backends.getNotebookBackend(0, 0, 0)
         #########################################################################
 
-        addons.addLegend()
+        if self._dirty:
+            addons.addLegend()
 
-        if resetcam: #or self.initializedIren == False:
+        if resetcam and self._dirty: #or self.initializedIren == False:
             self.renderer.ResetCamera()
 
         if settings.showRendererFrame and len(self.renderers) > 1:
@@ -1682,10 +1960,15 @@ class Plotter:
             if cm_thickness is not None: self.camera.SetThickness(cm_thickness)
             if cm_viewAngle is not None: self.camera.SetViewAngle(cm_viewAngle)
 
-        if resetcam:
-            self.renderer.ResetCameraClippingRange()
+        if self._dirty:
+            if resetcam:
+                self.renderer.ResetCameraClippingRange()
 
-        self.window.Render() ############################# <----
+            self.window.Render() ############################# <----
+
+            self._dirty = False
+            self._sceneState[at] = (self.renderer.GetMTime(), newstate)
+            self._sceneState[('cammtime', at)] = self.camera.GetMTime()
 
 
         #########################################################################
@@ -1748,6 +2031,38 @@ class Plotter:
         return self
 
 
+    def _lodSwitch(self, ren, event):
+        # before each render choose the level of detail of the meshes and volumes
+        # which have one: full resolution when still, while interacting the finest
+        # level which keeps the frame rate. The render time is assumed proportional
+        # to the number of points (vertices or voxels) of the rendered levels.
+        acts = [a for a in self._lodActors[ren] if ren.HasViewProp(a) and a._lod]
+        self._lodActors[ren] = set(acts)
+        if not acts:
+            return
+        fraction = None
+        if (self.interactor and self.window.GetDesiredUpdateRate()
+                > self.interactor.GetStillUpdateRate()):
+            used = max(a._lod["fraction"] or 1.0 for a in acts)
+            t = ren.GetLastRenderTimeInSeconds()
+            fraction = used
+            if t > 0:
+                fraction = min(1.0, used / (t * settings.interactiveFrameRate))
+        for a in acts:
+            a._lodSelect(fraction)
+
+    def _renderTimeReadout(self, ren, event):
+        # display the time of the previous frame and the current level of detail
+        t = ren.GetLastRenderTimeInSeconds()
+        msg = "frame: %.1f ms" % (t * 1000)
+        if t > 0:
+            msg += " (%.1f fps)" % (1 / t)
+        used = [a._lod["fraction"] for a in self._lodActors.get(ren, ())
+                if a._lod and a._lod["fraction"]]
+        if used:
+            msg += ", detail: %g%%" % round(100 * min(used), 1)
+        self._renderTimeText[ren].SetInput(msg)
+
     def showInset(self, *actors, **options):
         """Add a draggable inset space into a renderer.
 
@@ -1796,9 +2111,114 @@ class Plotter:
                 self.actors.remove(a)
         return widget
 
+    def captureViews(self, cameras=None, azimuth=(0,), elevation=(0,),
+                     filename=None, ncols=None, scale=1):
+        """
+        Render the current scene from a list of viewpoints and grab the images
+        using a single persistent capture filter.
+        The actors are not re-scanned and the camera is not reset between views.
+
+        :param list cameras: list of ``vtkCamera`` objects or dictionaries of camera
+            parameters (as in ``show(camera=...)``).
+        :param list azimuth: if `cameras` is not given, build a grid of views by
+            rotating the current camera by these azimuth angles...
+        :param list elevation: ...and these elevation angles.
+        :param str filename: if given, also save a contact sheet of all the views.
+        :param int ncols: number of columns of the contact sheet.
+        :param int scale: image magnification.
+
+        :return: a numpy array of shape `(V, H, W, C)`.
+
+        :Example:
+            .. code-block:: python
+
+                from vtkplotter import *
+                vp = Plotter(offscreen=True)
+                vp.show(load(datadir+'bunny.obj'))
+                # a 36 frames turntable:
+                imgs = vp.captureViews(azimuth=range(0, 360, 10), filename='sheet.png')
+        """
+        if not self.initializedPlotter:
+            self.show(interactive=False)
+        if not hasattr(self, 'window') or not self.window:
+            colors.printc('~bomb captureViews(): rendering window is not present.', c=1)
+            return None
+
+        cam = self.renderer.GetActiveCamera()
+        cam0 = vtk.vtkCamera()
+        cam0.DeepCopy(cam)
+
+        if cameras is None:
+            cameras = []
+            for el in elevation:
+                for az in azimuth:
+                    c = vtk.vtkCamera()
+                    c.DeepCopy(cam0)
+                    c.Azimuth(az)
+                    c.Elevation(el)
+                    c.OrthogonalizeViewUp()
+                    cameras.append(c)
+
+        if self._captureFilter is None:
+            self._captureFilter = vtk.vtkWindowToImageFilter()
+            self._captureFilter.SetInput(self.window)
+            self._captureFilter.ReadFrontBufferOff()
+        w2if = self._captureFilter
+        if hasattr(w2if, 'SetScale'):
+            w2if.SetScale(scale, scale)
+        if settings.screenshotTransparentBackground:
+            w2if.SetInputBufferTypeToRGBA()
+        else:
+            w2if.SetInputBufferTypeToRGB()
+
+        images = None
+        for i, c in enumerate(cameras):
+            if isinstance(c, dict):
+                cm = vtk.vtkCamera()
+                cm.DeepCopy(cam0)
+                if "pos" in c: cm.SetPosition(c["pos"])
+                if "focalPoint" in c: cm.SetFocalPoint(c["focalPoint"])
+                if "viewup" in c: cm.SetViewUp(c["viewup"])
+                if "distance" in c: cm.SetDistance(c["distance"])
+                if "parallelScale" in c: cm.SetParallelScale(c["parallelScale"])
+                if "viewAngle" in c: cm.SetViewAngle(c["viewAngle"])
+                c = cm
+            cam.DeepCopy(c)
+            self.renderer.ResetCameraClippingRange()
+            self.window.Render()
+            w2if.Modified()
+            w2if.Update()
+            img = w2if.GetOutput()
+            xdim, ydim, _ = img.GetDimensions()
+            arr = vtk_to_numpy(img.GetPointData().GetScalars())
+            if images is None:
+                nc = arr.shape[1]
+                images = np.zeros([len(cameras), ydim, xdim, nc], dtype=np.uint8)
+            images[i] = np.flip(arr.reshape([ydim, xdim, -1]), axis=0)
+
+        cam.DeepCopy(cam0)
+        self.renderer.ResetCameraClippingRange()
+        self.window.Render()
+
+        if filename and images is not None:
+            nv, h, w, nc = images.shape
+            if not ncols:
+                ncols = int(np.ceil(np.sqrt(nv)))
+            nrows = int(np.ceil(nv / ncols))
+            sheet = np.zeros([nrows*h, ncols*w, nc], dtype=np.uint8)
+            for i in range(nv):
+                r, k = divmod(i, ncols)
+                sheet[r*h:(r+1)*h, k*w:(k+1)*w] = images[i]
+            sheet = np.ascontiguousarray(np.flip(sheet, axis=0)).reshape([-1, nc])
+            vtkio._writeImage(sheet, (ncols*w, nrows*h, 1), filename)
+        return images
+
     def clear(self, actors=None):
         """Delete specified list of actors, by default delete all."""
+        self._dirty = True
         if actors is None:
+            self._pickLocators = dict()
+            self._forgetScene()
             self.renderer.RemoveAllViewProps()
             self.actors = []
             settings.collectable_actors = []
@@ -1855,28 +2275,7 @@ class Plotter:
     #######################################################################
     def _mouseleft(self, iren, event):
 
-        x, y = iren.GetEventPosition()
-        #print('_mouseleft mouse at', x, y)
-
-        renderer = iren.FindPokedRenderer(x, y)
-        self.renderer = renderer
-
-        picker = vtk.vtkPropPicker()
-        picker.PickProp(x, y, renderer)
-        clickedActor = picker.GetActor()
-
-        # check if any button objects are clicked
-        clickedActor2D = picker.GetActor2D()
-        if clickedActor2D:
-            for bt in self.buttons:
-                if clickedActor2D == bt.actor:
-                    bt.function()
-                    break
-
-        if not clickedActor:
-            clickedActor = picker.GetAssembly()
-
-        self.picked3d = picker.GetPickPosition()
+        clickedActor = self._pickEvent(iren)
 
         self.justremoved = None
 
@@ -1885,7 +2284,7 @@ class Plotter:
 
         self.clickedActor = clickedActor
         if hasattr(clickedActor, 'picked3d'):
-            clickedActor.picked3d = picker.GetPickPosition()
+            clickedActor.picked3d = self.picked3d
 
         if self.mouseLeftClickFunction:
             self.mouseLeftClickFunction(clickedActor)
@@ -1893,26 +2292,7 @@ class Plotter:
 
     def _mouseright(self, iren, event):
 
-        x, y = iren.GetEventPosition()
-
-        renderer = iren.FindPokedRenderer(x, y)
-        self.renderer = renderer
-
-        picker = vtk.vtkPropPicker()
-        picker.PickProp(x, y, renderer)
-        clickedActor = picker.GetActor()
-
-        # check if any button objects were created
-        clickedActor2D = picker.GetActor2D()
-        if clickedActor2D:
-            for bt in self.buttons:
-                if clickedActor2D == bt.actor:
-                    bt.function()
-                    break
-
-        if not clickedActor:
-            clickedActor = picker.GetAssembly()
-        self.picked3d = picker.GetPickPosition()
+        clickedActor = self._pickEvent(iren)
 
         if not hasattr(clickedActor, "GetPickable") or not clickedActor.GetPickable():
             return
@@ -1924,16 +2304,29 @@ class Plotter:
 
     def _mousemiddle(self, iren, event):
 
+        clickedActor = self._pickEvent(iren)
+
+        if not hasattr(clickedActor, "GetPickable") or not clickedActor.GetPickable():
+            return
+        self.clickedActor = clickedActor
+
+        if self.mouseMiddleClickFunction:
+            self.mouseMiddleClickFunction(self.clickedActor)
+
+
+    def _pickEvent(self, iren):
+        # common to all mouse clicks: check buttons and pick the 3d object
         x, y = iren.GetEventPosition()
 
         renderer = iren.FindPokedRenderer(x, y)
         self.renderer = renderer
 
-        picker = vtk.vtkPropPicker()
+        if self._propPicker is None:
+            self._propPicker = vtk.vtkPropPicker()
+        picker = self._propPicker
         picker.PickProp(x, y, renderer)
-        clickedActor = picker.GetActor()
 
-        # check if any button objects were created
+        # check if any button objects are clicked
         clickedActor2D = picker.GetActor2D()
         if clickedActor2D:
             for bt in self.buttons:
@@ -1941,16 +2334,17 @@ class Plotter:
                     bt.function()
                     break
 
+        clickedActor = picker.GetActor()
         if not clickedActor:
             clickedActor = picker.GetAssembly()
+        if not clickedActor:
+            clickedActor = picker.GetVolume()
         self.picked3d = picker.GetPickPosition()
 
-        if not hasattr(clickedActor, "GetPickable") or not clickedActor.GetPickable():
-            return
-        self.clickedActor = clickedActor
-
-        if self.mouseMiddleClickFunction:
-            self.mouseMiddleClickFunction(self.clickedActor)
+        # cell and point ids need a selection pass, done only if asked by clickedIds()
+        self._lastClick = (x, y, self.renderers.index(renderer))
+        self._lastClickIds = None
+        return clickedActor
 
 
     def _keypress(self, iren, event):
@@ -41,6 +41,9 @@ General settings.
     # Allow to interact with scene during interactor.Start() execution
     allowInteraction = True
 
+    # Plotter.pick() and clickedIds() find the cell on the graphics card (if False use a cell locator)
+    hardwarePicking = True
+
     # Flag-style label options
     flagDelay    = 150       # popup delay in milliseconds
     flagFont     = "Courier" # font type ("Arial", "Courier", "Times")
@@ -110,9 +113,23 @@ General settings.
     # Set parallel projection On or Off (place camera to infinity, no perspective effects)
     useParallelProjection = False
 
+    # Target frame rate while rotating or zooming the scene
+    # (meshes and volumes with lod() are rendered at a lower resolution to keep it)
+    interactiveFrameRate = 15
+    showRenderTime = False  # display the time taken to render each frame
+
     # Path to Voro++ library, http://math.lbl.gov/voro++
     voro_path = '/usr/local/bin'
 
+    # Directory of the on-disk cache of expensive operations (None disables it)
+    cacheDir = None
+    # Maximum size of the cache in MB, least recently used entries are removed first
+    cacheSize = 1024
+
+    # Multithreading of the VTK filters (see vtkplotter.parallel.configureSMP())
+    smpBackend = None   # 'Sequential', 'STDThread', 'TBB' or 'OpenMP'. None keeps the default
+    numThreads = None   # max nr of threads per filter. None keeps the default
+
 
 Usage example:
 
@@ -154,6 +171,9 @@ interactorStyle = None
 # Allow to interact with scene during interactor.Start() execution
 allowInteraction = True
 
+# Plotter.pick() and clickedIds() find the cell on the graphics card (if False use a cell locator)
+hardwarePicking = True
+
 # Flag-style label options
 flagDelay = 150         # popup delay in milliseconds
 flagFont = "Courier"   # font type ("Arial", "Courier", "Times")
@@ -224,9 +244,28 @@ useParallelProjection = False
 # In multirendering mode set the position of the horizontal of vertical splitting [0,1]
 windowSplittingPosition = None
 
+# Target frame rate while rotating or zooming the scene
+# (meshes and volumes with lod() are rendered at a lower resolution to keep it)
+interactiveFrameRate = 15
+
+# Display the time taken to render each frame and the current level of detail
+showRenderTime = False
+
 # Path to Voro++ library, http://math.lbl.gov/voro++
 voro_path = '/usr/local/bin'
 
+# Directory of the on-disk cache of expensive operations (None disables it)
+cacheDir = None
+
+# Maximum size of the cache in MB, least recently used entries are removed first
+cacheSize = 1024
+
+# Multithreading of the VTK filters, applied by vtkplotter.parallel.configureSMP()
+# and by vtkplotter.parallel.map(). Backend can be 'Sequential', 'STDThread',
+# 'TBB' or 'OpenMP' (depending on the VTK build). None keeps the VTK default.
+smpBackend = None
+numThreads = None
+
 
 ####################################################################################
 # notebook support with K3D
@@ -4,7 +4,7 @@ import numpy as np
 from vtkplotter import settings
 from vtk.util.numpy_support import numpy_to_vtk
 import vtkplotter.utils as utils
-from vtkplotter.colors import printc, getColor, colorMap, _mapscales
+from vtkplotter.colors import printc, getColor, colorMap, _getMapScales
 from vtkplotter.mesh import Mesh
 from vtkplotter.picture import Picture
 import vtkplotter.docs as docs
@@ -285,7 +285,7 @@ class Glyph(Mesh):
             glyphObj = glyphObj.clean().polydata()
 
         cmap=''
-        if c in list(_mapscales.cmap_d.keys()):
+        if c in list(_getMapScales().cmap_d.keys()):
             cmap = c
             c = None
         elif utils.isSequence(c): # user passing an array of point colors
@@ -2122,31 +2122,20 @@ class Text(Mesh):
             else:
                 c = (0.6, 0.6, 0.6)
 
-        # otherwise build the 3D text, fonts do not apply
-        tt = vtk.vtkVectorText()
-        tt.SetText(str(txt))
-        tt.Update()
-        tpoly = tt.GetOutput()
-
-        bb = tpoly.GetBounds()
-        dx, dy = (bb[1] - bb[0]) / 2 * s, (bb[3] - bb[2]) / 2 * s
-        cm = np.array([(bb[1] + bb[0]) / 2,
-                       (bb[3] + bb[2]) / 2,
-                       (bb[5] + bb[4]) / 2]) * s
-        shift = -cm
-        if "bottom" in justify: shift += np.array([  0, dy, 0])
-        if "top"    in justify: shift += np.array([  0,-dy, 0])
-        if "left"   in justify: shift += np.array([ dx,  0, 0])
-        if "right"  in justify: shift += np.array([-dx,  0, 0])
-
-        t = vtk.vtkTransform()
-        t.Translate(shift)
-        t.Scale(s, s, s)
-        tf = vtk.vtkTransformPolyDataFilter()
-        tf.SetInputData(tpoly)
-        tf.SetTransform(t)
-        tf.Update()
-        tpoly = tf.GetOutput()
+        # otherwise build the 3D text from the cached glyphs, fonts do not apply
+        pts, tris, _ = utils._vectorTextLayout([txt])
+        dy = 0
+        if len(pts):
+            bmin, bmax = pts.min(axis=0), pts.max(axis=0)
+            dx, dy = (bmax[0] - bmin[0]) / 2 * s, (bmax[1] - bmin[1]) / 2 * s
+            shift = -(bmin + bmax) / 2 * s
+            if "bottom" in justify: shift += np.array([  0, dy, 0])
+            if "top"    in justify: shift += np.array([  0,-dy, 0])
+            if "left"   in justify: shift += np.array([ dx,  0, 0])
+            if "right"  in justify: shift += np.array([-dx,  0, 0])
+            tpoly = utils.buildPolyData(pts * s + shift, tris)
+        else:
+            tpoly = vtk.vtkPolyData()
 
         if depth:
             extrude = vtk.vtkLinearExtrusionFilter()
@@ -1,6 +1,6 @@
 from __future__ import division, print_function
 import vtk, sys
-from vtk.util.numpy_support import numpy_to_vtk, numpy_to_vtkIdTypeArray
+from vtk.util.numpy_support import numpy_to_vtk, numpy_to_vtkIdTypeArray, vtk_to_numpy
 import numpy as np
 import vtkplotter.colors as colors
 import vtkplotter.docs as docs
@@ -41,6 +41,8 @@ __all__ = [
     "vtkCameraToK3D",
     "vtk2trimesh",
     "trimesh2vtk",
+    "cached",
+    "clearCache",
 ]
 
 ###########################################################################
@@ -257,7 +259,10 @@ def buildPolyData(vertices, faces=None, lines=None, indexOffset=0, fast=True, te
 
     # faces exist
     sourcePolygons = vtk.vtkCellArray()
-    faces = np.array(faces)
+    try:
+        faces = np.array(faces)
+    except ValueError: # faces have different nr of vertices
+        faces = np.array(faces, dtype=object)
     if len(faces.shape) == 2 and indexOffset==0 and fast:
         #################### all faces are composed of equal nr of vtxs, FAST
 
@@ -337,6 +342,107 @@ def buildPolyData(vertices, faces=None, lines=None, indexOffset=0, fast=True, te
     poly.SetPolys(sourcePolygons)
     return poly
 
+
+##############################################################################
+_glyphAtlas = None  # triangulated characters of vtkVectorText, built once
+
+def _getGlyphAtlas():
+    # Triangulate all the printable characters of vtkVectorText once.
+    # Returns the points and triangles (with ids local to each glyph)
+    # and, indexed by character code, the glyph offsets, sizes and widths.
+    global _glyphAtlas
+    if _glyphAtlas is not None:
+        return _glyphAtlas
+
+    def _vt(txt):
+        tt = vtk.vtkVectorText()
+        tt.SetText(txt)
+        tt.Update()
+        poly = tt.GetOutput()
+        if not poly.GetNumberOfPoints():
+            return np.zeros((0, 3)), np.zeros((0, 3), dtype=int)
+        pts = vtk_to_numpy(poly.GetPoints().GetData()).copy()
+        tris = vtk_to_numpy(poly.GetPolys().GetData()).reshape(-1, 4)[:, 1:]
+        return pts, tris
+
+    xref = np.min(_vt("I")[0][:, 0])
+    allpts, alltris = [], []
+    pstart, pn = np.zeros(128, dtype=int), np.zeros(128, dtype=int)
+    tstart, tn = np.zeros(128, dtype=int), np.zeros(128, dtype=int)
+    advance = np.zeros(128)
+    advance[32] = 0.4  # space
+    npts = ntris = 0
+    for code in range(33, 127):
+        ch = chr(code)
+        pts, tris = _vt(ch)
+        if not len(pts):
+            continue
+        # vtkVectorText does not expose the character width:
+        # measure where a following reference letter starts
+        advance[code] = np.min(_vt(ch + "I")[0][len(pts):, 0]) - xref
+        pstart[code], pn[code] = npts, len(pts)
+        tstart[code], tn[code] = ntris, len(tris)
+        allpts.append(pts)
+        alltris.append(tris)
+        npts += len(pts)
+        ntris += len(tris)
+    _glyphAtlas = (np.concatenate(allpts), np.concatenate(alltris),
+                   pstart, pn, tstart, tn, advance)
+    return _glyphAtlas
+
+
+def _vectorTextLayout(texts):
+    """Lay out a list of strings at once, giving the same polygons of ``vtkVectorText``.
+
+    Returns the points, the triangles and, for each point, the index of its string.
+    """
+    apts, atris, pstart, pn, tstart, tn, advance = _getGlyphAtlas()
+    texts = [str(t) for t in texts]
+    lengths = np.array([len(t) for t in texts], dtype=int)
+    codes = np.frombuffer("".join(texts).encode("utf-32-le"), dtype=np.uint32).astype(int)
+    codes[codes > 126] = 0  # like vtkVectorText, skip what it can't draw
+    nch = len(codes)
+    if not nch:
+        return np.zeros((0, 3), dtype=apts.dtype), np.zeros((0, 3), dtype=int), np.zeros(0, dtype=int)
+
+    # line number and x position of each character inside its string
+    labs = np.repeat(np.arange(len(texts)), lengths)
+    first = np.cumsum(lengths) - lengths
+    newline = codes == 10
+    nlbefore = np.cumsum(newline) - newline
+    line = nlbefore - nlbefore[first][labs]
+    start = np.zeros(nch, dtype=bool)
+    start[first[lengths > 0]] = True
+    start[1:] |= newline[:-1]
+    adv = advance[codes]
+    xbefore = np.cumsum(adv) - adv
+    x = xbefore - xbefore[start][np.cumsum(start) - 1]
+
+    # copy the glyph points and triangles of each character
+    n = pn[codes]
+    pchar = np.repeat(np.arange(nch), n)
+    pout = np.cumsum(n) - n
+    pts = apts[pstart[codes][pchar] + np.arange(n.sum()) - pout[pchar]]
+    pts[:, 0] += x[pchar]
+    pts[:, 1] -= 1.4 * line[pchar]
+    m = tn[codes]
+    tchar = np.repeat(np.arange(nch), m)
+    tris = atris[tstart[codes][tchar] + np.arange(m.sum()) - (np.cumsum(m) - m)[tchar]]
+    tris = tris + pout[tchar][:, None]
+    return pts, tris, labs[pchar]
+
+
+def _vectorTextBounds(pts, plabs, n):
+    # min and max corners of each of the n strings laid out by _vectorTextLayout()
+    bmin, bmax = np.zeros((n, 3)), np.zeros((n, 3))
+    has = np.bincount(plabs, minlength=n) > 0
+    if len(pts):
+        idx = np.searchsorted(plabs, np.arange(n))[has]
+        bmin[has] = np.minimum.reduceat(pts, idx, axis=0)
+        bmax[has] = np.maximum.reduceat(pts, idx, axis=0)
+    return bmin, bmax, has
+
+
 ##############################################################################
 def isSequence(arg):
     """Check if input is iterable."""
@@ -1497,3 +1603,243 @@ def trimesh2vtk(inputobj, alphaPerCell=False):
 
     return None
 
+
+
+###########################################################################
+# Persistent on-disk cache of expensive operations
+def _hashUpdate(h, obj):
+    """Feed the content of `obj` (meshes, volumes, vtk datasets, numpy arrays,
+    sequences and plain values) into the hash object `h`."""
+    if isinstance(obj, vtk.vtkProp3D):
+        if hasattr(obj, "_polydata"):
+            _hashUpdate(h, obj._polydata)
+        elif hasattr(obj, "_imagedata"):
+            _hashUpdate(h, obj._imagedata)
+        elif hasattr(obj, "unpack"):
+            _hashUpdate(h, obj.unpack())
+        M = obj.GetMatrix()
+        h.update(np.array([M.GetElement(i, j) for i in range(4) for j in range(4)]))
+    elif isinstance(obj, vtk.vtkDataSet):
+        h.update(obj.GetClassName().encode())
+        if isinstance(obj, vtk.vtkImageData):
+            h.update(np.array(obj.GetDimensions() + obj.GetSpacing() + obj.GetOrigin()))
+        elif obj.GetNumberOfPoints():
+            _hashUpdate(h, vtk_to_numpy(obj.GetPoints().GetData()))
+        cellarrs = []
+        if isinstance(obj, vtk.vtkPolyData):
+            cellarrs = [obj.GetVerts(), obj.GetLines(), obj.GetPolys(), obj.GetStrips()]
+        elif hasattr(obj, "GetCells") and obj.GetCells():
+            cellarrs = [obj.GetCells()]
+            if hasattr(obj, "GetCellTypesArray") and obj.GetCellTypesArray():
+                _hashUpdate(h, vtk_to_numpy(obj.GetCellTypesArray()))
+        for ca in cellarrs:
+            if hasattr(ca, "GetConnectivityArray"):
+                _hashUpdate(h, vtk_to_numpy(ca.GetOffsetsArray()))
+                _hashUpdate(h, vtk_to_numpy(ca.GetConnectivityArray()))
+            else:
+                _hashUpdate(h, vtk_to_numpy(ca.GetData()))
+        for data in (obj.GetPointData(), obj.GetCellData()):
+            for i in range(data.GetNumberOfArrays()):
+                arr = data.GetArray(i)
+                if arr is None:
+                    continue
+                h.update(str(arr.GetName()).encode())
+                _hashUpdate(h, vtk_to_numpy(arr))
+    elif isinstance(obj, np.ndarray):
+        h.update((obj.dtype.str + str(obj.shape)).encode())
+        if obj.dtype.hasobject:
+            h.update(repr(obj.tolist()).encode())
+        else:
+            h.update(np.ascontiguousarray(obj).view(np.uint8))
+    elif isinstance(obj, dict):
+        h.update(b"{")
+        for k in sorted(obj, key=str):
+            h.update(repr(k).encode())
+            _hashUpdate(h, obj[k])
+        h.update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        h.update(b"[")
+        for o in obj:
+            _hashUpdate(h, o)
+            h.update(b",")
+        h.update(b"]")
+    else:
+        h.update(repr(obj).encode())
+
+
+def _vtkToBytes(data):
+    # XML format: unlike the legacy one it keeps the full precision
+    # of the origin and spacing of image data
+    w = vtk.vtkXMLDataObjectWriter.NewWriter(data.GetDataObjectType())
+    w.SetInputData(data)
+    w.SetDataModeToBinary()  # base64 encoded arrays
+    w.WriteToOutputStringOn()
+    if not w.Write():
+        raise RuntimeError()
+    return w.GetOutputString().encode("ascii")
+
+
+def _vtkFromBytes(b):
+    import re
+    b = b.decode("ascii")
+    dtype = re.search(r'<VTKFile type="(\w+)"', b).group(1)
+    r = getattr(vtk, "vtkXML" + dtype + "Reader")()
+    r.ReadFromInputStringOn()
+    r.SetInputString(b)
+    r.Update()
+    return r.GetOutput()
+
+
+def _cacheEncode(obj, args):
+    """Convert the output of a cached function into a picklable structure."""
+    if isinstance(obj, vtk.vtkProp3D) and hasattr(obj, "_polydata"):
+        if len(args) and obj is args[0]:  # method modifying the object in place
+            return ("self", _vtkToBytes(obj._polydata))
+        pr = obj.GetProperty()
+        props = dict(color=pr.GetColor(), alpha=pr.GetOpacity(),
+                     lw=pr.GetLineWidth(), ps=pr.GetPointSize(),
+                     representation=pr.GetRepresentation(),
+                     scalars=obj.GetMapper().GetScalarVisibility())
+        return ("mesh", _vtkToBytes(obj._polydata), props, obj.info)
+    elif isinstance(obj, vtk.vtkProp3D) and hasattr(obj, "_imagedata"):
+        if len(args) and obj is args[0]:
+            return ("self", _vtkToBytes(obj._imagedata))
+        return ("volume", _vtkToBytes(obj._imagedata), obj.info)
+    elif isinstance(obj, vtk.vtkDataObject):
+        return ("vtk", _vtkToBytes(obj))
+    elif isinstance(obj, (list, tuple)):
+        return ("seq", type(obj) is tuple, [_cacheEncode(o, args) for o in obj])
+    return ("raw", obj)
+
+
+def _cacheDecode(data, args):
+    kind = data[0]
+    if kind == "self":
+        return args[0]._update(_vtkFromBytes(data[1]))
+    elif kind == "mesh":
+        from vtkplotter.mesh import Mesh
+        props = data[2]
+        m = Mesh(_vtkFromBytes(data[1]), c=props["color"], alpha=props["alpha"])
+        pr = m.GetProperty()
+        pr.SetLineWidth(props["lw"])
+        pr.SetPointSize(props["ps"])
+        pr.SetRepresentation(props["representation"])
+        m.GetMapper().SetScalarVisibility(props["scalars"])
+        m.info = data[3]
+        return m
+    elif kind == "volume":
+        from vtkplotter.volume import Volume
+        v = Volume(_vtkFromBytes(data[1]))
+        v.info = data[2]
+        return v
+    elif kind == "vtk":
+        return _vtkFromBytes(data[1])
+    elif kind == "seq":
+        out = [_cacheDecode(d, args) for d in data[2]]
+        return tuple(out) if data[1] else out
+    return data[1]
+
+
+def _cacheEvict(cachedir, maxsize):
+    """Remove the least recently used entries until the cache fits in `maxsize` bytes."""
+    import os
+    entries = []
+    for f in os.listdir(cachedir):
+        if f.endswith(".vpc"):
+            st = os.stat(os.path.join(cachedir, f))
+            entries.append((st.st_mtime, st.st_size, f))
+    total = sum(e[1] for e in entries)
+    for _, size, f in sorted(entries):
+        if total <= maxsize:
+            break
+        try:
+            os.remove(os.path.join(cachedir, f))
+        except OSError:
+            pass
+        total -= size
+
+
+def cached(func):
+    """
+    Decorator to store the results of a deterministic function on disk.
+
+    Caching is disabled unless ``settings.cacheDir`` is set to a directory.
+    The key of each entry is a hash of the function name and of its arguments,
+    where meshes and volumes are hashed through their points, connectivity, arrays
+    and transformation matrix.
+    Results are stored in ``settings.cacheDir`` in VTK XML format, and the least
+    recently used entries are removed when the cache exceeds ``settings.cacheSize`` MB.
+
+    :Example:
+        .. code-block:: python
+
+            from vtkplotter import *
+
+            settings.cacheDir = '/tmp/vtkplotter_cache'
+
+            @cached
+            def smoothed(mesh, niter):
+                return mesh.clone().smoothLaplacian(niter)
+
+            s = smoothed(load(datadir+'bunny.obj'), 100) # slow only the first time
+    """
+    import functools
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        import vtkplotter.settings as settings
+        cachedir = settings.cacheDir
+        if not cachedir:
+            return func(*args, **kwargs)
+
+        import os, hashlib, pickle
+        from vtkplotter.version import _version
+
+        try:
+            import inspect
+            bound = inspect.signature(func).bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+        except (AttributeError, TypeError, ValueError):
+            params = [args, kwargs]
+        h = hashlib.blake2b(digest_size=20) if hasattr(hashlib, "blake2b") else hashlib.sha1()
+        h.update((func.__module__ + "." + getattr(func, "__qualname__", func.__name__)
+                  + _version + vtk.vtkVersion.GetVTKVersion()).encode())
+        _hashUpdate(h, params)
+        fname = os.path.join(cachedir, h.hexdigest() + ".vpc")
+
+        if os.path.isfile(fname):
+            try:
+                with open(fname, "rb") as f:
+                    data = pickle.load(f)
+                os.utime(fname, None)  # mark as recently used
+                return _cacheDecode(data, args)
+            except Exception:
+                pass  # corrupted or incompatible entry, recompute it
+
+        result = func(*args, **kwargs)
+        try:
+            data = pickle.dumps(_cacheEncode(result, args), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return result  # not cacheable
+        if not os.path.isdir(cachedir):
+            os.makedirs(cachedir)
+        tmpname = fname + ".%d.tmp" % os.getpid()
+        with open(tmpname, "wb") as f:
+            f.write(data)
+        os.replace(tmpname, fname)  # atomic, safe with concurrent writers
+        if settings.cacheSize:
+            _cacheEvict(cachedir, settings.cacheSize * 1024 * 1024)
+        return result
+
+    return wrapper
+
+
+def clearCache():
+    """Remove all the entries stored by functions decorated with ``cached``."""
+    import os
+    import vtkplotter.settings as settings
+    if settings.cacheDir and os.path.isdir(settings.cacheDir):
+        for f in os.listdir(settings.cacheDir):
+            if f.endswith(".vpc"):
+                os.remove(os.path.join(settings.cacheDir, f))
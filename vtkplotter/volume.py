@@ -218,6 +218,66 @@ class Volume(vtk.vtkVolume, ActorBase):
             return self
         return None
 
+    def lod(self, levels=(2,), background=True, maxImageSampleDistance=4):
+        """
+        Lower the rendering quality while the camera moves, to keep the frame rate
+        above ``settings.interactiveFrameRate``. Full quality is restored when it stops.
+
+        The mapper adapts its sample distances to the time available for each frame,
+        and downsampled copies of the volume are rendered instead of the full resolution
+        one when this is not enough (e.g. on machines without a GPU).
+
+        :param list levels: downsampling factors of the precomputed copies along each axis,
+            a factor `k` keeps about ``1/k**3`` of the voxels. Pass an empty list to only adapt the sample distances,
+            which avoids uploading a new texture to the GPU at each interaction.
+        :param bool background: compute the copies in a background thread.
+        :param float maxImageSampleDistance: coarsest spacing of the cast rays, in pixels.
+
+        Set ``settings.showRenderTime = True`` to display the time of each frame.
+        Use ``lodInfo()`` to check the size of each level.
+        """
+        mpr = self._mapper
+        if hasattr(mpr, "SetAutoAdjustSampleDistances"):
+            mpr.SetAutoAdjustSampleDistances(True)
+        if hasattr(mpr, "SetInteractiveAdjustSampleDistances"):  # smart mapper
+            mpr.SetInteractiveAdjustSampleDistances(True)
+        if hasattr(mpr, "SetMaximumImageSampleDistance"):
+            mpr.SetMaximumImageSampleDistance(maxImageSampleDistance)
+
+        img = self._imagedata
+        dims = img.GetDimensions()
+        lod = dict(key=self._lodData()[1], levels=[], fraction=None, thread=None)
+
+        def _build():
+            for k in sorted(levels):
+                if k <= 1:
+                    continue
+                shrink = vtk.vtkImageShrink3D()
+                shrink.SetInputData(img)
+                shrink.SetShrinkFactors([int(min(k, max(d // 2, 1))) for d in dims])
+                shrink.AveragingOn()
+                shrink.Update()
+                out = shrink.GetOutput()
+                fraction = out.GetNumberOfPoints() / float(img.GetNumberOfPoints())
+                lod["levels"].append((fraction, out))  # from fine to coarse
+
+        self._lod = lod
+        self._mapper.Modified()  # let the Plotter know at next show()
+        if background:
+            import threading
+            lod["thread"] = threading.Thread(target=_build)
+            lod["thread"].daemon = True
+            lod["thread"].start()
+        else:
+            _build()
+        return self
+
+    def _lodData(self):
+        # full resolution data and the key which tells if the levels are still valid
+        img = self._imagedata
+        scals = img.GetPointData().GetScalars()
+        return img, [img, img.GetDimensions(), scals.GetMTime() if scals else 0]
+
     def imagedata(self):
         """Return the underlying ``vtkImagaData`` object."""
         return self._imagedata
@@ -322,7 +382,7 @@ class Volume(vtk.vtkVolume, ActorBase):
                 r, g, b = colors.getColor(col)
                 ctf.AddRGBPoint(smin, r,g,b) # constant color
                 ctf.AddRGBPoint(smax, r,g,b)
-            elif colors._mapscales:
+            elif colors._getMapScales():
                 for x in np.linspace(smin, smax, num=64, endpoint=True):
                     r,g,b = colors.colorMap(x, name=col, vmin=smin, vmax=smax)
                     ctf.AddRGBPoint(x, r, g, b)
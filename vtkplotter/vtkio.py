@@ -1,7 +1,9 @@
 from __future__ import division, print_function
 import vtk
-from vtk.util.numpy_support import vtk_to_numpy
+from vtk.util.numpy_support import vtk_to_numpy, numpy_to_vtk
 import os
+import time
+import shutil
 import numpy as np
 
 import vtkplotter.utils as utils
@@ -35,6 +37,7 @@ __all__ = [
     "exportWindow",
     "importWindow",
     "screenshot",
+    "batchScreenshots",
     "Video",
 ]
 
@@ -1400,6 +1403,201 @@ def screenshot(filename="screenshot.png", scale=None, returnNumpy=False):
         writer.Write()
 
 
+##########################################################
+_farm = dict()  # per-process state of the batchScreenshots() workers
+
+def _farmInit(size, bg, axes):
+    from vtkplotter.plotter import Plotter
+    vp = Plotter(size=size, bg=bg, axes=axes, offscreen=True)
+    w2if = vtk.vtkWindowToImageFilter()
+    w2if.SetInput(vp.window)
+    w2if.SetInputBufferTypeToRGB()
+    w2if.ReadFrontBufferOff()
+    _farm['plotter'] = vp
+    _farm['w2if'] = w2if
+
+def _farmRender(job):
+    i, objs, camera = job
+    t0 = time.time()
+    try:
+        acts = []
+        for ob in objs:
+            if isinstance(ob, str):
+                ob = load(ob)
+            elif isinstance(ob, dict):
+                ob = loadNumpy([ob])
+            if ob is None:
+                raise RuntimeError("could not load object")
+            acts.append(ob)
+        vp = _farm['plotter']
+        vp.clear()
+        if camera is not None:
+            camera = dict(camera) # show() consumes it
+        vp.show(acts, camera=camera, resetcam=True, interactive=False)
+        w2if = _farm['w2if']
+        w2if.Modified()
+        w2if.Update()
+        img = w2if.GetOutput()
+        arr = vtk_to_numpy(img.GetPointData().GetScalars()).copy()
+        return i, arr, img.GetDimensions(), time.time()-t0, None
+    except Exception as e:
+        return i, None, None, time.time()-t0, repr(e)
+
+def _writeImage(arr, dims, filename):
+    # arr is a flat (npixels, ncomponents) array in vtk order (origin at bottom-left)
+    img = vtk.vtkImageData()
+    img.SetDimensions(dims)
+    varr = numpy_to_vtk(arr, deep=False)
+    img.GetPointData().SetScalars(varr)
+    fl = filename.lower()
+    if fl.endswith('.jpg') or fl.endswith('.jpeg'):
+        writer = vtk.vtkJPEGWriter()
+    elif fl.endswith('.bmp'):
+        writer = vtk.vtkBMPWriter()
+    elif fl.endswith('.tif') or fl.endswith('.tiff'):
+        writer = vtk.vtkTIFFWriter()
+    else:
+        writer = vtk.vtkPNGWriter()
+    writer.SetFileName(filename)
+    writer.SetInputData(img)
+    writer.Write()
+
+def _cameraToDict(cam):
+    return dict(pos=cam.GetPosition(),
+                focalPoint=cam.GetFocalPoint(),
+                viewup=cam.GetViewUp(),
+                viewAngle=cam.GetViewAngle(),
+                parallelScale=cam.GetParallelScale())
+
+def batchScreenshots(jobs, size=(400, 400), bg='white', axes=None, workers=None,
+                     chunksize=1, verbose=True):
+    """
+    Render offscreen a (possibly very long) list of scenes and save them to image files.
+
+    Each job is a tuple `(objects, camera, filename)` where `objects` is a ``Mesh``,
+    a ``Volume``, a file name or a list of them, `camera` is ``None`` (automatic),
+    a dictionary as in ``show(camera=...)`` or a ``vtkCamera``.
+
+    A pool of worker processes is started, each holding one offscreen ``Plotter``
+    whose scene is cleared and reused from one job to the next.
+    The rendered images are encoded and written to disk by a separate thread.
+
+    :param list size: size of the rendered images in pixels.
+    :param int workers: number of worker processes. If 0 render in the current process.
+        Default is the number of available cores.
+    :param int chunksize: number of jobs sent to a worker at once.
+    :param bool verbose: print a summary and the list of failed jobs.
+
+    :return: a list with one dictionary per job with keys
+        `filename`, `renderTime`, `writeTime` and `error` (``None`` on success).
+
+    :Example:
+        .. code-block:: python
+
+            from vtkplotter import *
+            import glob
+            jobs = [(f, None, f+'.png') for f in glob.glob(datadir+'*.ply')]
+            report = batchScreenshots(jobs, size=(200,200), workers=4)
+    """
+    import threading
+    try:
+        import queue
+    except ImportError:
+        import Queue as queue  # python2
+
+    t0 = time.time()
+    report = []
+    filenames = []
+    inflight = []  # semaphore bounding the jobs sent to the pool and not collected yet
+    stop = []
+
+    def _serialize():
+        for i, job in enumerate(jobs):
+            if inflight:
+                inflight[0].acquire()
+                if stop:
+                    return
+            objs, camera, filename = job
+            if not utils.isSequence(objs):
+                objs = [objs]
+            if isinstance(camera, vtk.vtkCamera):
+                camera = _cameraToDict(camera)
+            if workers != 0:
+                objs = [ob if isinstance(ob, str) else _np_dump(ob) for ob in objs]
+            filenames.append(filename)
+            report.append(dict(filename=filename, renderTime=None,
+                               writeTime=None, error=None))
+            yield i, objs, camera
+
+    q = queue.Queue(maxsize=64)
+
+    def _writer():
+        while True:
+            item = q.get()
+            if item is None:
+                break
+            i, arr, dims = item
+            tw = time.time()
+            try:
+                _writeImage(arr, dims, filenames[i])
+            except Exception as e:
+                report[i]['error'] = repr(e)
+            report[i]['writeTime'] = time.time()-tw
+
+    wthread = threading.Thread(target=_writer)
+    wthread.daemon = True
+    wthread.start()
+
+    def _collect(results):
+        for i, arr, dims, dt, err in results:
+            if inflight:
+                inflight[0].release()
+            report[i]['renderTime'] = dt
+            if err:
+                report[i]['error'] = err
+            else:
+                q.put((i, arr, dims))
+
+    if workers == 0:
+        save_instance = settings.plotter_instance
+        _farmInit(size, bg, axes)
+        try:
+            _collect(_farmRender(job) for job in _serialize())
+        finally:
+            _farm['plotter'].close()
+            _farm.clear()
+            settings.plotter_instance = save_instance
+    else:
+        import multiprocessing
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        # the serialized meshes are only held for the jobs in flight
+        inflight.append(threading.Semaphore(4 * workers * chunksize))
+        pool = multiprocessing.Pool(workers, initializer=_farmInit,
+                                    initargs=(size, bg, axes))
+        try:
+            _collect(pool.imap(_farmRender, _serialize(), chunksize))
+        except BaseException:
+            stop.append(True)
+            inflight[0].release()  # wake up the pool feeder thread
+            pool.terminate()
+            raise
+        finally:
+            pool.close()
+            pool.join()
+
+    q.put(None)
+    wthread.join()
+
+    if verbose:
+        failed = [r for r in report if r['error']]
+        colors.printc("~camera batchScreenshots():", len(report), "jobs in",
+                      round(time.time()-t0, 2), "s,", len(failed), "failed", c="m")
+        for r in failed:
+            colors.printc("  failed:", r['filename'], r['error'], c=1)
+    return report
+
+
 class Video:
     """
     Class to generate a video from the specified rendering window.
@@ -1407,6 +1605,9 @@ class Video:
     :param str name: name of the output file.
     :param int fps: set the number of frames per second.
     :param float duration: set the total `duration` of the video and recalculates `fps` accordingly.
+    :param str backend: either `'ffmpeg'`, `'opencv'` or `'pipe'`.
+        With `'pipe'` a single ``ffmpeg`` process is opened and raw RGB frames are
+        streamed to its standard input, no intermediate image files are written.
     :param str ffmpeg: set path to ffmpeg program. Default value considers ffmpeg is in the path.
 
     |makeVideo| |makeVideo.py|_
@@ -1417,6 +1618,7 @@ class Video:
                  duration=None,
                  fps=24,
                  backend='ffmpeg',
+                 ffmpeg='ffmpeg',
                 ):
 
         from tempfile import TemporaryDirectory
@@ -1425,28 +1627,98 @@ class Video:
         self.duration = duration
         self.backend = backend
         self.fps = float(fps)
-        self.command = "ffmpeg -loglevel panic -y -r"
+        self.ffmpeg = ffmpeg
+        self.command = ffmpeg + " -loglevel panic -y -r"
 
         self.frames = []
-        self.tmp_dir = TemporaryDirectory()
-        self.get_filename = lambda x: os.path.join(self.tmp_dir.name, x)
+        if backend == 'pipe':
+            self.tmp_dir = None
+            self._process = None  # the ffmpeg subprocess, started at first frame
+            self._w2if = None     # persistent window to image filter
+            self._framesize = None
+            self._lastframe = None
+            self.nframes = 0
+        else:
+            self.tmp_dir = TemporaryDirectory()
+            self.get_filename = lambda x: os.path.join(self.tmp_dir.name, x)
         colors.printc("~video Video", self.name, "is open...", c="m")
 
+    def _grabFrame(self):
+        """Read the current content of the rendering window as a raw rgb24 buffer."""
+        if not settings.plotter_instance or not settings.plotter_instance.window:
+            colors.printc('~bomb Video: rendering window is not present, skip.', c=1)
+            return None
+
+        if self._w2if is None:
+            self._w2if = vtk.vtkWindowToImageFilter()
+            self._w2if.SetInput(settings.plotter_instance.window)
+            self._w2if.SetInputBufferTypeToRGB()
+            self._w2if.ReadFrontBufferOff()  # read from the back buffer
+        self._w2if.Modified()
+        self._w2if.Update()
+
+        img = self._w2if.GetOutput()
+        xdim, ydim, _ = img.GetDimensions()
+        if self._framesize is None:
+            self._framesize = (xdim, ydim)
+            self._startPipe()
+        elif self._framesize != (xdim, ydim):
+            colors.printc("~bomb Video Error: frame size changed from", self._framesize,
+                          "to", (xdim, ydim), c=1)
+            colors.printc("  Window must keep the same size while recording.", c=1)
+            raise RuntimeError()
+        return vtk_to_numpy(img.GetPointData().GetScalars())
+
+    def _startPipe(self):
+        import subprocess
+        w, h = self._framesize
+        cmd = [self.ffmpeg, "-loglevel", "panic", "-y",
+               "-f", "rawvideo", "-pix_fmt", "rgb24",
+               "-s", str(w)+"x"+str(h), "-r", str(self.fps),
+               "-i", "-",
+               "-vf", "vflip",  # vtk images have the origin at the bottom-left
+               self.name]
+        try:
+            self._process = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+        except OSError:
+            colors.printc("~bomb Video Error: could not start", self.ffmpeg, c=1)
+            raise RuntimeError()
+
+    def _writeFrame(self, buf):
+        try:
+            self._process.stdin.write(buf)
+        except (BrokenPipeError, IOError):
+            colors.printc("~bomb Video Error: ffmpeg terminated unexpectedly.", c=1)
+            raise RuntimeError()
+        self.nframes += 1
+
     def addFrame(self):
         """Add frame to current video."""
+        if self.backend == 'pipe':
+            buf = self._grabFrame()
+            if buf is None:
+                return
+            self._lastframe = buf.tobytes()
+            self._writeFrame(self._lastframe)
+            return
         fr = self.get_filename(str(len(self.frames)) + ".png")
         screenshot(fr)
         self.frames.append(fr)
 
     def pause(self, pause=0):
         """Insert a `pause`, in seconds."""
-        fr = self.frames[-1]
         n = int(self.fps * pause)
+        if self.backend == 'pipe':
+            if self._lastframe is None:
+                return
+            for _ in range(n):
+                self._writeFrame(self._lastframe)
+            return
+        fr = self.frames[-1]
         for _ in range(n):
             fr2 = self.get_filename(str(len(self.frames)) + ".png")
             self.frames.append(fr2)
-            os.system("cp -f %s %s" % (fr, fr2))
-
+            shutil.copyfile(fr, fr2)
 
     def action(self, elevation_range=(0,80),
                azimuth_range=(0,359),
@@ -1514,6 +1786,23 @@ class Video:
     def close(self):
         """Render the video and write to file."""
 
+        if self.backend == 'pipe':
+            if self._process is None:
+                colors.printc("Video: no frames were added, nothing to save.", c=1)
+                return
+            if self.duration and abs(self.nframes/float(self.duration)-self.fps) > 0.01:
+                colors.printc("Video: with backend 'pipe' fps is fixed to", self.fps,
+                              "the video lasts", round(self.nframes/self.fps, 3), "s", c="m")
+            self._process.stdin.close()
+            out = self._process.wait()
+            self._process = None
+            self._w2if = None
+            if out:
+                colors.printc("ffmpeg returning error", c=1)
+            else:
+                colors.printc("~save Video saved as", self.name, c="m")
+            return
+
         if self.duration:
             self.fps = len(self.frames) / float(self.duration)
             colors.printc("Recalculated video FPS to", round(self.fps, 3), c="m")